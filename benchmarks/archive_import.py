@@ -0,0 +1,92 @@
+"""
+Benchmark of the imports of .source/.target pairs and folders from zip and tar files.
+
+Writes a synthetic .source/.target pair to a tar file and a folder of text files to a zip file,
+and times their imports read in place from the archives, the first time and once their indexes are
+cached, against the previous way of extracting the archive to a temporary directory on every
+import. The imports of a compressed tar file, extracted once to the cache, are timed too.
+
+Usage:
+    python benchmarks/archive_import.py [-n 200000] [--files 5000]
+"""
+
+import argparse
+import os
+import random
+import tarfile
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+from muse.data_importer import import_data
+
+
+def write_archives(path: Path, n: int, files: int, rng: random.Random):
+    words = ["lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing"]
+    pair = path / "english"
+    pair.mkdir()
+    (pair / "train.source").write_text(
+        "\n".join(" ".join(rng.choices(words, k=200)) for _ in range(n))
+    )
+    (pair / "train.target").write_text(
+        "\n".join(" ".join(rng.choices(words, k=20)) for _ in range(n))
+    )
+    with tarfile.open(path / "pair.tar", "w") as tar:
+        tar.add(pair, arcname="english")
+    with tarfile.open(path / "pair.tar.gz", "w:gz") as tar:
+        tar.add(pair, arcname="english")
+    with zipfile.ZipFile(path / "folder.zip", "w", zipfile.ZIP_DEFLATED) as zip_file:
+        for i in range(files):
+            zip_file.writestr(f"docs/{i:06}.txt", " ".join(rng.choices(words, k=200)))
+
+
+def legacy_import(path: Path, member: str) -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        if zipfile.is_zipfile(path):
+            with zipfile.ZipFile(path) as zip_file:
+                zip_file.extractall(tmp)
+        else:
+            with tarfile.open(path) as tar:
+                tar.extractall(tmp)
+        return len(import_data(os.path.join(tmp, member), "document", "en"))
+
+
+def import_in_place(path: Path, member: str) -> int:
+    return len(import_data(str(path / member), "document", "en"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", type=int, default=200000, help="Number of pair lines")
+    parser.add_argument("--files", type=int, default=5000, help="Files of the folder")
+    parser.add_argument("--seed", type=int, default=0, help="Data seed")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["MUSE_CACHE"] = str(Path(tmp, "cache"))
+        path = Path(tmp)
+        write_archives(path, args.n, args.files, random.Random(args.seed))
+        print(f"{args.n} pair lines, {args.files} files")
+
+        archives = [
+            ("tar pair", path / "pair.tar", "english"),
+            ("tar.gz pair", path / "pair.tar.gz", "english"),
+            ("zip folder", path / "folder.zip", "docs"),
+        ]
+        for name, archive, member in archives:
+            runs = [
+                ("extracted", legacy_import),
+                ("first", import_in_place),
+                ("cached", import_in_place),
+            ]
+            for run, function in runs:
+                start = time.perf_counter()
+                documents = function(archive, member)
+                seconds = time.perf_counter() - start
+                label = f"{name}, {run}"
+                print(f"{label:<24} {seconds:>8.2f} s {documents} documents")
+
+
+if __name__ == "__main__":
+    main()
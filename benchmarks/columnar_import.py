@@ -0,0 +1,87 @@
+"""
+Benchmark of the import of a large parquet file by the ColumnarConnector.
+
+Writes a synthetic parquet file of documents with several metadata columns, and times its import
+by the connector, with all the metadata columns and with only some of them, against the previous
+implementation reading the file with pandas and building the documents row by row.
+
+Usage:
+    python benchmarks/columnar_import.py [-n 200000] [--row-group-size 50000]
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from io import BytesIO
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from muse.data_importer.columnar.columnar_connector import ColumnarConnector
+from muse.data_manager import Document
+
+
+def legacy_import(path: Path) -> list[Document]:
+    with open(path, "rb") as file:
+        df = pd.read_parquet(BytesIO(file.read()))
+    return [
+        Document(
+            row["text"],
+            row.get("summary", None),
+            {k: v for k, v in row.items() if k not in ["text", "summary"]},
+        )
+        for _, row in df.iterrows()
+    ]
+
+
+def _time(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", type=int, default=200000, help="Number of documents")
+    parser.add_argument(
+        "--row-group-size", type=int, default=50000, help="Rows per row group"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Data seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    words = ["lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing"]
+    table = pa.table(
+        {
+            "text": [" ".join(rng.choices(words, k=200)) for _ in range(args.n)],
+            "summary": [" ".join(rng.choices(words, k=20)) for _ in range(args.n)],
+            "id": list(range(args.n)),
+            "source": [rng.choice(["web", "news", "books"]) for _ in range(args.n)],
+            "score": [rng.random() for _ in range(args.n)],
+            "notes": [" ".join(rng.choices(words, k=50)) for _ in range(args.n)],
+        }
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp, "documents.parquet")
+        pq.write_table(table, path, row_group_size=args.row_group_size)
+        print(f"{path.stat().st_size / 2**20:.1f} MB, {args.n} documents")
+
+        runs = [
+            ("legacy (pandas, iterrows)", legacy_import),
+            ("pyarrow", ColumnarConnector({})),
+            ("pyarrow, metadata id", ColumnarConnector({"metadata_columns": ["id"]})),
+        ]
+        for name, run in runs:
+            if isinstance(run, ColumnarConnector):
+                seconds, documents = _time(run.import_data, str(path), "document")
+            else:
+                seconds, documents = _time(run, path)
+            print(f"{name:<28} {seconds:>8.2f} s {len(documents)} documents")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark of the memory and text rendering of the data objects on a synthetic conversation corpus.
+
+Compares the data objects of MuSE, with `__slots__`, interned speakers and cached texts, against
+their previous plain implementation: the memory taken by the corpus once built and once its texts
+are rendered (and cached), and the time of rendering the text of every conversation several times,
+as each evaluation of each summarizer does.
+
+Usage:
+    python benchmarks/data_manager_memory.py [-n 100000] [-u 20] [--renders 4]
+"""
+
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+
+from muse.data_manager import Conversation, TextUnit
+
+
+class LegacyTextUnit:
+    def __init__(self, text: str, speaker: str, metadata: dict | None = None):
+        self.text = text
+        self.speaker = speaker
+        self.metadata = metadata
+
+    def __str__(self):
+        return f"{str(self.speaker)}: {str(self.text)}"
+
+
+class LegacyConversation:
+    def __init__(self, text_units, summary=None, metadata=None):
+        self.text_units = text_units
+        self.summary = summary
+        self.metadata = metadata
+
+    def __str__(self):
+        return "\n".join([str(text_unit) for text_unit in self.text_units])
+
+
+def _build(conversation, text_unit, rows):
+    # The speakers are read from the data as new strings, like the importers do
+    return [
+        conversation([text_unit(text, "".join(speaker)) for speaker, text in units])
+        for units in rows
+    ]
+
+
+def _measure(conversation, text_unit, rows, renders: int):
+    gc.collect()
+    tracemalloc.start()
+    corpus = _build(conversation, text_unit, rows)
+    built, _ = tracemalloc.get_traced_memory()
+    for data in corpus:
+        str(data)
+    rendered, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(renders):
+        for data in corpus:
+            str(data)
+    return built, rendered, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", type=int, default=100000, help="Number of conversations")
+    parser.add_argument("-u", type=int, default=20, help="Text units per conversation")
+    parser.add_argument("--speakers", type=int, default=5, help="Number of speakers")
+    parser.add_argument(
+        "--renders",
+        type=int,
+        default=4,
+        help="Renders of the text of each conversation",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Corpus seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    words = ["lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing"]
+    speakers = [f"Speaker {i}" for i in range(args.speakers)]
+    rows = [
+        [
+            (rng.choice(speakers), " ".join(rng.choices(words, k=rng.randint(3, 30))))
+            for _ in range(args.u)
+        ]
+        for _ in range(args.n)
+    ]
+
+    print(f"{'objects':<8} {'built MB':>9} {'rendered MB':>12} {'render s':>9}")
+    for name, conversation, text_unit in (
+        ("legacy", LegacyConversation, LegacyTextUnit),
+        ("muse", Conversation, TextUnit),
+    ):
+        built, rendered, seconds = _measure(conversation, text_unit, rows, args.renders)
+        print(
+            f"{name:<8} {built / 2**20:>9.1f} {rendered / 2**20:>12.1f} {seconds:>9.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Benchmark of the downloads of `fetcher.download`, from a local HTTP server.
+
+Serves a synthetic file from a local HTTP server and times its download, with the peak memory of the
+download under tracemalloc, against the previous implementation holding the whole response in
+memory. The download is then repeated, revalidating the cached file with its ETag, and resumed
+after an interrupted response.
+
+Usage:
+    python benchmarks/download.py [--size 200]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+import tracemalloc
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+from muse.data_importer import fetcher
+
+
+class Handler(SimpleHTTPRequestHandler):
+    """
+    Serves the files of a directory with an ETag, revalidation and byte ranges.
+    """
+
+    def do_GET(self):
+        path = Path(self.directory, self.path.lstrip("/"))
+        size = path.stat().st_size
+        etag = f'"{size}-{path.stat().st_mtime_ns}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        start = 0
+        if self.headers.get("Range") and self.headers.get("If-Range") == etag:
+            start = int(self.headers["Range"][len("bytes=") : -1])
+            self.send_response(206)
+        else:
+            self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(size - start))
+        self.end_headers()
+        with open(path, "rb") as f:
+            f.seek(start)
+            while chunk := f.read(1 << 20):
+                self.wfile.write(chunk)
+
+    def log_message(self, *args):
+        pass
+
+
+def legacy_download(uri: str, directory: Path) -> str:
+    response = requests.get(uri)
+    file_path = directory / Path(uri).name
+    with open(file_path, "wb") as f:
+        f.write(response.content)
+    return str(file_path)
+
+
+def _measure(function, *args):
+    start = time.perf_counter()
+    tracemalloc.start()
+    result = function(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return time.perf_counter() - start, peak, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=200, help="Size of the file in MB")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["MUSE_CACHE"] = str(Path(tmp, "cache"))
+        served = Path(tmp, "served")
+        served.mkdir()
+        (served / "data.bin").write_bytes(os.urandom(args.size << 20))
+        server = ThreadingHTTPServer(
+            ("127.0.0.1", 0), partial(Handler, directory=str(served))
+        )
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        uri = f"http://127.0.0.1:{server.server_port}/data.bin"
+        print(f"{args.size} MB file")
+
+        legacy = Path(tmp, "legacy")
+        legacy.mkdir()
+        runs = [
+            ("legacy (response.content)", legacy_download, uri, legacy),
+            ("streamed", fetcher.download, uri),
+            ("cached, revalidated", fetcher.download, uri),
+        ]
+        for name, function, *function_args in runs:
+            seconds, peak, _ = _measure(function, *function_args)
+            print(f"{name:<28} {seconds:>8.2f} s {peak / 2**20:>8.1f} MB peak")
+
+        # An interrupted download, half of the file left to resume
+        state = Path(tmp, "cache", "downloads", "uris")
+        state /= hashlib.sha1(uri.encode("utf-8")).hexdigest()
+        Path(f"{state}.json").unlink()
+        with open(served / "data.bin", "rb") as f:
+            Path(f"{state}.part").write_bytes(f.read(args.size << 19))
+        stat = (served / "data.bin").stat()
+        validator = f'"{stat.st_size}-{stat.st_mtime_ns}"'
+        Path(f"{state}.part.json").write_text(json.dumps({"validator": validator}))
+        seconds, peak, _ = _measure(fetcher.download, uri)
+        name = "resumed from the half"
+        print(f"{name:<28} {seconds:>8.2f} s {peak / 2**20:>8.1f} MB peak")
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
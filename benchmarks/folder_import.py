@@ -0,0 +1,113 @@
+"""
+Benchmark of the import of a large folder of text and summary files by the FolderConnector.
+
+Writes a synthetic folder of articles with their summary files, and times its import by the
+connector with one or more reading threads, against the previous implementation matching a regex
+per file against the whole listing and concatenating a data frame per file. The previous
+implementation is quadratic in the number of files, so it is only run on the first files.
+
+Usage:
+    python benchmarks/folder_import.py [-n 200000] [--workers 1 8] [--legacy 5000]
+"""
+
+import argparse
+import os
+import random
+import re
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from muse.data_importer.folder.folder_connector import FolderConnector
+from muse.data_manager import Document
+
+
+def legacy_import(path: Path) -> list[Document]:
+    df = pd.DataFrame()
+    files = os.listdir(path)
+    for identifier in [f for f in files if "_summary" not in f]:
+        stem = identifier.rsplit(".", 1)[0]
+        summary = rf"{re.escape(stem)}{re.escape('_summary')}.*"
+        summary_data = None
+        if any([re.match(summary, f) for f in files]):
+            summary = [f for f in files if re.match(summary, f)][0]
+            with open(path / summary, "r") as file:
+                summary_data = file.read()
+        with open(path / identifier, "r") as file:
+            text_data = [file.read()]
+        frame = pd.DataFrame(
+            {"id": [identifier], "text": text_data, "summary": [summary_data]}
+        )
+        df = pd.concat([df, frame])
+
+    documents = []
+    for _, group in df.groupby("id"):
+        group = group.to_dict(orient="list")
+        documents.append(
+            Document(group["text"][0], group["summary"][0], {"id": group["id"][0]})
+        )
+    return documents
+
+
+def write_folder(path: Path, n: int, rng: random.Random):
+    words = ["lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing"]
+    path.mkdir()
+    for i in range(n):
+        (path / f"article{i:07d}.txt").write_text(" ".join(rng.choices(words, k=300)))
+        (path / f"article{i:07d}_summary.txt").write_text(
+            " ".join(rng.choices(words, k=30))
+        )
+
+
+def _time(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", type=int, default=200000, help="Number of articles")
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=[1, 8], help="Reading threads"
+    )
+    parser.add_argument(
+        "--legacy",
+        type=int,
+        default=5000,
+        help="Number of articles imported by the previous implementation",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Data seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp, "articles")
+        write_folder(path, args.n, rng)
+        print(f"{args.n} articles, {2 * args.n} files")
+
+        for workers in args.workers:
+            connector = FolderConnector({"workers": workers})
+            seconds, documents = _time(connector.import_data, str(path), "document")
+            name = f"workers {workers}"
+            print(f"{name:<28} {seconds:>8.2f} s {len(documents)} documents")
+
+        if args.legacy:
+            legacy = Path(tmp, "legacy")
+            write_folder(legacy, min(args.legacy, args.n), rng)
+            runs = [
+                ("legacy (regex, pd.concat)", legacy_import, legacy),
+                ("workers 1, same articles", FolderConnector({"workers": 1}), legacy),
+            ]
+            for name, run, folder in runs:
+                if isinstance(run, FolderConnector):
+                    seconds, documents = _time(run.import_data, str(folder), "document")
+                else:
+                    seconds, documents = _time(run, folder)
+                print(f"{name:<28} {seconds:>8.2f} s {len(documents)} documents")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark of the cold startup time of MuSE.
+
+Each scenario runs in a fresh interpreter, so nothing is shared between runs, and reports the wall
+time along with the heavy third-party modules that were imported.
+
+Usage:
+    python benchmarks/import_time.py [-r RUNS]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+HEAVY_MODULES = [
+    "torch",
+    "transformers",
+    "spacy",
+    "sentence_transformers",
+    "bert_score",
+    "ollama",
+    "nltk",
+    "sumy",
+]
+
+SCENARIOS = {
+    "import muse": ["-c", "import muse"],
+    "muse --help": ["-m", "muse", "--help"],
+    "resolve sumy + rougemetric": [
+        "-c",
+        "from muse.summarizer.resolver import get_available_summarizers\n"
+        "from muse.evaluation.resolver import resolve_evaluator\n"
+        "get_available_summarizers()\n"
+        "resolve_evaluator('rouge')",
+    ],
+}
+
+_LOADED = (
+    "\nimport sys\n"
+    f"print('LOADED', ','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+)
+
+
+def _run(args: list[str]) -> tuple[float, list[str]]:
+    if args[0] == "-c":
+        args = ["-c", args[1] + _LOADED]
+        loaded_from_output = True
+    else:
+        loaded_from_output = False
+
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, check=True
+    )
+    elapsed = time.perf_counter() - start
+
+    loaded = []
+    if loaded_from_output:
+        for line in result.stdout.splitlines():
+            if line.startswith("LOADED "):
+                loaded = [m for m in line[len("LOADED ") :].split(",") if m]
+    return elapsed, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-r", "--runs", type=int, default=5, help="Runs per scenario")
+    args = parser.parse_args()
+
+    print(f"{'scenario':<30} {'median (s)':>10} {'min (s)':>10}  heavy modules")
+    for name, scenario in SCENARIOS.items():
+        times = []
+        loaded = []
+        for _ in range(args.runs):
+            elapsed, loaded = _run(scenario)
+            times.append(elapsed)
+        print(
+            f"{name:<30} {statistics.median(times):>10.3f} {min(times):>10.3f}  "
+            f"{', '.join(loaded) or '-'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark of the import of a folder of small JSON documents by the FolderConnector.
+
+Writes a synthetic folder with a JSON file per document, and times its import by the connector with
+one or more reading threads, with orjson when it is installed and with the json module, against
+the previous implementation reading every file first and parsing each of them twice with the json
+module. The threads overlap the reads of the files, so they only help with more than one cpu.
+
+Usage:
+    python benchmarks/json_folder_import.py [-n 100000] [--workers 1 8]
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from muse.data_importer.folder.folder_connector import FolderConnector
+from muse.data_importer.json import json_connector
+from muse.data_importer.json.json_connector import JSONConnector
+from muse.data_manager import Document
+
+
+def legacy_import(path: Path) -> list[Document]:
+    files = []
+    for file in os.listdir(path):
+        with open(path / file, "r") as f:
+            files.append(f.read())
+
+    for file in files:
+        json.loads(file)
+    c = JSONConnector()
+    return [c._load_single(json.loads(file), "document") for file in files]
+
+
+def write_folder(path: Path, n: int, rng: random.Random):
+    words = ["lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing"]
+    path.mkdir()
+    for i in range(n):
+        document = {
+            "text": " ".join(rng.choices(words, k=100)),
+            "summary": " ".join(rng.choices(words, k=15)),
+            "meta": {"id": i, "source": rng.choice(["web", "news", "books"])},
+        }
+        (path / f"{i:07d}.json").write_text(json.dumps(document))
+
+
+def _time(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", type=int, default=100000, help="Number of documents")
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=[1, 8], help="Reading threads"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Data seed")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp, "documents")
+        write_folder(path, args.n, random.Random(args.seed))
+        print(f"{args.n} JSON documents")
+
+        seconds, documents = _time(legacy_import, path)
+        name = "legacy (parsed twice)"
+        print(f"{name:<28} {seconds:>8.2f} s {len(documents)} documents")
+
+        orjson = json_connector.orjson
+        decoders = [("orjson", orjson), ("json", None)] if orjson else [("json", None)]
+        for decoder, module in decoders:
+            json_connector.orjson = module
+            for workers in args.workers:
+                connector = FolderConnector({"workers": workers})
+                seconds, documents = _time(connector.import_data, str(path), "document")
+                name = f"{decoder}, workers {workers}"
+                print(f"{name:<28} {seconds:>8.2f} s {len(documents)} documents")
+        json_connector.orjson = orjson
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark of the streaming import of large JSON and JSON Lines files by the JSONConnector.
+
+Writes a synthetic JSON file with its documents in a top-level "data" array, and the same documents
+as a JSON Lines file, and iterates over the documents of each of them with the connector, against
+the previous implementation loading the whole JSON file before creating the documents. Each import
+is timed, then run again under tracemalloc for its peak memory.
+
+Usage:
+    python benchmarks/json_import.py [-n 300000]
+"""
+
+import argparse
+import json
+import random
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from muse.data_importer.json.json_connector import JSONConnector
+
+
+def legacy_import(path: Path) -> int:
+    with open(path, "r") as file:
+        data = json.load(file)
+    data = data.get("data", data)
+    return sum(1 for _ in JSONConnector._iter_documents(data))
+
+
+def stream_import(path: Path) -> int:
+    return sum(1 for _ in JSONConnector().iter_data(str(path), "document"))
+
+
+def write_files(path: Path, n: int, rng: random.Random) -> tuple[Path, Path]:
+    words = ["lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing"]
+    documents = (
+        {
+            "text": " ".join(rng.choices(words, k=100)),
+            "summary": " ".join(rng.choices(words, k=15)),
+            "meta": {"id": i},
+        }
+        for i in range(n)
+    )
+    json_path, lines_path = path / "documents.json", path / "documents.jsonl"
+    with open(json_path, "w") as json_file, open(lines_path, "w") as lines_file:
+        json_file.write('{"version": 1, "data": [')
+        for i, document in enumerate(documents):
+            line = json.dumps(document)
+            json_file.write(f", {line}" if i else line)
+            lines_file.write(f"{line}\n")
+        json_file.write("]}")
+    return json_path, lines_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", type=int, default=300000, help="Number of documents")
+    parser.add_argument("--seed", type=int, default=0, help="Data seed")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path, lines_path = write_files(Path(tmp), args.n, random.Random(args.seed))
+        print(f"{json_path.stat().st_size / 2**20:.1f} MB, {args.n} documents")
+
+        runs = [
+            ("legacy (json.load)", legacy_import, json_path),
+            ("stream, JSON", stream_import, json_path),
+            ("stream, JSON Lines", stream_import, lines_path),
+        ]
+        for name, run, path in runs:
+            start = time.perf_counter()
+            documents = run(path)
+            seconds = time.perf_counter() - start
+
+            tracemalloc.start()
+            run(path)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(
+                f"{name:<20} {seconds:>8.2f} s {peak / 2**20:>8.1f} MB peak "
+                f"{documents} documents"
+            )
+
+
+if __name__ == "__main__":
+    main()
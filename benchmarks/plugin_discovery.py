@@ -0,0 +1,111 @@
+"""
+Benchmark of the plugin discovery, with and without the discovery cache.
+
+A temporary MUSE_PLUGINS directory is filled with synthetic summarizer plugins, each importing a
+module that takes some time to import, as real plugins usually do. Every scenario runs in a fresh
+interpreter, and reports the time taken to list the available summarizers.
+
+Usage:
+    python benchmarks/plugin_discovery.py [-n PLUGINS] [-r RUNS] [--import-cost SECONDS]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PLUGIN = """
+import time
+
+from muse.summarizer import Summarizer
+
+time.sleep({import_cost})
+
+
+class Plugin{index}(Summarizer):
+    def __init__(self, options):
+        pass
+
+    def summarize(self, texts):
+        return ["" for _ in texts]
+"""
+
+LIST = (
+    "import json\n"
+    "from muse.summarizer.resolver import get_available_summarizers\n"
+    "from muse.utils.plugins import get_plugin_discovery_report\n"
+    "get_available_summarizers()\n"
+    "print(json.dumps(get_plugin_discovery_report()))\n"
+)
+
+
+def _run(env: dict[str, str]) -> tuple[float, list[dict[str, any]]]:
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", LIST],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed = time.perf_counter() - start
+    return elapsed, json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", "--plugins", type=int, default=50, help="Plugin files")
+    parser.add_argument("-r", "--runs", type=int, default=3, help="Runs per scenario")
+    parser.add_argument(
+        "--import-cost",
+        type=float,
+        default=0.02,
+        help="Seconds each plugin takes to execute",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        summarizers = Path(tmp_dir, "plugins", "summarizer")
+        summarizers.mkdir(parents=True)
+        for i in range(args.plugins):
+            (summarizers / f"plugin_{i}.py").write_text(
+                PLUGIN.format(index=i, import_cost=args.import_cost)
+            )
+
+        cache = Path(tmp_dir, "cache")
+        env = {
+            **os.environ,
+            "MUSE_PLUGINS": str(Path(tmp_dir, "plugins")),
+            "MUSE_CACHE": str(cache),
+        }
+
+        scenarios = {"cold (no cache)": [], "warm (cached)": []}
+        reports = {}
+        for _ in range(args.runs):
+            (cache / "plugins.json").unlink(missing_ok=True)
+            elapsed, reports["cold (no cache)"] = _run(env)
+            scenarios["cold (no cache)"].append(elapsed)
+            elapsed, reports["warm (cached)"] = _run(env)
+            scenarios["warm (cached)"].append(elapsed)
+
+    print(f"{args.plugins} plugins, {args.import_cost}s to execute each")
+    print(f"{'scenario':<20} {'median (s)':>10} {'discovery (s)':>14}  statuses")
+    for name, times in scenarios.items():
+        report = reports[name]
+        statuses = {}
+        for entry in report:
+            statuses[entry["status"]] = statuses.get(entry["status"], 0) + 1
+        print(
+            f"{name:<20} {statistics.median(times):>10.3f} "
+            f"{sum(entry['seconds'] for entry in report):>14.3f}  "
+            f"{', '.join(f'{k}: {v}' for k, v in statuses.items())}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark of the selection options of the builtin importers, on a parquet file and a .source/.target
+pair.
+
+Writes a synthetic parquet file with small row groups and the same documents as a .source/.target
+pair, and times the import of all their documents, of a sample of them, of a shard and of the first
+documents, with the selection options applied as the files are read, against the previous way of
+importing all the documents and selecting them afterwards.
+
+Usage:
+    python benchmarks/selection_import.py [-n 200000] [--fraction 0.01] [--row-group 1000]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from muse.data_importer.columnar.columnar_connector import ColumnarConnector
+from muse.data_importer.selection import Selection
+from muse.data_importer.source_target.source_target_connector import (
+    SourceTargetConnector,
+)
+
+
+def write_files(path: Path, n: int, row_group: int, rng: random.Random):
+    words = ["lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing"]
+    texts = [" ".join(rng.choices(words, k=200)) for _ in range(n)]
+    summaries = [" ".join(rng.choices(words, k=20)) for _ in range(n)]
+    table = pa.table({"text": texts, "summary": summaries, "id": list(range(n))})
+    pq.write_table(table, path / "data.parquet", row_group_size=row_group)
+    (path / "train.source").write_text("\n".join(texts))
+    (path / "train.target").write_text("\n".join(summaries))
+
+
+def import_after(connector, path: Path, options: dict) -> int:
+    documents = connector().iter_data(str(path), "document")
+    return sum(1 for _ in Selection(options).select(documents))
+
+
+def import_selected(connector, path: Path, options: dict) -> int:
+    return sum(1 for _ in connector(options).iter_data(str(path), "document"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", type=int, default=200000, help="Number of documents")
+    parser.add_argument(
+        "--fraction", type=float, default=0.01, help="Fraction of the sample"
+    )
+    parser.add_argument(
+        "--row-group", type=int, default=1000, help="Rows per parquet row group"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Data seed")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["MUSE_CACHE"] = str(Path(tmp, "cache"))
+        path = Path(tmp, "data")
+        path.mkdir()
+        write_files(path, args.n, args.row_group, random.Random(args.seed))
+        print(f"{args.n} documents")
+
+        selections = [
+            ("all", {}),
+            (f"sample {args.fraction}", {"sample_fraction": args.fraction}),
+            ("shard 1/100", {"num_shards": 100, "shard_index": 1}),
+            ("limit 1000", {"limit": 1000}),
+        ]
+        files = [
+            ("parquet", ColumnarConnector, path / "data.parquet"),
+            ("source/target", SourceTargetConnector, path / "train.source"),
+        ]
+        # The line indexes are built once, before the timings
+        import_selected(SourceTargetConnector, path / "train.source", {"limit": 1})
+        for file, connector, file_path in files:
+            for name, options in selections:
+                for run, method in [("after", import_after), ("read", import_selected)]:
+                    start = time.perf_counter()
+                    documents = method(connector, file_path, options)
+                    seconds = time.perf_counter() - start
+                    label = f"{file}, {name}, {run}"
+                    print(f"{label:<36} {seconds:>8.2f} s {documents} documents")
+
+
+if __name__ == "__main__":
+    main()
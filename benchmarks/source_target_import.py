@@ -0,0 +1,98 @@
+"""
+Benchmark of the import of a large .source/.target pair by the SourceTargetConnector.
+
+Writes a synthetic pair of files, one article and its summary per line, and iterates over its
+documents with the connector, building the line indexes of the files and then with the indexes
+persisted, against the previous implementation reading both files whole and splitting them. Each
+import is timed, then run again under tracemalloc for its peak memory. The time of reading random
+documents through the indexes, as sampling does, is also reported.
+
+Usage:
+    python benchmarks/source_target_import.py [-n 200000] [--samples 1000]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from muse.data_importer.source_target.line_index import LineIndex
+from muse.data_importer.source_target.source_target_connector import (
+    SourceTargetConnector,
+)
+from muse.data_manager import Document
+
+
+def legacy_import(path: Path) -> int:
+    with open(path / "train.source", "r") as s, open(path / "train.target", "r") as t:
+        sources = s.read().split("\n")
+        targets = t.read().split("\n")
+    assert len(sources) == len(targets)
+    documents = (Document(s, t) for s, t in zip(sources, targets))
+    return sum(1 for _ in documents)
+
+
+def indexed_import(path: Path) -> int:
+    return sum(1 for _ in SourceTargetConnector().iter_data(str(path), "document"))
+
+
+def write_pair(path: Path, n: int, rng: random.Random):
+    words = ["lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing"]
+    with open(path / "train.source", "w") as s, open(path / "train.target", "w") as t:
+        for i in range(n):
+            end = "\n" if i < n - 1 else ""
+            s.write(" ".join(rng.choices(words, k=200)) + end)
+            t.write(" ".join(rng.choices(words, k=20)) + end)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", type=int, default=200000, help="Number of documents")
+    parser.add_argument(
+        "--samples", type=int, default=1000, help="Number of random documents read"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Data seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["MUSE_CACHE"] = str(Path(tmp, "cache"))
+        path = Path(tmp, "data")
+        path.mkdir()
+        write_pair(path, args.n, rng)
+        size = (path / "train.source").stat().st_size
+        print(f"{size / 2**20:.1f} MB of sources, {args.n} documents")
+
+        runs = [
+            ("legacy (read, split)", legacy_import),
+            ("indexed, building", indexed_import),
+            ("indexed, persisted", indexed_import),
+        ]
+        for name, run in runs:
+            start = time.perf_counter()
+            documents = run(path)
+            seconds = time.perf_counter() - start
+
+            tracemalloc.start()
+            run(path)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(
+                f"{name:<22} {seconds:>8.2f} s {peak / 2**20:>8.1f} MB peak "
+                f"{documents} documents"
+            )
+
+        start = time.perf_counter()
+        with LineIndex(path / "train.source") as index:
+            for i in rng.sample(range(len(index)), min(args.samples, len(index))):
+                index[i]
+        seconds = time.perf_counter() - start
+        name = f"{args.samples} random documents"
+        print(f"{name:<22} {seconds:>8.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark of the documents per second of the Spacy summarizer.
+
+Compares the previous implementation (the full pipeline, one document at a time, with per-word
+normalization and stopword list lookups) against the current one, one document at a time and
+through `nlp.pipe` with increasing numbers of processes, on a synthetic corpus of skewed lengths.
+
+Usage:
+    python benchmarks/spacy_throughput.py [-n DOCUMENTS] [-p 1 -p 2 -p 4] [--batch-size 64]
+"""
+
+import argparse
+import time
+from collections import Counter
+from heapq import nlargest
+from string import punctuation
+
+import spacy
+from spacy.lang.en.stop_words import STOP_WORDS
+from summarizer_throughput import synthetic_corpus
+
+from muse.summarizer import Spacy
+
+
+def legacy_summarize(nlp, text) -> str:
+    # The implementation before the corpus level path, kept as the baseline
+    doc = nlp(str(text))
+    keyword = []
+    stopwords = list(STOP_WORDS)
+    pos_tag = ["PROPN", "ADJ", "NOUN", "VERB"]
+    for token in doc:
+        if token.text in stopwords or token.text in punctuation:
+            continue
+        if token.pos_ in pos_tag:
+            keyword.append(token.text)
+    word_freq = Counter(keyword)
+    for word in word_freq.keys():
+        word_freq[word] = word_freq[word] / max(word_freq.values())
+    sent_strength = {}
+    for sent in doc.sents:
+        for word in sent:
+            if word.text in word_freq.keys():
+                if sent in sent_strength.keys():
+                    sent_strength[sent] += word_freq[word.text]
+                else:
+                    sent_strength[sent] = word_freq[word.text]
+    return " ".join(s.text for s in nlargest(3, sent_strength, key=sent_strength.get))
+
+
+def _time(name: str, corpus, summarize):
+    start = time.perf_counter()
+    summaries = summarize(corpus)
+    elapsed = time.perf_counter() - start
+    assert len(summaries) == len(corpus)
+    print(f"{name:<36} {len(corpus):>6} {elapsed:>8.2f} {len(corpus) / elapsed:>8.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", "--documents", type=int, default=500, help="Documents")
+    parser.add_argument(
+        "-p",
+        "--processes",
+        type=int,
+        action="append",
+        help="Numbers of processes of nlp.pipe to compare, defaults to 1 and 2",
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=64, help="nlp.pipe batch size"
+    )
+    parser.add_argument("--language", default="en_core_web_sm", help="Spacy model")
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic corpus seed")
+    args = parser.parse_args()
+
+    corpus = synthetic_corpus(args.documents, args.seed)
+    print(f"{'implementation':<36} {'docs':>6} {'s':>8} {'docs/s':>8}")
+
+    nlp = spacy.load(args.language)
+    _time("legacy", corpus, lambda c: [legacy_summarize(nlp, t) for t in c])
+
+    options = {"language_spacy": args.language, "batch_size": args.batch_size}
+    summarizer = Spacy(options)
+    _time(
+        "per document", corpus, lambda c: [summarizer._summarize_single(t) for t in c]
+    )
+    for processes in args.processes or [1, 2]:
+        summarizer = Spacy({**options, "n_process": processes})
+        _time(f"nlp.pipe, {processes} process(es)", corpus, summarizer.summarize)
+
+
+if __name__ == "__main__":
+    main()
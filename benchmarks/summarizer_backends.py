@@ -0,0 +1,71 @@
+"""
+Benchmark of the onnx backend of the sequence-to-sequence summarizers against the eager torch one.
+
+For each backend the summarizer is loaded and timed on the same fixed sample. The onnx backend is
+loaded twice: first into an empty models directory, which includes exporting the model, then from
+the exported graphs. The summaries of the onnx backend are compared to the torch ones.
+
+Usage:
+    python benchmarks/summarizer_backends.py -s mt5 [-d DATA] [-n SAMPLE] [--device cpu]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from muse.data_importer import import_data
+from muse.summarizer.resolver import resolve_summarizer
+
+DATA = Path(__file__).parent.parent / "tests" / "test_integration_con_sum" / "xlsum"
+
+
+def _run(summarizer_name: str, options: dict[str, any], documents) -> dict[str, any]:
+    start = time.perf_counter()
+    summarizer = resolve_summarizer(summarizer_name, options)
+    load = time.perf_counter() - start
+
+    start = time.perf_counter()
+    summaries = summarizer.summarize(documents)
+    return {
+        "load": load,
+        "seconds": time.perf_counter() - start,
+        "summaries": summaries,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-s", "--summarizer", required=True, help="The summarizer")
+    parser.add_argument("-d", "--data", default=str(DATA), help="The data to sample")
+    parser.add_argument("-n", "--sample", type=int, default=20, help="Sample size")
+    parser.add_argument("--device", help="The device to use")
+    args = parser.parse_args()
+
+    documents = import_data(args.data, "document", "en")
+    documents = [doc for doc in documents if doc.text != ""][: args.sample]
+    options = {"device": args.device} if args.device else {}
+
+    results = {"torch": _run(args.summarizer, options, documents)}
+    with tempfile.TemporaryDirectory() as models_dir:
+        os.environ["MUSE_MODELS"] = models_dir
+        onnx_options = {**options, "backend": "onnx"}
+        results["onnx (export)"] = _run(args.summarizer, onnx_options, documents)
+        results["onnx (cached)"] = _run(args.summarizer, onnx_options, documents)
+
+    baseline = results["torch"]
+    print(f"{args.summarizer} on {len(documents)} documents of {args.data}")
+    print(f"{'backend':<16} {'load s':>7} {'s/doc':>7} {'speed-up':>8} {'same':>7}")
+    for backend, result in results.items():
+        same = sum(a == b for a, b in zip(result["summaries"], baseline["summaries"]))
+        print(
+            f"{backend:<16} {result['load']:>7.1f} "
+            f"{result['seconds'] / len(documents):>7.2f} "
+            f"{baseline['seconds'] / result['seconds']:>7.2f}x "
+            f"{same:>3}/{len(documents):<3}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Benchmark of the precision modes of the transformer summarizers.
+
+Each precision is run in a fresh interpreter on the same fixed sample, reporting the resident memory
+after loading the model, the peak resident memory, the load time and the time to summarize the
+sample. The summaries are then scored with ROUGE against the reference summaries, and compared to
+the fp32 scores.
+
+Usage:
+    python benchmarks/summarizer_precision.py -s mt5 [-d DATA] [-n SAMPLE] [--device cpu]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from muse.summarizer.abstractive.precision import PRECISIONS
+
+DATA = Path(__file__).parent.parent / "tests" / "test_integration_con_sum" / "xlsum"
+
+
+def _memory_mb() -> tuple[float, float]:
+    # Current and peak resident memory, from /proc on linux
+    memory = {}
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(("VmRSS:", "VmHWM:")):
+                key, value, _ = line.split()
+                memory[key] = int(value) / 1024
+    return memory["VmRSS:"], memory["VmHWM:"]
+
+
+def _sample(data: str, size: int):
+    from muse.data_importer import import_data
+
+    documents = import_data(data, "document", "en")
+    return [doc for doc in documents if doc.text != ""][:size]
+
+
+def worker(args: argparse.Namespace):
+    from muse.summarizer.resolver import resolve_summarizer
+
+    documents = _sample(args.data, args.sample)
+    base_rss, _ = _memory_mb()
+
+    start = time.perf_counter()
+    options = {"precision": args.worker}
+    if args.device:
+        options["device"] = args.device
+    summarizer = resolve_summarizer(args.summarizer, options)
+    load = time.perf_counter() - start
+    model_rss, _ = _memory_mb()
+
+    start = time.perf_counter()
+    summaries = summarizer.summarize(documents)
+    elapsed = time.perf_counter() - start
+    _, peak_rss = _memory_mb()
+
+    print(
+        json.dumps(
+            {
+                "load": load,
+                "seconds": elapsed,
+                "model_mb": model_rss - base_rss,
+                "peak_mb": peak_rss,
+                "summaries": summaries,
+            }
+        )
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-s", "--summarizer", required=True, help="The summarizer")
+    parser.add_argument("-d", "--data", default=str(DATA), help="The data to sample")
+    parser.add_argument("-n", "--sample", type=int, default=20, help="Sample size")
+    parser.add_argument("--device", help="The device to use")
+    parser.add_argument(
+        "-p",
+        "--precision",
+        action="append",
+        choices=PRECISIONS,
+        help="The precisions to compare, defaults to all",
+    )
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        worker(args)
+        return
+
+    from muse.evaluation.resolver import resolve_evaluator
+
+    references = [doc.summary for doc in _sample(args.data, args.sample)]
+    rouge = resolve_evaluator("rouge", {"avg": True})
+
+    precisions = args.precision or PRECISIONS
+    if "fp32" not in precisions:
+        precisions = ["fp32", *precisions]
+
+    results = {}
+    for precision in precisions:
+        command = [sys.executable, __file__, "-s", args.summarizer, "--worker"]
+        command += [precision, "-d", args.data, "-n", str(args.sample)]
+        if args.device:
+            command += ["--device", args.device]
+        output = subprocess.run(command, capture_output=True, text=True, check=True)
+        result = json.loads(output.stdout.strip().splitlines()[-1])
+        scores = rouge.evaluate(result["summaries"], reference_summary=references)
+        result["rouge-l"] = scores["rouge_score"]["rouge-l"]["f"]
+        results[precision] = result
+
+    baseline = results["fp32"]
+    print(f"{args.summarizer} on {len(references)} documents of {args.data}")
+    print(
+        f"{'precision':<14} {'model MB':>9} {'peak MB':>9} {'load s':>7} "
+        f"{'s/doc':>7} {'speed-up':>8} {'ROUGE-L':>8} {'delta':>8}"
+    )
+    for precision, result in results.items():
+        print(
+            f"{precision:<14} {result['model_mb']:>9.0f} {result['peak_mb']:>9.0f} "
+            f"{result['load']:>7.1f} {result['seconds'] / len(references):>7.2f} "
+            f"{baseline['seconds'] / result['seconds']:>7.2f}x "
+            f"{result['rouge-l']:>8.4f} {result['rouge-l'] - baseline['rouge-l']:>+8.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
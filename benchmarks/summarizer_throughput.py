@@ -0,0 +1,97 @@
+"""
+Benchmark of the throughput of a summarizer under different options.
+
+Each configuration of the summarizer is loaded once, then timed on every corpus: the example data
+shipped with MuSE and a synthetic corpus of documents of skewed lengths.
+
+Usage:
+    python benchmarks/summarizer_throughput.py -s mt5 -c '{"batch_size": 1}' -c '{"batch_size": 16}'
+    python benchmarks/summarizer_throughput.py -s spacy -n 1000
+"""
+
+import argparse
+import json
+import random
+import re
+import time
+from pathlib import Path
+
+from muse.data_importer import import_data
+from muse.data_manager import Document
+from muse.summarizer.resolver import resolve_summarizer
+
+EXAMPLE_DATA = Path(__file__).parent.parent / "example_data" / "simpleexample"
+
+
+def synthetic_corpus(size: int, seed: int = 0) -> list[Document]:
+    """
+    Build a corpus of documents of skewed lengths, from the sentences of the example data.
+
+    Most documents are short, with a long tail of documents of hundreds of sentences.
+
+    :param size: The number of documents.
+    :param seed: The seed of the random generator.
+    :return: The documents.
+    """
+    rng = random.Random(seed)
+    text = " ".join(p.read_text() for p in sorted(EXAMPLE_DATA.glob("*.txt")))
+    sentences = [s for s in re.split(r"(?<=[.!?])\s+", text) if len(s.split()) > 3]
+
+    corpus = []
+    for _ in range(size):
+        length = min(400, max(1, int(rng.lognormvariate(1.5, 1.0))))
+        document = " ".join(rng.choice(sentences) for _ in range(length))
+        corpus.append(Document(document, rng.choice(sentences)))
+    return corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-s", "--summarizer", required=True, help="The summarizer")
+    parser.add_argument(
+        "-c",
+        "--config",
+        action="append",
+        help="JSON options of a configuration to compare, may be repeated",
+    )
+    parser.add_argument(
+        "-d",
+        "--data",
+        action="append",
+        default=[str(EXAMPLE_DATA)],
+        help="Extra data to benchmark on, as given to muse -d",
+    )
+    parser.add_argument("-t", "--type", default="document", help="The data type")
+    parser.add_argument(
+        "-n", "--synthetic", type=int, default=200, help="Synthetic documents"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic corpus seed")
+    args = parser.parse_args()
+
+    corpora = {data: import_data(data, args.type, "en") for data in args.data}
+    if args.synthetic:
+        corpora[f"synthetic ({args.synthetic})"] = synthetic_corpus(
+            args.synthetic, args.seed
+        )
+
+    print(f"{'configuration':<40} {'corpus':<40} {'docs':>6} {'s':>8} {'docs/s':>8}")
+    for config in args.config or ["{}"]:
+        start = time.perf_counter()
+        summarizer = resolve_summarizer(args.summarizer, json.loads(config))
+        print(
+            f"{config:<40} {'(load)':<40} {'':>6} {time.perf_counter() - start:>8.2f}"
+        )
+
+        for name, corpus in corpora.items():
+            start = time.perf_counter()
+            summaries = summarizer.summarize(corpus)
+            elapsed = time.perf_counter() - start
+            assert len(summaries) == len(corpus)
+            print(
+                f"{config:<40} {Path(name).name:<40} {len(corpus):>6} "
+                f"{elapsed:>8.2f} {len(corpus) / elapsed:>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark of the documents per second of a summarizer with an increasing number of worker processes.
+
+Runs the summarizer over a synthetic corpus of skewed lengths, in this process and then with each
+number of workers, as `muse --workers N` does, and checks the summaries are the same.
+
+Usage:
+    python benchmarks/summarizer_workers.py -s sumy [-w 2 -w 4 -w 8] [-n 2000]
+"""
+
+import argparse
+import json
+import os
+import time
+
+from summarizer_throughput import synthetic_corpus
+
+from muse.summarizer.parallel import summarize_parallel
+from muse.summarizer.resolver import resolve_summarizer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-s", "--summarizer", required=True, help="The summarizer")
+    parser.add_argument("-c", "--config", default="{}", help="JSON summarizer options")
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        action="append",
+        help="Numbers of workers to compare, defaults to powers of two up to the cpus",
+    )
+    parser.add_argument("-n", "--documents", type=int, default=2000, help="Documents")
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic corpus seed")
+    args = parser.parse_args()
+
+    options = json.loads(args.config)
+    corpus = synthetic_corpus(args.documents, args.seed)
+    workers = args.workers or [
+        2**i for i in range(1, (os.cpu_count() or 1).bit_length())
+    ]
+
+    start = time.perf_counter()
+    expected = resolve_summarizer(args.summarizer, options).summarize(corpus)
+    serial = time.perf_counter() - start
+
+    print(f"{'workers':>7} {'s':>8} {'docs/s':>8} {'speed-up':>8} same")
+    print(f"{'-':>7} {serial:>8.2f} {len(corpus) / serial:>8.1f} {1:>7.2f}x True")
+    for count in workers:
+        start = time.perf_counter()
+        summaries = summarize_parallel(args.summarizer, options, corpus, count)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{count:>7} {elapsed:>8.2f} {len(corpus) / elapsed:>8.1f} "
+            f"{serial / elapsed:>7.2f}x {summaries == expected}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark of the LSA step of the Sumy summarizer on documents of increasing length.
+
+Times the dense LSA summarizer of sumy against the sparse one used by MuSE on the same parsed
+documents, built from the sentences of the example data, and checks they extract the same sentences.
+
+Usage:
+    python benchmarks/sumy_lsa.py [-l 10 -l 100 -l 1000] [--ratio 1.0]
+"""
+
+import argparse
+import random
+import re
+import time
+from pathlib import Path
+
+from sumy.nlp.tokenizers import Tokenizer
+from sumy.parsers.plaintext import PlaintextParser
+from sumy.summarizers.lsa import LsaSummarizer
+
+from muse.summarizer.extractive.sumy_connector import SparseLsaSummarizer
+
+EXAMPLE_DATA = Path(__file__).parent.parent / "example_data" / "simpleexample"
+
+
+def _time(summarizer, document, sentences: int):
+    start = time.perf_counter()
+    summary = summarizer(document, sentences)
+    return time.perf_counter() - start, summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "-l",
+        "--lengths",
+        type=int,
+        action="append",
+        help="Document lengths in sentences, defaults to 10, 100 and 1000",
+    )
+    parser.add_argument("-s", "--sentences", type=int, default=3, help="Summary length")
+    parser.add_argument(
+        "--ratio",
+        type=float,
+        default=LsaSummarizer.REDUCTION_RATIO,
+        help="The ratio of singular values used by the ranks",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Document seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    text = " ".join(p.read_text() for p in sorted(EXAMPLE_DATA.glob("*.txt")))
+    sentences = [s for s in re.split(r"(?<=[.!?])\s+", text) if len(s.split()) > 3]
+    tokenizer = Tokenizer("english")
+    LsaSummarizer.REDUCTION_RATIO = args.ratio
+
+    print(
+        f"{'sentences':>9} {'words':>7} {'dense s':>9} {'sparse s':>9} "
+        f"{'speed-up':>8} same"
+    )
+    for length in args.lengths or [10, 100, 1000]:
+        document = PlaintextParser.from_string(
+            " ".join(rng.choice(sentences) for _ in range(length)), tokenizer
+        ).document
+        dense, expected = _time(LsaSummarizer(), document, args.sentences)
+        sparse, summary = _time(SparseLsaSummarizer(), document, args.sentences)
+        print(
+            f"{len(document.sentences):>9} {len(document.words):>7} {dense:>9.3f} "
+            f"{sparse:>9.3f} {dense / sparse:>7.1f}x {summary == expected}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -13,13 +13,11 @@ then
 fi
 
 
-mkdir -p $data_dir/docs
-cat $data_dir/train.source | head -n 1000 > $data_dir/docs/train.source 
-cat $data_dir/train.target | head -n 1000 > $data_dir/docs/train.target
 # Check if the output directory exists
 mkdir -p $output_dir/$language/$model/$metric
 
-muse -s $model -t document -d $data_dir/docs/ -e metrics -m $metric -l $language -o $output_dir/$language/$model/$metric/
+# Only the first 1000 documents of the training pair are read
+muse -s $model -t document -d $data_dir/train.source -c '{"data_importer_options": {"limit": 1000}}' -e metrics -m $metric -l $language -o $output_dir/$language/$model/$metric/
 
 
 
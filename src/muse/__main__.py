@@ -14,6 +14,22 @@ from .utils.data_fetcher import main as data_fetcher
 def validate_arguments(args: Namespace) -> Namespace:
     if args.use_cache and not args.output:
         raise ValueError("The --output argument is required when using cached data")
+    if args.resume and not args.output:
+        raise ValueError("The --output argument is required when resuming a run")
+    if (args.stream or args.pipeline) and (args.use_cache or args.resume):
+        raise ValueError(
+            "The --stream and --pipeline arguments can not be used with cached data or resuming"
+        )
+    if args.queue_size < 1 or args.metric_workers < 1:
+        raise ValueError(
+            "The --queue-size and --metric-workers arguments must be at least 1"
+        )
+    if args.chunk_size < 1:
+        raise ValueError("The --chunk-size argument must be at least 1")
+    if args.workers < 1:
+        raise ValueError("The --workers argument must be at least 1")
+    if args.checkpoint_interval < 1:
+        raise ValueError("The --checkpoint-interval argument must be at least 1")
 
     return args
 
@@ -121,6 +137,87 @@ def parse_arguments() -> Namespace:
         help="Use cached data for evaluation, must provide an output folder if wish to use this",
     )
 
+    run_config.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="The number of processes summarizing the data, for the extractive summarizers "
+        "bound by the cpu (spacy, sumy), the others run in this process",
+    )
+    run_config.add_argument(
+        "--summary-cache",
+        action="store_true",
+        help="Cache the summary of each document, so only new or changed documents are summarized",
+    )
+    run_config.add_argument(
+        "--summary-cache-size",
+        type=int,
+        default=1024,
+        help="The size of the summary cache in MB, past which the least recently used summaries "
+        "are evicted",
+    )
+    run_config.add_argument(
+        "--metric-cache",
+        action="store_true",
+        help="Cache the results of the metrics for each summary, so only new summaries are "
+        "evaluated",
+    )
+    run_config.add_argument(
+        "--metric-cache-size",
+        type=int,
+        default=1024,
+        help="The size of the metric cache in MB, past which the least recently used results are "
+        "evicted",
+    )
+    run_config.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume an interrupted run from the checkpoints in the output folder, must provide "
+        "the output folder of the run",
+    )
+    run_config.add_argument(
+        "--checkpoint-interval",
+        type=int,
+        default=256,
+        help="The number of documents summarized or evaluated between two checkpoints, which are "
+        "written to the output folder whenever one is given",
+    )
+    run_config.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream the data through the summarizers and metrics in chunks, bounding the "
+        "documents and summaries held in memory by the chunk size, the metrics still keep the "
+        "results of each summary unless they are averaged as they come (rouge and bertScore with "
+        "avg)",
+    )
+    run_config.add_argument(
+        "--chunk-size",
+        type=int,
+        default=1000,
+        help="The number of documents held in memory at once when streaming",
+    )
+    run_config.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Read, summarize and evaluate the chunks of data at the same time, reporting the "
+        "utilization of each stage",
+    )
+    run_config.add_argument(
+        "--queue-size",
+        type=int,
+        default=2,
+        help="The number of chunks waiting between two stages of the pipeline",
+    )
+    run_config.add_argument(
+        "--metric-workers",
+        type=int,
+        default=1,
+        help="The number of threads evaluating the summaries in the pipeline, each metric "
+        "evaluates one chunk at a time as the metrics are not thread safe, so the threads "
+        "evaluate different metrics at the same time",
+    )
+
     return validate_arguments(parser.parse_args())
 
 
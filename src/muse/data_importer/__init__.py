@@ -1,7 +1,20 @@
-from muse.data_importer.columnar import *
 from muse.data_importer.data_importer import Importer
-from muse.data_importer.fetcher import get_resource_type, handle_uri
-from muse.data_importer.folder import *
-from muse.data_importer.json import *
-from muse.data_importer.resolver import get_available_importers, import_data
-from muse.data_importer.source_target import *
+from muse.data_importer.fetcher import (
+    Resource,
+    get_resource_type,
+    handle_uri,
+    resolve_resource,
+)
+from muse.data_importer.manifest import registry
+from muse.data_importer.resolver import (
+    get_available_importers,
+    import_data,
+    iter_data,
+)
+
+
+def __getattr__(name: str):
+    # Builtin importers are only imported on first access, see muse.data_importer.manifest
+    if name in registry:
+        return registry.load(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
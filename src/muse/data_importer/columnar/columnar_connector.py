@@ -1,15 +1,25 @@
-from io import BytesIO
+from functools import partial
+from typing import Callable, Iterator
 
-import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as csv
+import pyarrow.parquet as pq
 
 from muse.data_importer.data_importer import Importer, split_text_by_regex
-from muse.data_importer.fetcher import get_resource_type, handle_uri
+from muse.data_importer.fetcher import get_resource_type, resolve_resource
+from muse.data_importer.manifest import registry
+from muse.data_importer.selection import Selection
 from muse.data_manager.conversation.conversation import Conversation, TextUnit
 from muse.data_manager.document.document import Document
 from muse.data_manager.multi_document.multi_document import MultiDocument
 from muse.utils.decorators import with_valid_options
 from muse.utils.resource_errors import InvalidResourceError
 
+# Columns pandas writes for the index of a data frame, which are not data
+_INDEX_PREFIX = "__index_level_"
+
 
 class ColumnarConnector(Importer):
     """
@@ -29,45 +39,18 @@ class ColumnarConnector(Importer):
         - Each person is delineated by #PERSON# <text>, e.g.
             #PERSON1# Hello, how are you?
             #PERSON2# I'm good, how are you?
+
+    The files are read with pyarrow, memory-mapped, and only the columns used (the text, summary,
+    multi document id and metadata columns) are read. The files are read in batches of rows, each
+    turned into objects column by column, so `iter_data` yields the first objects before the rest of
+    the file is read. Multi documents grouped by id are the exception, as their file is read whole.
+
+    The rows are selected by the selection options before the columns are read: the row groups of
+    parquet files without selected rows are skipped, and the metadata filter is applied on its own
+    columns, so the other columns are only read for the row groups with matching rows.
     """
 
-    @with_valid_options(
-        text_column={
-            "type": str,
-            "default": "text",
-            "help": "The column name for the text.",
-        },
-        summary_column={
-            "type": str,
-            "default": "summary",
-            "help": "The column name for the summary.",
-        },
-        metadata_columns={
-            "type": list[str],
-            "default": [],
-            "help": "The column names for the metadata. If an empty list, all columns except text and summary are considered metadata.",
-        },
-        csv_separator={
-            "type": str,
-            "default": ",",
-            "help": "The separator for the csv file.",
-        },
-        multi_doc_id_column={
-            "type": str,
-            "default": "multi_doc_id",
-            "help": "The column name for the multi document id.",
-        },
-        multi_document_delimiter={
-            "type": str,
-            "default": "#DOCUMENT#",
-            "help": "The delimiter for multi documents (used within the column to separate documents).",
-        },
-        conversation_separator={
-            "type": str,
-            "default": r"#\w+#",
-            "help": "The regex to separate conversations.",
-        },
-    )
+    @with_valid_options(**registry.options("ColumnarConnector"))
     def __init__(self, options: dict[str, any] = None):
         self._invalid_reason = None
 
@@ -86,139 +69,287 @@ class ColumnarConnector(Importer):
             "multi_document_delimiter", "#DOCUMENT#"
         )
         self.conversation_delimiter = options.get("conversation_separator", r"#\w+#")
+        self.selection = Selection(options)
 
     def import_data(self, data_path, document_type):
+        return list(self.iter_data(data_path, document_type))
+
+    def iter_data(self, data_path, document_type, batch_size=1000):
+        data_path = resolve_resource(data_path)
         if not self.check_data(data_path, document_type):
             raise InvalidResourceError("Invalid data", self._invalid_reason)
 
         if document_type not in ["document", "multi-document", "conversation"]:
             raise ValueError("Invalid document type")
 
-        data_path = handle_uri(data_path)
         data_type = get_resource_type(data_path)
+        names = self._read_schema(data_path, data_type).names
+        if self.text_column not in names:
+            raise InvalidResourceError(
+                f"No '{self.text_column}' column found, please rename the text column to '{self.text_column}', and if "
+                f"you have a summary, rename that to '{self.summary_column}', or set the text_column and summary_column"
+            )
 
-        data = self._read_data(data_path)
-
-        if data_type == "csv":
-            return self._import_csv(data, document_type)
+        if document_type == "multi-document" and self.multi_doc_id_column in names:
+            # The documents of a group may be anywhere in the file, so it is read whole
+            columns = self._columns(names, self.multi_doc_id_column)
+            batches = list(
+                self._read_batches(data_path, data_type, columns, batch_size)
+            )
+            if not batches:
+                # A file without rows has no batches to take the schema from
+                return []
+            table = pa.Table.from_batches(batches)
+            return self.selection.select(
+                self._create_grouped_multi_documents(table), lambda m: m.metadata
+            )
 
-        if data_type == "parquet":
-            return self._import_parquet(data, document_type)
+        create = {
+            "document": self._create_documents,
+            "multi-document": self._create_multi_documents,
+            "conversation": self._create_conversations,
+        }[document_type]
+        missing = [c for c in self.selection.metadata_filter if c not in names]
+        if missing:
+            raise InvalidResourceError(
+                f"No '{missing[0]}' column found, for the metadata_filter"
+            )
+        columns = self._columns(names, *self.selection.metadata_filter)
+        batches = self._read_selected(data_path, data_type, columns, batch_size)
+        return (data for batch in batches for data in create(batch))
 
     def check_data(self, data_path, document_type):
-        if get_resource_type(handle_uri(data_path)) not in ["csv", "parquet"]:
+        if get_resource_type(resolve_resource(data_path)) not in ["csv", "parquet"]:
             self._invalid_reason = "File type is not csv or parquet"
             return False
 
         return True
 
+    def _read_schema(self, data_path, data_type) -> pa.Schema:
+        with self._open(data_path) as source:
+            if data_type == "parquet":
+                return pq.read_schema(source)
+            return self._open_csv(source).schema
+
     @staticmethod
-    def _read_data(data_path):
-        with open(data_path, "rb") as file:
-            return BytesIO(file.read())
-
-    def _import_csv(self, data, document_type):
-        if document_type == "document":
-            return self._create_documents(pd.read_csv(data, sep=self.csv_separator))
-        if document_type == "multi-document":
-            return self._create_multi_document_csv(
-                pd.read_csv(data, sep=self.csv_separator)
-            )
-        if document_type == "conversation":
-            return self._create_conversation_csv(
-                pd.read_csv(data, sep=self.csv_separator)
-            )
+    def _open(data_path) -> pa.NativeFile:
+        """
+        Memory-map a file, in place when it is stored as is in a zip or tar file, else extracted.
 
-    def _import_parquet(self, data, document_type):
-        if document_type == "document":
-            return self._create_documents(pd.read_parquet(data))
-        if document_type == "multi-document":
-            return self._create_multi_document_csv(pd.read_parquet(data))
-        if document_type == "conversation":
-            return self._create_conversation_csv(pd.read_parquet(data))
+        :param data_path: The resolved file.
+        :return: The mapped file.
+        """
+        location = data_path.fs.byte_range(data_path)
+        if location is None:
+            return pa.memory_map(data_path.fs.local_path(data_path))
+        file, offset, size = location
+        source = pa.memory_map(file)
+        if offset == 0 and size == source.size():
+            return source
+        return pa.BufferReader(source.read_at(size, offset))
 
-    def _create_documents(self, df: pd.DataFrame):
-        if self.text_column not in df.columns:
-            raise InvalidResourceError(
-                f"No '{self.text_column}' column found, please rename the text column to '{self.text_column}', and if "
-                f"you have a summary, rename that to '{self.summary_column}', or set the text_column and summary_column"
-            )
-        documents = []
-        for i, row in df.iterrows():
-            text = row[self.text_column]
-            summary = row.get(self.summary_column, None)
-            if self.metadata_columns:
-                metadata = {col: row[col] for col in self.metadata_columns}
+    def _open_csv(self, source, columns: list[str] | None = None):
+        parse_options = csv.ParseOptions(delimiter=self.csv_separator)
+        # The types are inferred from the first block, dates are kept as text like pandas does
+        inferred = csv.open_csv(source, parse_options=parse_options).schema
+        source.seek(0)
+        convert_options = csv.ConvertOptions(
+            column_types={
+                field.name: pa.string()
+                for field in inferred
+                if pa.types.is_temporal(field.type)
+            },
+            include_columns=columns,
+        )
+        return csv.open_csv(
+            source, parse_options=parse_options, convert_options=convert_options
+        )
+
+    def _read_batches(
+        self, data_path, data_type, columns: list[str], batch_size: int
+    ) -> Iterator[pa.RecordBatch]:
+        with self._open(data_path) as source:
+            if data_type == "parquet":
+                file = pq.ParquetFile(source)
+                yield from file.iter_batches(batch_size=batch_size, columns=columns)
+                return
+
+            # The blocks of csv files are sized in bytes, they are sliced to the batch size
+            for block in self._open_csv(source, columns):
+                for start in range(0, block.num_rows, batch_size):
+                    yield block.slice(start, batch_size)
+
+    def _row_groups(
+        self, data_path, data_type, columns: list[str]
+    ) -> Iterator[tuple[int, Callable[[list[str]], pa.Table]]]:
+        """
+        Iterate over the row groups of a parquet file, or the blocks of a csv file.
+
+        :return: Iterator of the number of rows of each group, and a function reading columns of it.
+        """
+        with self._open(data_path) as source:
+            if data_type == "parquet":
+                file = pq.ParquetFile(source)
+                for i in range(file.num_row_groups):
+                    rows = file.metadata.row_group(i).num_rows
+                    yield rows, partial(file.read_row_group, i)
+                return
+
+            # The blocks of csv files have to be parsed to be skipped, the columns are only
+            # selected
+            for block in self._open_csv(source, columns):
+                yield block.num_rows, pa.Table.from_batches([block]).select
+
+    def _read_selected(
+        self, data_path, data_type, columns: list[str], batch_size: int
+    ) -> Iterator[pa.RecordBatch]:
+        selection = self.selection
+        window = selection.window()
+        position = 0
+        for rows, read in self._row_groups(data_path, data_type, columns):
+            selected = np.arange(rows)
+            if selection.by_position:
+                selected = np.flatnonzero(selection.keep_mask(position, rows))
+            position += rows
+
+            if selection.metadata_filter and len(selected):
+                table = read(list(selection.metadata_filter)).take(selected)
+                selected = selected[self._filter_mask(table)]
+
+            start, stop = window.take(len(selected))
+            selected = selected[start:stop]
+            if len(selected):
+                table = read(columns)
+                if len(selected) < rows:
+                    table = table.take(selected)
+                yield from table.to_batches(max_chunksize=batch_size)
+            if window.done:
+                return
+
+    def _filter_mask(self, table: pa.Table) -> np.ndarray:
+        """
+        Match the rows against the metadata filter, like `Selection.matches` does.
+
+        :param table: The columns of the metadata filter.
+        :return: The boolean mask of the matching rows.
+        """
+        mask = np.ones(table.num_rows, dtype=bool)
+        for key, condition in self.selection.metadata_filter.items():
+            column = table[key]
+            if isinstance(condition, dict):
+                matches = pc.is_valid(column)
+                if "min" in condition:
+                    matches = pc.and_(
+                        matches, pc.greater_equal(column, condition["min"])
+                    )
+                if "max" in condition:
+                    matches = pc.and_(matches, pc.less_equal(column, condition["max"]))
+            elif isinstance(condition, list):
+                values = pa.array([v for v in condition if v is not None], column.type)
+                matches = pc.is_in(column, value_set=values)
+                if None in condition:
+                    matches = pc.or_(matches, pc.is_null(column))
+            elif condition is None:
+                matches = pc.is_null(column)
             else:
-                metadata = {
-                    k: v for k, v in row.items() if k not in ["text", "summary"]
-                }
-            documents.append(Document(text, summary, metadata))
-        return documents
-
-    def _create_multi_document_csv(self, df: pd.DataFrame):
-        if self.text_column not in df.columns:
+                matches = pc.equal(column, condition)
+            mask &= pc.fill_null(matches, False).to_numpy(zero_copy_only=False)
+        return mask
+
+    def _columns(self, names: list[str], *extra: str) -> list[str]:
+        """
+        Get the columns to read, in the order of the file.
+
+        :param names: The columns of the file.
+        :param extra: The other columns needed, if present.
+        :return: The text, summary, extra and metadata columns.
+        """
+        missing = [c for c in self.metadata_columns if c not in names]
+        if missing:
             raise InvalidResourceError(
-                f"No '{self.text_column}' column found, please rename the text column to '{self.text_column}', and if "
-                f"you have a summary, rename that to '{self.summary_column}', or set the text_column and summary_column"
+                f"No '{missing[0]}' column found, for the metadata_columns"
             )
-        multidocs = []
-
-        if self.multi_doc_id_column in df.columns:
-            for i, group in df.groupby(self.multi_doc_id_column):
-                group_dict = group.to_dict(orient="list")
-                texts = group_dict[self.text_column]
-                summaries = group_dict[self.summary_column]
-                summary = next((s for s in summaries if s is not None), None)
-                if self.metadata_columns:
-                    metadata = {col: group_dict[col] for col in self.metadata_columns}
-                else:
-                    metadata = {
-                        k: v
-                        for k, v in group_dict.items()
-                        if k not in ["text", "summary"]
-                    }
-                multidocs.append(
-                    MultiDocument(
-                        [Document(t, None, None) for t in texts], summary, metadata
-                    )
-                )
+
+        used = {self.text_column, self.summary_column, *extra, *self.metadata_columns}
+        return [
+            name
+            for name in names
+            if not name.startswith(_INDEX_PREFIX)
+            and (name in used or not self.metadata_columns)
+        ]
+
+    def _metadata_columns(self, names: list[str]) -> list[str]:
+        if self.metadata_columns:
+            return list(self.metadata_columns)
+        return [n for n in names if n not in [self.text_column, self.summary_column]]
+
+    def _common_columns(self, batch: pa.RecordBatch):
+        texts = batch.column(self.text_column).to_pylist()
+        if self.summary_column in batch.schema.names:
+            summaries = batch.column(self.summary_column).to_pylist()
         else:
-            for i, row in df.iterrows():
-                text = row[self.text_column].split(self.multi_document_delimiter)
-                summary = row.get(self.summary_column, None)
-                if self.metadata_columns:
-                    metadata = {col: row[col] for col in self.metadata_columns}
-                else:
-                    metadata = {
-                        k: v for k, v in row.items() if k not in ["text", "summary"]
-                    }
-                multidocs.append(
-                    MultiDocument(
-                        [Document(t, None, None) for t in text], summary, metadata
-                    )
-                )
-        return multidocs
+            summaries = [None] * batch.num_rows
 
-    def _create_conversation_csv(self, df: pd.DataFrame):
-        if self.text_column not in df.columns:
-            raise InvalidResourceError(
-                f"No '{self.text_column}' column found, please rename the text column to '{self.text_column}', and if "
-                f"you have a summary, rename that to '{self.summary_column}', or set the text_column and summary_column"
+        metadata_columns = self._metadata_columns(batch.schema.names)
+        if metadata_columns:
+            metadata = batch.select(metadata_columns).to_pylist()
+        else:
+            metadata = [{} for _ in range(batch.num_rows)]
+        return texts, summaries, metadata
+
+    def _create_documents(self, batch: pa.RecordBatch) -> list[Document]:
+        return [
+            Document(text, summary, metadata)
+            for text, summary, metadata in zip(*self._common_columns(batch))
+        ]
+
+    def _create_multi_documents(self, batch: pa.RecordBatch) -> list[MultiDocument]:
+        return [
+            MultiDocument(
+                [
+                    Document(t, None, None)
+                    for t in text.split(self.multi_document_delimiter)
+                ],
+                summary,
+                metadata,
             )
-        conversations = []
-        for i, row in df.iterrows():
-            text = row[self.text_column]
-            summary = row.get(self.summary_column, None)
-            if self.metadata_columns:
-                metadata = {col: row[col] for col in self.metadata_columns}
-            else:
-                metadata = {
-                    k: v for k, v in row.items() if k not in ["text", "summary"]
-                }
-            conversation_units = split_text_by_regex(text, self.conversation_delimiter)
-            text_units = []
-            for unit in conversation_units:
-                text_units.append(TextUnit(unit[1], unit[0]))
-            conversations.append(Conversation(text_units, summary, metadata))
-        return conversations
+            for text, summary, metadata in zip(*self._common_columns(batch))
+        ]
+
+    def _create_grouped_multi_documents(self, table: pa.Table) -> list[MultiDocument]:
+        # Grouped in the order of the rows, and the groups sorted by id, like pandas does
+        table = table.filter(pc.is_valid(table[self.multi_doc_id_column]))
+        grouped = (
+            table.group_by(self.multi_doc_id_column, use_threads=False)
+            .aggregate([(name, "list") for name in table.column_names])
+            .sort_by(self.multi_doc_id_column)
+        )
+        columns = {
+            name: grouped.column(f"{name}_list").to_pylist()
+            for name in table.column_names
+        }
+        texts = columns[self.text_column]
+        summaries = columns.get(self.summary_column, [[]] * grouped.num_rows)
+        metadata_columns = self._metadata_columns(table.column_names)
+
+        return [
+            MultiDocument(
+                [Document(t, None, None) for t in texts[i]],
+                next((s for s in summaries[i] if s is not None), None),
+                {name: columns[name][i] for name in metadata_columns},
+            )
+            for i in range(grouped.num_rows)
+        ]
+
+    def _create_conversations(self, batch: pa.RecordBatch) -> list[Conversation]:
+        return [
+            Conversation(
+                [
+                    TextUnit(unit[1], unit[0])
+                    for unit in split_text_by_regex(text, self.conversation_delimiter)
+                ],
+                summary,
+                metadata,
+            )
+            for text, summary, metadata in zip(*self._common_columns(batch))
+        ]
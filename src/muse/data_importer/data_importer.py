@@ -1,6 +1,6 @@
 import re
 from abc import ABC, abstractmethod
-from typing import Union
+from typing import Iterator, Union
 
 from muse.data_manager.conversation.conversation import Conversation
 from muse.data_manager.document.document import Document
@@ -15,6 +15,13 @@ class Importer(ABC):
     - import_data: Import data from a given path by resolving the kind of data it is and returning the
                    appropriate object.
     - check_data_path: Check if the data path belongs to this connector.
+
+    Importers able to read the data progressively can also override `iter_data`, which otherwise
+    imports all the data at once.
+
+    When used through `import_data`, the data path given to both methods is a `Resource`: the local path the data was
+    fetched and extracted to, along with a sniff of its type, first bytes and directory listing. Use `resolve_resource`
+    from `muse.data_importer.fetcher` to accept both plain paths and resources without fetching the data again.
     """
 
     plugin = False
@@ -45,6 +52,21 @@ class Importer(ABC):
         """
         pass
 
+    def iter_data(
+        self, data_path: str, document_type: str, batch_size: int = 1000
+    ) -> Iterator[Union[Document, MultiDocument, Conversation]]:
+        """
+        Iterate over the data of a given path, so it can be processed without holding all of it in memory.
+
+        :param data_path: The path to the data to be imported.
+        :param document_type: Type of document to import, either 'document', 'multi-document', or 'conversation'.
+        :param batch_size: The number of documents to read at once, for importers reading the data progressively.
+        :return: Iterator of Document, MultiDocument, or Conversation objects.
+        :raises ValueError: If the document type is not 'document', 'multi-document', or 'conversation'.
+        :raises InvalidResourceError: If the resource is invalid.
+        """
+        yield from self.import_data(data_path, document_type)
+
     @abstractmethod
     def check_data(self, data_path: str, document_type: str) -> bool:
         """
@@ -1,19 +1,119 @@
+import hashlib
+import json
 import os
 import shutil
-import tarfile
 import tempfile
-import zipfile
+import warnings
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+from functools import cached_property
 from pathlib import Path
-from urllib.parse import urlparse
+from typing import Iterator
+from urllib.parse import urldefrag, urlparse
 
 import git
 import requests
 
-from muse.utils.env import get_data_dir
+from muse.data_importer.filesystem import (
+    LOCAL,
+    FileSystem,
+    extract_archive,
+    find_archive,
+    mount,
+)
+from muse.utils.env import get_cache_dir, get_data_dir
+from muse.utils.resource_errors import InvalidResourceError
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 
 TMP_DIR = Path(tempfile.gettempdir())
 ONE_DAY_AGO = datetime.now() - timedelta(days=1)
+MAGIC_SIZE = 512
+# The size of the chunks downloads are streamed to disk in, an interrupted chunk is lost
+CHUNK_SIZE = 1 << 16
+# The number of times an interrupted download is resumed before giving up
+DOWNLOAD_RETRIES = 3
+# The seconds to wait for the server to connect, or to send the next bytes
+DOWNLOAD_TIMEOUT = 60
+
+
+class Resource(str):
+    """
+    A data URI resolved to a path, along with a cheap sniff of what is at that path.
+
+    A resource is the str of its path, so it can be used anywhere a path is expected, while
+    connectors can check the sniffed information instead of going back to the disk. `handle_uri`
+    returns resources unchanged, so a resource is only fetched and extracted once.
+
+    The path is read through the file system of the resource: the local file system, or the file
+    system of a zip or uncompressed tar file, whose members are read in place, the archive being a
+    directory at its own path.
+
+    The sniffed information is:
+    - resource_type: The type of the resource, as returned by `get_resource_type`.
+    - magic: The first bytes of a file, empty for directories.
+    - entries, files, directories: The names in a directory, listed once, empty for files.
+    - tree: The recursive listing of a directory, as returned by `os.walk`, taken on first use.
+    """
+
+    def __new__(cls, path: str, uri: str | None = None, fs: FileSystem = LOCAL):
+        resource = super().__new__(cls, path)
+        resource.uri = uri if uri is not None else path
+        resource.fs = fs
+        resource.resource_type = (
+            "directory" if fs.isdir(path) else get_resource_type(path)
+        )
+        resource.magic = b""
+        resource.entries = []
+        resource.files = []
+        resource.directories = []
+
+        if resource.resource_type == "directory":
+            for entry in fs.scandir(path):
+                resource.entries.append(entry.name)
+                if entry.is_dir:
+                    resource.directories.append(entry.name)
+                elif entry.is_file:
+                    resource.files.append(entry.name)
+        elif fs.isfile(path):
+            with fs.open(path, "rb") as f:
+                resource.magic = f.read(MAGIC_SIZE)
+
+        return resource
+
+    @cached_property
+    def tree(self) -> list[tuple[str, list[str], list[str]]]:
+        return list(self.fs.walk(self))
+
+    def text_start(self) -> str:
+        """
+        The start of the file as text, without any leading whitespace or byte order mark.
+
+        :return: The start of the file.
+        """
+        return self.magic.decode("utf-8", errors="ignore").lstrip("\ufeff \t\r\n")
+
+
+def resolve_resource(uri: str) -> Resource:
+    """
+    Fetches the URI, like `handle_uri`, and sniffs the resulting resource.
+
+    Zip files and uncompressed tar files, and the paths in them, are read in place rather than
+    extracted. Other archives are extracted, once per archive.
+
+    :param uri: URI of the file or folder, or an already resolved resource.
+    :return: The resolved resource.
+    """
+    if isinstance(uri, Resource):
+        return uri
+    path = _fetch(uri)
+    fs = mount(path)
+    if fs is None:
+        return Resource(extract(path), uri)
+    return Resource(path, uri, fs)
 
 
 def handle_uri(uri: str) -> str:
@@ -21,9 +121,27 @@ def handle_uri(uri: str) -> str:
     Handles the URI and returns the path to the file or folder.
     Also extracts the file if it is a zip or tar file.
 
+    The checksum of a file to download can be given as the fragment of its URI, as in
+    `https://example.com/data.parquet#sha256=<hex digest>`, with any hashlib algorithm.
+
+    A path in a zip or tar file, as in `data.tar/english/train.source`, is the path of the
+    extracted member.
+
     :param uri: URI of the file or folder.
     :return: Path to the file or folder.
     """
+    if isinstance(uri, Resource):
+        return uri
+    return extract(_fetch(uri))
+
+
+def _fetch(uri: str) -> str:
+    """
+    Downloads or clones the URI if it is remote, or finds it locally.
+
+    :param uri: URI of the file or folder.
+    :return: Local path to the file or folder, which may be in an archive.
+    """
     parsed_uri = urlparse(uri)
 
     scheme = parsed_uri.scheme
@@ -32,29 +150,255 @@ def handle_uri(uri: str) -> str:
         scheme = "git"
 
     if scheme == "http" or scheme == "https":
-        return extract(download(uri))
+        return download(*_split_checksum(uri))
     elif scheme == "git":
         return clone(uri)
-    elif os.path.exists(uri):
-        return extract(uri)
-    elif os.path.exists(Path(get_data_dir(), uri)):
-        return extract(str(Path(get_data_dir(), uri)))
-    else:
-        raise FileNotFoundError(f"File or folder not found at {uri}")
+    elif os.path.exists(uri) or find_archive(uri):
+        return uri
+    data_path = str(Path(get_data_dir(), uri))
+    if os.path.exists(data_path) or find_archive(data_path):
+        return data_path
+    raise FileNotFoundError(f"File or folder not found at {uri}")
 
 
-def download(uri: str) -> str:
+def download(uri: str, checksum: str | None = None) -> str:
     """
-    Downloads the file or folder from the given URI.
+    Downloads the file at the given URI, streaming it to disk a chunk at a time.
 
-    :param uri: URI of the file or folder.
-    :return: Path to the downloaded file or folder.
+    The downloads are cached in the MUSE_CACHE directory, each file in a directory named by the
+    sha256 of its content, and revalidated with the ETag or Last-Modified date given by the server
+    when the same URI is downloaded again, so unchanged files are not downloaded twice. Interrupted
+    downloads are resumed with HTTP Range requests, in the same run or the next one, and concurrent
+    downloads of the same URI wait for each other rather than writing the same file. Without a cache
+    directory, each download goes to a new temporary directory.
+
+    :param uri: URI of the file.
+    :param checksum: The expected digest of the file, as "<algorithm>:<hex digest>" with any hashlib
+                     algorithm. A file cached with the same sha256 is used without requesting it.
+    :return: Path to the downloaded file.
+    :raises InvalidResourceError: If the file does not match the checksum.
+    :raises requests.RequestException: If the server answers with an error or cannot be reached.
     """
-    response = requests.get(uri)
-    file_path = TMP_DIR / Path(uri).name
-    with open(file_path, "wb") as f:
-        f.write(response.content)
-    return str(file_path)
+    name = Path(urlparse(uri).path).name or "download"
+    expected = _parse_checksum(checksum) if checksum else None
+
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        path = Path(tempfile.mkdtemp(prefix="muse-download-"), name)
+        part = Path(f"{path}.part")
+        _download_to(uri, part, {})
+        _verify_download(uri, part, expected)
+        os.replace(part, path)
+        return str(path)
+
+    downloads = Path(cache_dir, "downloads")
+    if expected is not None and expected[0] == "sha256":
+        path = downloads / expected[1] / name
+        if path.is_file():
+            return str(path)
+
+    # The state of each URI is kept under the hash of the URI, its content under its own hash
+    state = downloads / "uris" / hashlib.sha1(uri.encode("utf-8")).hexdigest()
+    state.parent.mkdir(parents=True, exist_ok=True)
+    with _lock(Path(f"{state}.lock")):
+        entry = _read_json(Path(f"{state}.json"))
+        cached = downloads / entry["path"] if entry else None
+        headers = {}
+        if cached is not None and cached.is_file():
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        else:
+            cached = None
+
+        part = Path(f"{state}.part")
+        try:
+            validators = _download_to(uri, part, headers)
+        except requests.ConnectionError as e:
+            if cached is None:
+                raise
+            warnings.warn(f"Could not revalidate {uri}, using its cached download: {e}")
+            validators = None
+
+        if validators is None:
+            if expected is not None:
+                _verify(uri, cached, expected)
+            return str(cached)
+
+        digest = _verify_download(uri, part, expected)
+        path = downloads / digest / name
+        path.parent.mkdir(exist_ok=True)
+        os.replace(part, path)
+        _write_json(
+            Path(f"{state}.json"),
+            {"uri": uri, "path": f"{digest}/{name}", **validators},
+        )
+        return str(path)
+
+
+def _split_checksum(uri: str) -> tuple[str, str | None]:
+    """
+    Split the checksum given as the fragment of a URI, as in `<uri>#sha256=<hex digest>`.
+
+    :param uri: The URI.
+    :return: The URI without the checksum, and the checksum as "<algorithm>:<hex digest>" or None.
+    """
+    url, fragment = urldefrag(uri)
+    algorithm, _, digest = fragment.partition("=")
+    if digest and algorithm.lower() in hashlib.algorithms_available:
+        return url, f"{algorithm.lower()}:{digest}"
+    return uri, None
+
+
+def _parse_checksum(checksum: str) -> tuple[str, str]:
+    algorithm, _, digest = checksum.partition(":")
+    if not digest or algorithm.lower() not in hashlib.algorithms_available:
+        raise ValueError(
+            f"Invalid checksum {checksum}, expected <algorithm>:<hex digest>"
+        )
+    return algorithm.lower(), digest.lower()
+
+
+def _download_to(uri: str, part: Path, headers: dict[str, str]) -> dict | None:
+    """
+    Stream a file to a partial file, resuming the partial file of an interrupted download if the
+    server still has the same file.
+
+    :param uri: URI of the file.
+    :param part: The partial file, its validator is kept in a .json file next to it.
+    :param headers: The headers revalidating a cached download of the file, if any.
+    :return: The ETag and Last-Modified date of the file, or None if the server answered that the
+             cached download is not modified.
+    """
+    state_file = Path(f"{part}.json")
+    for attempt in range(DOWNLOAD_RETRIES + 1):
+        # The bytes are downloaded as they are stored, so the ranges are offsets in the file
+        request_headers = {**headers, "Accept-Encoding": "identity"}
+        offset = part.stat().st_size if part.is_file() else 0
+        validator = (_read_json(state_file) or {}).get("validator")
+        if offset and validator:
+            request_headers["Range"] = f"bytes={offset}-"
+            request_headers["If-Range"] = validator
+
+        try:
+            with requests.get(
+                uri, headers=request_headers, stream=True, timeout=DOWNLOAD_TIMEOUT
+            ) as response:
+                if response.status_code == 304:
+                    return None
+                if response.status_code == 416:
+                    # The partial file does not fit the file anymore
+                    part.unlink()
+                    continue
+                response.raise_for_status()
+
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                # Only a strong ETag or a date tells that the resumed bytes are of the same file
+                if etag and not etag.startswith("W/"):
+                    validator = etag
+                else:
+                    validator = last_modified
+                _write_json(state_file, {"validator": validator})
+
+                if response.status_code != 206:
+                    offset = 0
+                size = offset
+                with open(part, "ab" if offset else "wb") as file:
+                    for chunk in response.iter_content(CHUNK_SIZE):
+                        file.write(chunk)
+                        size += len(chunk)
+
+                length = response.headers.get("Content-Length")
+                if length is not None and size - offset != int(length):
+                    raise requests.exceptions.ChunkedEncodingError(
+                        f"Received {size - offset} of {length} bytes"
+                    )
+        except (
+            requests.ConnectionError,
+            requests.Timeout,
+            requests.exceptions.ChunkedEncodingError,
+        ):
+            if attempt == DOWNLOAD_RETRIES:
+                raise
+            continue
+
+        state_file.unlink(missing_ok=True)
+        return {"etag": etag, "last_modified": last_modified}
+    raise requests.ConnectionError(f"Could not download {uri}")
+
+
+def _verify(uri: str, path: Path, expected: tuple[str, str] | None) -> str:
+    """
+    Check a downloaded file against its expected checksum.
+
+    :param uri: URI of the file, for the errors.
+    :param path: The downloaded file.
+    :param expected: The algorithm and hex digest of the checksum, or None.
+    :return: The sha256 of the file.
+    :raises InvalidResourceError: If the file does not match the checksum.
+    """
+    algorithms = {"sha256"} | ({expected[0]} if expected else set())
+    digests = _file_digests(path, algorithms)
+    if expected is not None and digests[expected[0]] != expected[1]:
+        raise InvalidResourceError(
+            uri,
+            f"Checksum mismatch, expected {expected[0]}:{expected[1]}, "
+            f"got {expected[0]}:{digests[expected[0]]}",
+        )
+    return digests["sha256"]
+
+
+def _verify_download(uri: str, part: Path, expected: tuple[str, str] | None) -> str:
+    """
+    Check a new download like `_verify`, removing it if it does not match the checksum.
+    """
+    try:
+        return _verify(uri, part, expected)
+    except InvalidResourceError:
+        part.unlink()
+        raise
+
+
+def _file_digests(path: Path, algorithms: set[str]) -> dict[str, str]:
+    hashes = {algorithm: hashlib.new(algorithm) for algorithm in algorithms}
+    with open(path, "rb") as file:
+        while chunk := file.read(CHUNK_SIZE):
+            for h in hashes.values():
+                h.update(chunk)
+    return {algorithm: h.hexdigest() for algorithm, h in hashes.items()}
+
+
+@contextmanager
+def _lock(path: Path) -> Iterator[None]:
+    """
+    Hold an exclusive lock on a file, waiting for other processes holding it, where supported.
+    """
+    with open(path, "a") as file:
+        if fcntl is not None:
+            fcntl.flock(file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(file, fcntl.LOCK_UN)
+
+
+def _read_json(path: Path) -> dict | None:
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json(path: Path, data: dict):
+    # Written to a temporary file first, so an interrupted write never leaves a partial file
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
 
 
 def clone(uri: str) -> str:
@@ -84,26 +428,25 @@ def clone(uri: str) -> str:
 
 def extract(file_path: str) -> str:
     """
-    Extracts the zip or tar file, if it is a zip or tar file.
+    Extracts the zip or tar file, if it is a zip or tar file or a path in one.
+
+    An archive is extracted once, to a directory named by its sha256 in the MUSE_CACHE directory,
+    and the extraction is reused until the archive changes.
 
-    :param file_path: Path to the zip or tar file.
-    :return: Path to the extracted folder.
+    :param file_path: Path to the zip or tar file, or to a member of it.
+    :return: Path to the extracted folder, or member.
     """
     if os.path.isdir(file_path):
         return file_path
 
-    if zipfile.is_zipfile(file_path):
-        with zipfile.ZipFile(file_path, "r") as zip_ref:
-            extracted_folder = TMP_DIR / Path(file_path).stem
-            zip_ref.extractall(extracted_folder)
-            return str(extracted_folder)
-    elif tarfile.is_tarfile(file_path):
-        with tarfile.open(file_path, "r") as tar_ref:
-            extracted_folder = TMP_DIR / Path(file_path).stem
-            tar_ref.extractall(extracted_folder)
-            return str(extracted_folder)
-    else:
+    archive = find_archive(file_path)
+    if archive is None:
         return file_path
+    extracted_folder = extract_archive(archive)
+    member = os.path.relpath(os.path.normpath(file_path), archive)
+    if member == os.curdir:
+        return extracted_folder
+    return os.path.join(extracted_folder, member)
 
 
 def get_resource_type(path: str) -> str:
@@ -113,6 +456,9 @@ def get_resource_type(path: str) -> str:
     :param path: Path to the resource.
     :return: Type of the resource.
     """
+    if isinstance(path, Resource):
+        return path.resource_type
+
     if os.path.isdir(path):
         return "directory"
 
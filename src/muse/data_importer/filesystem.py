@@ -0,0 +1,480 @@
+"""
+File systems the resources are read from: the local file system, and zip and tar files read in place.
+
+Zip files and uncompressed tar files are read like directories at the path of the archive, so the
+member `english/train.source` of `/data/xlsum.tar` is at `/data/xlsum.tar/english/train.source`.
+Their members are listed from the central directory of zip files, or from an index of the headers
+of tar files, persisted in the MUSE_CACHE directory, and streamed out of the archive. The members
+stored without compression are a range of bytes of the archive, which can be memory-mapped.
+
+Other archives, such as compressed tar files, cannot be read in place. They are extracted once to
+the MUSE_CACHE directory, in a directory named by the sha256 of the archive, and read from there.
+"""
+
+import hashlib
+import io
+import json
+import os
+import posixpath
+import shutil
+import struct
+import tarfile
+import tempfile
+import zipfile
+from collections import namedtuple
+from pathlib import Path
+from typing import IO, Iterator
+
+from muse.utils.env import get_cache_dir
+
+__all__ = [
+    "Entry",
+    "FileSystem",
+    "ArchiveFileSystem",
+    "LOCAL",
+    "find_archive",
+    "mount",
+    "extract_archive",
+]
+
+_INDEX_VERSION = 1
+# The size of the chunks the archives are hashed and their members extracted in
+_CHUNK_SIZE = 1 << 20
+
+Entry = namedtuple("Entry", ["name", "is_dir", "is_file"])
+
+
+class FileSystem:
+    """
+    The local file system, and the operations the connectors read the resources with.
+    """
+
+    def open(self, path: str, mode: str = "rb", encoding: str | None = None) -> IO:
+        """
+        Open a file for reading, like `open`.
+
+        :param path: The file.
+        :param mode: Either 'rb' or 'r'.
+        :param encoding: The encoding of the text, the locale encoding by default like `open`.
+        :return: The opened file.
+        """
+        return open(path, mode, encoding=encoding)
+
+    def scandir(self, path: str) -> list[Entry]:
+        """
+        List a directory, like `os.scandir`.
+
+        :param path: The directory.
+        :return: The entries of the directory.
+        """
+        with os.scandir(path) as entries:
+            return [Entry(e.name, e.is_dir(), e.is_file()) for e in entries]
+
+    def walk(self, path: str) -> Iterator[tuple[str, list[str], list[str]]]:
+        """
+        Walk a directory tree, like `os.walk`.
+        """
+        return os.walk(path)
+
+    def isfile(self, path: str) -> bool:
+        return os.path.isfile(path)
+
+    def isdir(self, path: str) -> bool:
+        return os.path.isdir(path)
+
+    def byte_range(self, path: str) -> tuple[str, int, int] | None:
+        """
+        Locate a file as a range of bytes of a local file, for reading it from a memory map.
+
+        :param path: The file.
+        :return: The local file, and the offset and size of the range, or None if the file is not
+                 stored as is.
+        """
+        return path, 0, os.path.getsize(path)
+
+    def local_path(self, path: str) -> str:
+        """
+        Get a local path of a file, for the libraries reading files by path only.
+
+        :param path: The file.
+        :return: The local path, where the file is extracted to if it is in an archive.
+        """
+        return path
+
+
+LOCAL = FileSystem()
+
+
+class ArchiveFileSystem(FileSystem):
+    """
+    The members of an archive, read in place as a directory at the path of the archive.
+    """
+
+    def __init__(self, path: str, files: dict[str, any], directories: list[str]):
+        """
+        :param path: The archive.
+        :param files: The information needed to read each file, by member name.
+        :param directories: The names of the directories, the parents of files are added.
+        """
+        self.path = os.path.normpath(path)
+        self._files = files
+        self._directories = {"": {}}
+        for name in directories:
+            self._add(name, True)
+        for name in files:
+            self._add(name, False)
+
+    def _add(self, name: str, is_dir: bool):
+        # Adds the entry to its parent directory, and the parents missing to theirs
+        while name:
+            if is_dir:
+                self._directories.setdefault(name, {})
+            parent, _, base = name.rpartition("/")
+            children = self._directories.setdefault(parent, {})
+            known = base in children
+            children[base] = is_dir
+            if known:
+                return
+            name, is_dir = parent, True
+
+    def _member(self, path: str) -> str | None:
+        path = os.path.normpath(path)
+        if path == self.path:
+            return ""
+        if path.startswith(self.path + os.sep):
+            return path[len(self.path) + 1 :].replace(os.sep, "/")
+        return None
+
+    def _info(self, path: str) -> any:
+        name = self._member(path)
+        if name not in self._files:
+            raise FileNotFoundError(f"No file at {path}")
+        return self._files[name]
+
+    def _open(self, info: any) -> IO[bytes]:
+        raise NotImplementedError
+
+    def open(self, path, mode="rb", encoding=None):
+        if mode not in ["r", "rb"]:
+            raise ValueError(f"Invalid mode {mode}, archives are read only")
+        file = self._open(self._info(path))
+        if mode == "rb":
+            return file
+        return io.TextIOWrapper(file, encoding=encoding)
+
+    def scandir(self, path):
+        name = self._member(path)
+        if name not in self._directories:
+            raise FileNotFoundError(f"No directory at {path}")
+        return [Entry(n, d, not d) for n, d in self._directories[name].items()]
+
+    def walk(self, path):
+        name = self._member(path)
+        if name not in self._directories:
+            return
+        children = self._directories[name]
+        dirs = sorted(n for n, is_dir in children.items() if is_dir)
+        files = sorted(n for n, is_dir in children.items() if not is_dir)
+        yield path, dirs, files
+        for directory in dirs:
+            yield from self.walk(os.path.join(path, directory))
+
+    def isfile(self, path):
+        return self._member(path) in self._files
+
+    def isdir(self, path):
+        return self._member(path) in self._directories
+
+    def local_path(self, path):
+        name = self._member(path)
+        self._info(path)
+        target = Path(_extraction_dir(), f"{archive_hash(self.path)}.members", name)
+        if not target.is_file():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp_target = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+            with self.open(path) as member, open(tmp_target, "wb") as file:
+                shutil.copyfileobj(member, file, _CHUNK_SIZE)
+            os.replace(tmp_target, target)
+        return str(target)
+
+
+class _ZipFileSystem(ArchiveFileSystem):
+    def __init__(self, path: str):
+        self._zip = zipfile.ZipFile(path)
+        files, directories = {}, []
+        for info in self._zip.infolist():
+            name = posixpath.normpath(info.filename).lstrip("/")
+            if info.is_dir():
+                directories.append(name)
+            elif name != ".":
+                files[name] = info
+        super().__init__(path, files, directories)
+
+    def _open(self, info):
+        return self._zip.open(info)
+
+    def byte_range(self, path):
+        info = self._info(path)
+        # Encrypted or compressed members are not stored as is
+        if info.compress_type != zipfile.ZIP_STORED or info.flag_bits & 0x1:
+            return None
+        with open(self.path, "rb") as file:
+            file.seek(info.header_offset)
+            header = file.read(30)
+        # The data follows the local header, its name and extra field
+        name_length, extra_length = struct.unpack("<HH", header[26:30])
+        offset = info.header_offset + 30 + name_length + extra_length
+        return self.path, offset, info.file_size
+
+
+class _TarFileSystem(ArchiveFileSystem):
+    def _open(self, info):
+        return io.BufferedReader(_RangeFile(self.path, *info), _CHUNK_SIZE)
+
+    def byte_range(self, path):
+        offset, size = self._info(path)
+        return self.path, offset, size
+
+
+class _RangeFile(io.RawIOBase):
+    """
+    A range of bytes of a file, read as a file.
+    """
+
+    def __init__(self, path: str, offset: int, size: int):
+        self._file = open(path, "rb", buffering=0)
+        self._offset = offset
+        self._size = size
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        size = min(len(buffer), self._size - self._position)
+        if size <= 0:
+            return 0
+        self._file.seek(self._offset + self._position)
+        read = self._file.readinto(memoryview(buffer)[:size])
+        self._position += read
+        return read
+
+    def seek(self, position: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            position += self._position
+        elif whence == io.SEEK_END:
+            position += self._size
+        if position < 0:
+            raise ValueError("Negative seek position")
+        self._position = position
+        return position
+
+    def tell(self) -> int:
+        return self._position
+
+    def close(self):
+        self._file.close()
+        super().close()
+
+
+def _index_tar(path: str) -> tuple[dict, list] | None:
+    """
+    Index the members of an uncompressed tar file, reading its headers only.
+
+    :param path: The tar file.
+    :return: The offset and size of each file, and the directories, or None if the tar file is
+             compressed or has sparse files, which cannot be read in place.
+    """
+    files, directories = {}, []
+    try:
+        with tarfile.open(path, "r:") as tar:
+            for member in tar:
+                name = posixpath.normpath(member.name).lstrip("/")
+                if member.issparse():
+                    return None
+                if member.isreg() and name != ".":
+                    files[name] = (member.offset_data, member.size)
+                elif member.isdir():
+                    directories.append(name)
+    except tarfile.ReadError:
+        return None
+    return files, directories
+
+
+def _load_tar(path: str) -> _TarFileSystem | None:
+    """
+    Open a tar file with its index, indexing it if the index is not persisted yet.
+    """
+    index_file = _cache_file("archive_index", path, ".json")
+    index = None
+    if index_file is not None and index_file.is_file():
+        try:
+            with open(index_file, "r") as f:
+                index = json.load(f)
+            index = {k: tuple(v) for k, v in index["files"].items()}, index["dirs"]
+        except (OSError, ValueError, KeyError):
+            index = None
+
+    if index is None:
+        index = _index_tar(path)
+        if index is None:
+            return None
+        if index_file is not None:
+            _write_json(index_file, {"files": index[0], "dirs": index[1]})
+    return _TarFileSystem(path, *index)
+
+
+# The archives opened in this process, by path, size and modification time
+_MOUNTED = {}
+
+
+def find_archive(path: str) -> str | None:
+    """
+    Find the zip or tar file a path is, or is in.
+
+    :param path: The path, of an archive or of a member of an archive.
+    :return: The archive, or None if the path is not in an archive.
+    """
+    archive = os.path.normpath(path)
+    while not os.path.exists(archive):
+        parent = os.path.dirname(archive)
+        if parent == archive:
+            return None
+        archive = parent
+    if os.path.isfile(archive) and (
+        zipfile.is_zipfile(archive) or tarfile.is_tarfile(archive)
+    ):
+        return archive
+    return None
+
+
+def mount(path: str) -> ArchiveFileSystem | None:
+    """
+    Open the archive a path is, or is in, to read its members in place.
+
+    The archives are opened once per process, so their listing is read once.
+
+    :param path: The path, of an archive or of a member of an archive.
+    :return: The file system of the archive, or None if the path is not in a zip or uncompressed
+             tar file.
+    """
+    archive = find_archive(path)
+    if archive is None:
+        return None
+
+    stat = os.stat(archive)
+    key = (archive, stat.st_size, stat.st_mtime_ns)
+    if key not in _MOUNTED:
+        if zipfile.is_zipfile(archive):
+            _MOUNTED[key] = _ZipFileSystem(archive)
+        else:
+            _MOUNTED[key] = _load_tar(archive)
+    return _MOUNTED[key]
+
+
+def extract_archive(path: str) -> str:
+    """
+    Extract a zip or tar file once, to a directory named by the sha256 of the archive.
+
+    The archive is extracted to a temporary directory first, renamed when complete, so concurrent
+    runs never read or write a partial extraction.
+
+    :param path: The archive.
+    :return: The directory the archive is extracted to.
+    """
+    directory = Path(_extraction_dir(), archive_hash(path))
+    if directory.is_dir():
+        return str(directory)
+
+    tmp_directory = tempfile.mkdtemp(dir=directory.parent, prefix=f"{directory.name}.")
+    try:
+        if zipfile.is_zipfile(path):
+            with zipfile.ZipFile(path, "r") as zip_ref:
+                zip_ref.extractall(tmp_directory)
+        else:
+            with tarfile.open(path, "r") as tar_ref:
+                # Members escaping the directory are refused, where Python supports it
+                if hasattr(tarfile, "data_filter"):
+                    tar_ref.extractall(tmp_directory, filter="data")
+                else:
+                    tar_ref.extractall(tmp_directory)
+        os.replace(tmp_directory, directory)
+    except OSError:
+        # Another process extracted the archive first
+        if not directory.is_dir():
+            raise
+    finally:
+        shutil.rmtree(tmp_directory, ignore_errors=True)
+    return str(directory)
+
+
+# The sha256 of the archives hashed in this process, by path, size and modification time
+_HASHES = {}
+
+
+def archive_hash(path: str) -> str:
+    """
+    Get the sha256 of an archive, hashed once per version of the archive.
+
+    :param path: The archive.
+    :return: The hex digest.
+    """
+    stat = os.stat(path)
+    key = (os.path.realpath(path), stat.st_size, stat.st_mtime_ns)
+    if key in _HASHES:
+        return _HASHES[key]
+
+    hash_file = _cache_file("archive_hash", path, "")
+    if hash_file is not None and hash_file.is_file():
+        _HASHES[key] = hash_file.read_text().strip()
+        return _HASHES[key]
+
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as file:
+        while chunk := file.read(_CHUNK_SIZE):
+            sha256.update(chunk)
+    _HASHES[key] = sha256.hexdigest()
+    if hash_file is not None:
+        try:
+            hash_file.parent.mkdir(parents=True, exist_ok=True)
+            hash_file.write_text(_HASHES[key])
+        except OSError:
+            pass
+    return _HASHES[key]
+
+
+def _extraction_dir() -> Path:
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        cache_dir = Path(tempfile.gettempdir(), "muse")
+    directory = Path(cache_dir, "extracted")
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+def _cache_file(kind: str, path: str, suffix: str) -> Path | None:
+    """
+    Get the file caching information about a version of an archive, or None without a cache.
+    """
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return None
+    stat = os.stat(path)
+    key = [_INDEX_VERSION, os.path.realpath(path), stat.st_size, stat.st_mtime_ns]
+    name = hashlib.sha1("\0".join(map(str, key)).encode("utf-8")).hexdigest()
+    return Path(cache_dir, kind, f"{name}{suffix}")
+
+
+def _write_json(path: Path, data: dict):
+    # Written to a temporary file first, so concurrent processes never read a partial file
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
@@ -1,12 +1,17 @@
 import os
-import re
-from typing import Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import Callable, Iterable, Iterator
 
 import pandas as pd
 
 from muse.data_importer.data_importer import Importer, split_text_by_regex
-from muse.data_importer.fetcher import get_resource_type, handle_uri
+from muse.data_importer.fetcher import get_resource_type, resolve_resource
+from muse.data_importer.filesystem import LOCAL
 from muse.data_importer.json.json_connector import JSONConnector
+from muse.data_importer.manifest import registry
+from muse.data_importer.selection import Selection
 from muse.data_manager.conversation.conversation import Conversation, TextUnit
 from muse.data_manager.document.document import Document
 from muse.data_manager.multi_document.multi_document import MultiDocument
@@ -28,40 +33,18 @@ class FolderConnector(Importer):
         We expect to have a RawData object, with a data field consisting of a list of RawData objects, each of which
         contains a conversation unit, we expect the temporal state to be in the metadata,
         encoded within the resource_name, along with any other relevant information, such as the speaker.
+
+    The folder is listed once, grouping the summary and metadata files with their text file by stem,
+    and the files are read by a pool of threads as `iter_data` gets to them, in sorted order.
+
+    The identifiers are selected by the selection options before their files are read, the metadata
+    filter excepted, which needs the metadata of the identifiers to be read.
+
+    The folders in zip and tar files are listed and read in place, see
+    `muse.data_importer.filesystem`.
     """
 
-    @with_valid_options(
-        summary_suffix={
-            "type": str,
-            "default": "_summary",
-            "help": "The suffix for the summary file.",
-        },
-        metadata_suffix={
-            "type": str,
-            "default": "_metadata",
-            "help": "The suffix for the metadata file.",
-        },
-        summary_file={
-            "type": str,
-            "default": "summary",
-            "help": "The name of the summary file.",
-        },
-        metadata_file={
-            "type": str,
-            "default": "metadata",
-            "help": "The name of the metadata file.",
-        },
-        multi_document_delimiter={
-            "type": str,
-            "default": "#DOCUMENT#",
-            "help": "The delimiter for multi documents (used within the column to separate documents).",
-        },
-        conversation_separator={
-            "type": str,
-            "default": r"#\w+#",
-            "help": "The regex to separate conversations.",
-        },
-    )
+    @with_valid_options(**registry.options("FolderConnector"))
     def __init__(self, options: dict[str, any] = None):
         self._invalid_reason = None
 
@@ -78,48 +61,42 @@ class FolderConnector(Importer):
             "multi_document_delimiter", "#DOCUMENT#"
         )
         self.conversation_delimiter = options.get("conversation_separator", r"#\w+#")
+        self.workers = options.get("workers", 8)
+        self.selection = Selection(options)
 
     def import_data(self, data_path, document_type):
+        return list(self.iter_data(data_path, document_type))
+
+    def iter_data(self, data_path, document_type, batch_size=1000):
+        data_path = resolve_resource(data_path)
         if not self.check_data(data_path, document_type):
             raise InvalidResourceError("Invalid data", self._invalid_reason)
 
         if document_type not in ["document", "multi-document", "conversation"]:
             raise ValueError("Invalid document type")
 
-        data_path = handle_uri(data_path)
-
-        if all([f.endswith(".json") for f in os.listdir(data_path)]):
-            files = []
-            for file in os.listdir(data_path):
-                with open(os.path.join(data_path, file), "r") as f:
-                    files.append(f.read())
-
-            if not all([JSONConnector.can_load_json(file) for file in files]):
-                raise InvalidResourceError("Invalid data", "JSON files are not valid")
-            else:
-                c = JSONConnector()
-                data = [c.load_single_json(file, document_type) for file in files]
-                return data
+        if all([f.endswith(".json") for f in data_path.entries]):
+            return self._iter_json_files(data_path, document_type, batch_size)
 
-        elif any([f.endswith(".json") for f in os.listdir(data_path)]):
+        # The metadata files of the text files are the only JSON files allowed among them
+        elif any(
+            f.endswith(".json") and not f.endswith(f"{self.metadata_suffix}.json")
+            for f in data_path.entries
+        ):
             raise InvalidResourceError(
                 "Invalid data", "Folder contains a mix of JSON and non-JSON files"
             )
 
-        data = self._read_data(data_path)
-
-        return self._import_folder(data, document_type)
+        return self._iter_folder(data_path, document_type, batch_size)
 
     def check_data(self, data_path, document_type):
-        data_path = handle_uri(data_path)
+        data_path = resolve_resource(data_path)
         data_type = get_resource_type(data_path)
         if data_type == "directory":
-            files = os.listdir(data_path)
             if any(
                 [
                     f.endswith(".source") or f.endswith(".target")
-                    for f in files
-                    if os.path.isfile(os.path.join(data_path, f))
+                    for f in data_path.files
                 ]
             ):
                 self._invalid_reason = "Directory contains .source or .target files, so is not valid for the folder connector"
@@ -127,184 +104,208 @@ class FolderConnector(Importer):
             return True
         return False
 
-    def _read_data(self, data_path):
-        df = pd.DataFrame()
-        files = os.listdir(data_path)
-
-        for identifier in [
-            f
-            for f in files
-            if (self.summary_suffix not in f and self.metadata_suffix not in f)
-            and os.path.isfile(os.path.join(data_path, f))
-        ]:
-            identifier_no_extension = identifier.rsplit(".", 1)[0]
-            summary = rf"{re.escape(identifier_no_extension)}{re.escape(self.summary_suffix)}.*"
-            if any([re.match(summary, f) for f in files]):
-                summary = [f for f in files if re.match(summary, f)][0]
-                summary = os.path.join(data_path, f"{summary}")
-                with open(summary, "r") as file:
-                    summary_data = file.read()
-            else:
-                summary_data = None
-
-            metadata = rf"{re.escape(identifier_no_extension)}{re.escape(self.metadata_suffix)}.json"
-            if any([re.match(metadata, f) for f in files]):
-                metadata = [f for f in files if re.match(metadata, f)][0]
-                metadata = os.path.join(data_path, f"{metadata}")
-                metadata_df = pd.read_json(metadata)
-            else:
-                metadata_df = pd.DataFrame()
-
-            with open(os.path.join(data_path, identifier), "r") as file:
-                text_data = file.read()
-
-            text_data = text_data.split(self.multi_document_delimiter)
-
-            data = {
-                "id": [identifier for _ in range(len(text_data))],
-                "text": text_data,
-                "summary": [summary_data for _ in range(len(text_data))],
-                **metadata_df,
-                "resource_name": [identifier for _ in range(len(text_data))],
-            }
-            frame = pd.DataFrame(data)
-            df = pd.concat([df, frame])
-
-        for identifier in [
-            f for f in files if os.path.isdir(os.path.join(data_path, f))
-        ]:
-            summary = rf"{re.escape(self.summary_file)}.*"
-            files_in_identifier = os.listdir(os.path.join(data_path, identifier))
-            if any([re.match(summary, f) for f in files_in_identifier]):
-                summary = [f for f in files_in_identifier if re.match(summary, f)][0]
-                summary = os.path.join(data_path, identifier, f"{summary}")
-                with open(summary, "r") as file:
-                    summary_data = file.read()
-            else:
-                summary_data = None
-
-            metadata = os.path.join(data_path, identifier, self.metadata_file)
-            metadata = rf"{re.escape(metadata)}.json"
-            if any([re.match(metadata, f) for f in files_in_identifier]):
-                metadata = [f for f in files_in_identifier if re.match(metadata, f)][0]
-                metadata = os.path.join(data_path, identifier, f"{metadata}")
-                metadata_df = pd.read_json(metadata)
+    def _iter_json_files(self, data_path, document_type, batch_size):
+        """
+        Iterate over the documents of a folder of JSON files, one per file, in sorted order.
+
+        Each file is parsed once, by the thread pool, and an invalid file raises an error naming it.
+        """
+        c = JSONConnector()
+        readers = [
+            partial(
+                c.load_json_file,
+                os.path.join(data_path, file),
+                document_type,
+                data_path.fs,
+            )
+            for file in sorted(data_path.entries)
+        ]
+        yield from self._read_selected(readers, batch_size, lambda d: d.metadata)
+
+    def _iter_folder(self, data_path, document_type, batch_size):
+        """
+        Iterate over the data of a folder, reading the files of the identifiers in a thread pool.
+
+        The identifiers are the text files and the directories of the folder, in sorted order.
+        """
+        create = {
+            "document": self._create_document,
+            "multi-document": self._create_multi_document,
+            "conversation": self._create_conversation,
+        }[document_type]
+        readers = [read for _, read in sorted(self._group_files(data_path).items())]
+
+        data = self._read_selected(readers, batch_size, lambda d: d[2])
+        for texts, summary, metadata in data:
+            # Directories without text files have no data
+            if texts:
+                yield create(texts, summary, metadata)
+
+    def _read_selected(
+        self,
+        readers: list[Callable[[], any]],
+        batch_size: int,
+        metadata: Callable[[any], dict[str, any]],
+    ) -> Iterator[any]:
+        """
+        Read the data of the selected identifiers. They are selected before they are read, by their
+        position only when there is a metadata filter, as the metadata has to be read first.
+
+        :param readers: The functions reading the data of each identifier, in order.
+        :param batch_size: The number of readers called at once.
+        :param metadata: Get the metadata of the data read, for the metadata filter.
+        :return: Iterator of the data read.
+        """
+        selection = self.selection
+        if not selection.metadata_filter:
+            return self._read(selection.select(readers), batch_size)
+        readers = selection.select_by_position(readers)
+        return selection.select_range(self._read(readers, batch_size), metadata)
+
+    def _read(
+        self, readers: Iterable[Callable[[], any]], batch_size: int
+    ) -> Iterator[any]:
+        """
+        Call the readers in the thread pool, a batch at a time, so the data read ahead of the
+        iteration is bounded by the batch size.
+
+        :param readers: The functions reading the data of each identifier.
+        :param batch_size: The number of readers called at once.
+        :return: Iterator of the data read, in the order of the readers.
+        """
+        readers = iter(readers)
+        with ThreadPoolExecutor(self.workers) as pool:
+            while batch := list(islice(readers, batch_size)):
+                # Each thread reads a slice of the batch, a task per file costs more than reading it
+                size = -(-len(batch) // self.workers)
+                slices = [batch[i : i + size] for i in range(0, len(batch), size)]
+                for data in pool.map(_read_all, slices):
+                    yield from data
+
+    def _group_files(self, data_path) -> dict[str, Callable[[], tuple]]:
+        """
+        Group the files of a folder by identifier, in a single pass over its listing.
+
+        The summary and metadata files of a text file share the stem of its name, followed by the
+        summary or metadata suffix. The files of a directory are listed when the directory is read.
+
+        :param data_path: The resolved folder.
+        :return: The function reading the texts, summary and metadata of each identifier.
+        """
+        texts, summaries, metadata = {}, {}, {}
+        metadata_end = f"{self.metadata_suffix}.json"
+        for name in data_path.files:
+            if self.summary_suffix in name:
+                stem = name[: name.index(self.summary_suffix)]
+                summaries.setdefault(stem, name)
+            elif self.metadata_suffix in name:
+                if name.endswith(metadata_end):
+                    metadata.setdefault(name[: -len(metadata_end)], name)
             else:
-                metadata_df = pd.DataFrame()
-
-            text_data = []
-            for file in [
-                f
-                for f in files_in_identifier
-                if self.summary_file not in f and self.metadata_file not in f
-            ]:
-                with open(os.path.join(data_path, identifier, file), "r") as f:
-                    text_data.append(f.read())
-
-            if len(text_data) == 1:
-                text_data = text_data[0].split(self.multi_document_delimiter)
-
-            data = {
-                "id": [identifier for _ in range(len(text_data))],
-                "text": text_data,
-                "summary": [summary_data for _ in range(len(text_data))],
-                **metadata_df,
-                "resource_name": [identifier for _ in range(len(text_data))],
-            }
-            frame = pd.DataFrame(data)
-            df = pd.concat([df, frame])
-
-        return df
-
-    def _import_folder(
-        self, data, document_type
-    ) -> Union[list[Document], list[MultiDocument], list[Conversation]]:
-        match document_type:
-            case "document":
-                return self._create_documents(data)
-            case "multi-document":
-                return self._create_multi_documents(data)
-            case "conversation":
-                return self._create_conversation(data)
-
-    def _create_documents(self, data) -> list[Document]:
-        documents = []
-        for index, group in data.groupby("id"):
-            group_dict = group.to_dict(orient="list")
-            if len(group_dict["text"]) > 1:
-                raise InvalidResourceError(
-                    "Invalid data", "Each group should have only one text"
-                )
-            documents.append(
-                self._create_document(
-                    group_dict["text"][0],
-                    group_dict["summary"][0],
-                    {
-                        col: group_dict[col][0]
-                        for col in data.columns
-                        if col not in ["text", "summary"]
-                    },
-                )
+                texts[name] = name.rsplit(".", 1)[0]
+
+        identifiers = {
+            name: partial(
+                self._read_file,
+                data_path,
+                name,
+                summaries.get(stem),
+                metadata.get(stem),
             )
+            for name, stem in texts.items()
+        }
+        for name in data_path.directories:
+            identifiers[name] = partial(self._read_directory, data_path, name)
+        return identifiers
+
+    def _read_file(self, data_path, identifier, summary_file, metadata_file):
+        fs = data_path.fs
+        with fs.open(os.path.join(data_path, identifier), "r") as file:
+            texts = file.read().split(self.multi_document_delimiter)
+
+        summary = None
+        if summary_file is not None:
+            with fs.open(os.path.join(data_path, summary_file), "r") as file:
+                summary = file.read()
+
+        metadata = None
+        if metadata_file is not None:
+            metadata = os.path.join(data_path, metadata_file)
+        return texts, summary, self._read_metadata(identifier, metadata, fs)
+
+    def _read_directory(self, data_path, identifier):
+        fs = data_path.fs
+        directory = os.path.join(data_path, identifier)
+        names = sorted(entry.name for entry in fs.scandir(directory) if entry.is_file)
+
+        summary = None
+        summary_file = next((n for n in names if n.startswith(self.summary_file)), None)
+        if summary_file is not None:
+            with fs.open(os.path.join(directory, summary_file), "r") as file:
+                summary = file.read()
+
+        metadata = None
+        if f"{self.metadata_file}.json" in names:
+            metadata = os.path.join(directory, f"{self.metadata_file}.json")
+
+        texts = []
+        for name in names:
+            if self.summary_file not in name and self.metadata_file not in name:
+                with fs.open(os.path.join(directory, name), "r") as file:
+                    texts.append(file.read())
+
+        if len(texts) == 1:
+            texts = texts[0].split(self.multi_document_delimiter)
+
+        return texts, summary, self._read_metadata(identifier, metadata, fs)
 
-        return documents
+    @staticmethod
+    def _read_metadata(identifier, metadata_path, fs=LOCAL) -> dict[str, any]:
+        """
+        Get the metadata of an identifier, from the first row of its metadata file if any.
+
+        :param identifier: The name of the text file or directory.
+        :param metadata_path: The metadata file, in a format read by `pandas.read_json`, or None.
+        :param fs: The file system of the metadata file.
+        :return: The metadata, with the identifier as id and resource name.
+        """
+        metadata = {}
+        if metadata_path is not None:
+            with fs.open(metadata_path, "rb") as file:
+                rows = pd.read_json(file).head(1).to_dict(orient="records")
+            metadata = rows[0] if rows else {}
+        return {"id": identifier, **metadata, "resource_name": identifier}
 
     @staticmethod
-    def _create_document(text, summary, metadata) -> Document:
-        return Document(text, summary, metadata)
-
-    def _create_multi_documents(self, data) -> list[MultiDocument]:
-        multidocs = []
-        for index, group in data.groupby("id"):
-            group_dict = group.to_dict(orient="list")
-            if len(group_dict["text"]) < 1:
-                raise InvalidResourceError(
-                    "Invalid data", "Each row should have at least one text"
-                )
-            multidocs.append(
-                MultiDocument(
-                    [
-                        self._create_document(text, None, None)
-                        for text in group_dict["text"]
-                    ],
-                    group_dict["summary"][0],
-                    {
-                        col: group_dict[col][0]
-                        for col in data.columns
-                        if col not in ["text", "summary"]
-                    },
-                )
+    def _create_document(texts, summary, metadata) -> Document:
+        if len(texts) > 1:
+            raise InvalidResourceError(
+                "Invalid data", "Each group should have only one text"
             )
+        return Document(texts[0], summary, metadata)
 
-        return multidocs
-
-    def _create_conversation(self, data) -> list[Conversation]:
-        conversations = []
-        for index, group in data.groupby("id"):
-            group_dict = group.to_dict(orient="list")
-            if len(group_dict["text"]) > 1:
-                raise InvalidResourceError(
-                    "Invalid data", "Each group should have only one text"
-                )
-            text = group_dict["text"][0]
-            conversation_units = split_text_by_regex(text, self.conversation_delimiter)
-            conversation_units = [
-                self._create_text_unit(unit) for unit in conversation_units
-            ]
-            conversations.append(
-                Conversation(
-                    conversation_units,
-                    group_dict["summary"][0],
-                    {
-                        col: group_dict[col][0]
-                        for col in data.columns
-                        if col not in ["text", "summary"]
-                    },
-                )
-            )
+    @staticmethod
+    def _create_multi_document(texts, summary, metadata) -> MultiDocument:
+        return MultiDocument(
+            [Document(text, None, None) for text in texts], summary, metadata
+        )
 
-        return conversations
+    def _create_conversation(self, texts, summary, metadata) -> Conversation:
+        if len(texts) > 1:
+            raise InvalidResourceError(
+                "Invalid data", "Each group should have only one text"
+            )
+        conversation_units = split_text_by_regex(texts[0], self.conversation_delimiter)
+        return Conversation(
+            [self._create_text_unit(unit) for unit in conversation_units],
+            summary,
+            metadata,
+        )
 
     @staticmethod
     def _create_text_unit(unit) -> TextUnit:
         return TextUnit(unit[1], unit[0])
+
+
+def _read_all(readers: list[Callable[[], any]]) -> list[any]:
+    return [read() for read in readers]
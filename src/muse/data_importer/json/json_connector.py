@@ -1,70 +1,274 @@
 import json
-from typing import Union
+import re
+from typing import IO, Iterator, Union
 
 from muse.data_importer.data_importer import Importer
-from muse.data_importer.fetcher import get_resource_type, handle_uri
+from muse.data_importer.fetcher import get_resource_type, resolve_resource
+from muse.data_importer.filesystem import LOCAL, FileSystem
+from muse.data_importer.manifest import registry
+from muse.data_importer.selection import Selection
 from muse.data_manager.conversation.conversation import Conversation, TextUnit
 from muse.data_manager.document.document import Document
 from muse.data_manager.multi_document.multi_document import MultiDocument
 from muse.utils.decorators import with_valid_options
 from muse.utils.resource_errors import InvalidResourceError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def parse_json(content: str | bytes) -> any:
+    """
+    Parse a JSON document, with orjson when it is installed, as it is several times faster.
+
+    The documents orjson rejects, such as those with NaN values, are parsed again by the json
+    module, so the result does not depend on orjson being installed.
+
+    :param content: The JSON document.
+    :return: The parsed data.
+    :raises json.JSONDecodeError: If the document is not valid JSON.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+
+# The size of the chunks the JSON files are read in, in characters
+_CHUNK_SIZE = 1 << 20
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+
+class _JSONStream:
+    """
+    Parser of a JSON document read in chunks, parsing its values one at a time, so only the value
+    being parsed is held in memory along with the chunk it is in.
+    """
+
+    def __init__(self, file: IO[str]):
+        self.file = file
+        self.buffer = ""
+        self.position = 0
+        self.eof = False
+
+    def _read(self, size: int = _CHUNK_SIZE) -> bool:
+        chunk = "" if self.eof else self.file.read(size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.position :] + chunk
+        self.position = 0
+        return True
+
+    def peek(self) -> str:
+        """
+        Skip the whitespace and get the next character, without consuming it.
+
+        :return: The next character, or an empty string at the end of the document.
+        """
+        while True:
+            self.position = _WHITESPACE.match(self.buffer, self.position).end()
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self._read():
+                return ""
+
+    def expect(self, character: str):
+        if self.peek() != character:
+            raise json.JSONDecodeError(
+                f"Expecting '{character}'", self.buffer, self.position
+            )
+        self.position += 1
+
+    def value(self) -> any:
+        """
+        Parse the next value, reading more of the document until the value is complete.
+
+        :return: The value.
+        :raises json.JSONDecodeError: If the value is not valid JSON.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.position)
+                # A number at the end of the buffer may go on in the next chunk
+                if end < len(self.buffer) or self.eof:
+                    self.position = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            # The reads grow with the value, so a large value is parsed a few times only
+            self._read(max(_CHUNK_SIZE, len(self.buffer)))
+
+    def array(self) -> Iterator[any]:
+        """
+        Parse the next value, an array, yielding its elements one at a time.
+        """
+        self.expect("[")
+        if self.peek() == "]":
+            self.position += 1
+            return
+        while True:
+            yield self.value()
+            character = self.peek()
+            if character == "]":
+                self.position += 1
+                return
+            self.expect(",")
+
+
+def iter_json_records(file: IO[str]) -> Iterator[any]:
+    """
+    Iterate over the records of a JSON document as it is parsed.
+
+    The records are the elements of a top-level array, or of the array under the "data" key of a
+    top-level object. Any other document is a single record, the "data" value of an object or the
+    document itself.
+
+    :param file: The JSON document opened in text mode.
+    :return: Iterator of the records.
+    :raises json.JSONDecodeError: If the document is not valid JSON, when the iteration reaches the
+                                  invalid part.
+    """
+    stream = _JSONStream(file)
+    start = stream.peek()
+    if start == "[":
+        yield from stream.array()
+        return
+    if start != "{":
+        yield stream.value()
+        return
+
+    stream.expect("{")
+    fields = {}
+    while stream.peek() != "}":
+        if fields:
+            stream.expect(",")
+        key = stream.value()
+        stream.expect(":")
+        if key == "data" and stream.peek() == "[":
+            yield from stream.array()
+            return
+        fields[key] = stream.value()
+    yield fields.get("data", fields)
+
+
+def iter_json_lines(file: IO[bytes], path: str) -> Iterator[any]:
+    """
+    Iterate over the records of a JSON Lines document, one per line, skipping the blank lines.
+
+    :param file: The document opened in binary mode.
+    :param path: The path of the document, for the errors.
+    :return: Iterator of the records.
+    :raises InvalidResourceError: If a line is not valid JSON.
+    """
+    return (_parse_line(line, path) for line in _iter_lines(file))
+
+
+def _iter_lines(file: IO[bytes]) -> Iterator[tuple[int, bytes]]:
+    """
+    Iterate over the numbered lines of a JSON Lines document holding a record.
+    """
+    return ((n, line) for n, line in enumerate(file, 1) if line.strip())
+
+
+def _parse_line(line: tuple[int, bytes], path: str) -> any:
+    number, content = line
+    try:
+        return parse_json(content)
+    except json.JSONDecodeError as e:
+        raise InvalidResourceError(path, f"Invalid JSON on line {number}: {e}")
+
+
+def _record_metadata(record: any) -> dict[str, any]:
+    meta = record.get("meta") if isinstance(record, dict) else None
+    return meta if isinstance(meta, dict) else {}
+
+
+# The extensions of the JSON Lines files, with a record per line
+_JSON_LINES = ["jsonl", "ndjson"]
+
 
 class JSONConnector(Importer):
     """
     JSONConnector is a class that imports data from a JSON file.
 
     It can also be used to import subdata, i.e. data stored as json within other structures such as CSV files.
+
+    The records are the elements of a top-level array, or of the array under a top-level "data" key,
+    or the lines of a JSON Lines file (.jsonl, .ndjson). The records are parsed as `iter_data` gets
+    to them, so only the record being parsed is held in memory, whatever the size of the file.
+
+    The records are selected by the selection options as they are parsed, with the metadata filter
+    applied on their "meta" object. The lines of JSON Lines files selected out by their position
+    are not parsed.
     """
 
-    @with_valid_options()
+    @with_valid_options(**registry.options("JSONConnector"))
     def __init__(self, options: dict[str, any] = None):
-        pass
+        self.selection = Selection(options)
 
     def import_data(self, data_path, document_type):
+        return list(self.iter_data(data_path, document_type))
+
+    def iter_data(self, data_path, document_type, batch_size=1000):
+        data_path = resolve_resource(data_path)
         if not self.check_data(data_path, document_type):
             raise ValueError("Invalid data path")
 
-        data_path = handle_uri(data_path)
-        with open(data_path, "r") as file:
-            data = json.load(file)
+        return self._iter_data(self._iter_records(data_path), document_type)
 
-        data = data.get("data", data)
+    def _iter_records(self, data_path) -> Iterator[any]:
+        selection = self.selection
+        if get_resource_type(data_path) in _JSON_LINES:
+            with data_path.fs.open(data_path, "rb") as file:
+                if selection.metadata_filter:
+                    records = iter_json_lines(file, data_path.uri)
+                    yield from selection.select(records, _record_metadata)
+                else:
+                    for line in selection.select(_iter_lines(file)):
+                        yield _parse_line(line, data_path.uri)
+            return
 
-        return self._import_data(data, document_type)
+        try:
+            with data_path.fs.open(data_path, "r", encoding="utf-8-sig") as file:
+                records = iter_json_records(file)
+                yield from selection.select(records, _record_metadata)
+        except json.JSONDecodeError as e:
+            raise InvalidResourceError(data_path.uri, f"Invalid JSON: {e}")
 
     def check_data(self, data_path, document_type):
-        data_path = handle_uri(data_path)
+        data_path = resolve_resource(data_path)
         data_type = get_resource_type(data_path)
-        if data_type != "file" and data_type != "json":
+        if data_type not in ["file", "json", *_JSON_LINES]:
             return False
 
-        try:
-            with open(data_path, "r") as file:
-                json.load(file)
-            return True
-        except json.JSONDecodeError:
-            return False
-        except FileNotFoundError:
-            return False
-        except IsADirectoryError:
-            return False
+        # Only the start of the file is sniffed, the file is validated when it is imported
+        return data_path.text_start()[:1] in ("{", "[")
 
     def _import_data(self, data, document_type):
-        if not isinstance(data, list):
+        return list(self._iter_data(data, document_type))
+
+    def _iter_data(self, data, document_type):
+        if isinstance(data, dict):
             data = [data]
         if document_type == "document":
-            return self._import_document(data)
+            return self._iter_documents(data)
         elif document_type == "multi-document":
-            return self._import_multi_document(data)
+            return self._iter_multi_documents(data)
         elif document_type == "conversation":
-            return self._import_conversation(data)
+            return self._iter_conversations(data)
         else:
             raise ValueError(f"Invalid document type: {document_type}")
 
     @staticmethod
-    def _import_document(data):
-        documents = []
+    def _iter_documents(data):
         for doc in data:
             text = doc.get("text", "")
             summary = doc.get("summary", "")
@@ -73,13 +277,10 @@ class JSONConnector(Importer):
                 raise InvalidResourceError("Text is required for a document")
             if not isinstance(meta, dict):
                 meta = {}
-            documents.append(Document(text, summary, meta))
-
-        return documents
+            yield Document(text, summary, meta)
 
     @staticmethod
-    def _import_multi_document(data):
-        multi_docs = []
+    def _iter_multi_documents(data):
         for multi_doc in data:
             summary = multi_doc.get("summary", "")
             meta = multi_doc.get("meta", {})
@@ -99,13 +300,10 @@ class JSONConnector(Importer):
                     doc_meta = {}
                 docs.append(Document(text, "", doc_meta))
 
-            multi_docs.append(MultiDocument(docs, summary, meta))
-
-        return multi_docs
+            yield MultiDocument(docs, summary, meta)
 
     @staticmethod
-    def _import_conversation(data):
-        conversations = []
+    def _iter_conversations(data):
         for conv in data:
             summary = conv.get("summary", "")
             meta = conv.get("meta", {})
@@ -132,27 +330,50 @@ class JSONConnector(Importer):
                     unit_meta = {}
                 conv_units.append(TextUnit(text, speaker, unit_meta))
 
-            conversations.append(Conversation(conv_units, summary, meta))
-
-        return conversations
+            yield Conversation(conv_units, summary, meta)
 
     def load_single_json(
         self, json_string: str, document_type: str
     ) -> Union[Document, MultiDocument, Conversation]:
         try:
-            data = json.loads(json_string)
-            data = self._import_data(data, document_type)
-            if len(data) == 1:
-                return data[0]
-            else:
-                raise InvalidResourceError("Expected a single document")
+            return self._load_single(parse_json(json_string), document_type)
         except json.JSONDecodeError:
             raise InvalidResourceError("Invalid JSON string")
 
+    def load_json_file(
+        self, path: str, document_type: str, fs: FileSystem = LOCAL
+    ) -> Union[Document, MultiDocument, Conversation]:
+        """
+        Load the single document of a JSON file, parsing it once.
+
+        :param path: The JSON file.
+        :param document_type: Type of document to import, either 'document', 'multi-document', or 'conversation'.
+        :param fs: The file system of the file, the local file system by default.
+        :return: The Document, MultiDocument, or Conversation object.
+        :raises InvalidResourceError: If the file is not valid JSON or not a single valid document, with the file
+                                      as the resource.
+        """
+        with fs.open(path, "rb") as file:
+            content = file.read()
+
+        try:
+            return self._load_single(parse_json(content), document_type)
+        except json.JSONDecodeError as e:
+            raise InvalidResourceError(str(path), f"Invalid JSON: {e}") from e
+        except InvalidResourceError as e:
+            raise InvalidResourceError(str(path), e.reason or e.resource) from e
+
+    def _load_single(self, data, document_type):
+        data = self._import_data(data, document_type)
+        if len(data) == 1:
+            return data[0]
+        else:
+            raise InvalidResourceError("Expected a single document")
+
     @staticmethod
     def can_load_json(json_string: str):
         try:
-            json.loads(json_string)
+            parse_json(json_string)
             return True
         except json.JSONDecodeError:
             return False
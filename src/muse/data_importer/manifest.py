@@ -0,0 +1,158 @@
+"""
+Declarations of the builtin data importers.
+
+Each importer is declared with the module it lives in and the options it accepts, so the importers
+can be listed and described without importing them. The importers are loaded when data is imported.
+Importers are tried in the order they are declared, after any plugin.
+"""
+
+from muse.data_importer.data_importer import Importer
+from muse.utils.registry import Registry
+
+registry = Registry(Importer)
+
+# The options selecting the records to import, common to the builtin importers
+_SELECTION = {
+    "limit": {
+        "type": int,
+        "default": None,
+        "help": "The maximum number of records to import, after the other selection options.",
+    },
+    "offset": {
+        "type": int,
+        "default": 0,
+        "help": "The number of selected records to skip before importing any.",
+    },
+    "sample_fraction": {
+        "type": float,
+        "default": 1.0,
+        "help": "The fraction of the records to import, drawn by hashing their position with the sample_seed.",
+    },
+    "sample_seed": {
+        "type": int,
+        "default": 0,
+        "help": "The seed of the sample drawn by sample_fraction.",
+    },
+    "num_shards": {
+        "type": int,
+        "default": 1,
+        "help": "The number of shards the records are split in, by their position.",
+    },
+    "shard_index": {
+        "type": int,
+        "default": 0,
+        "help": "The shard to import, from 0 to num_shards - 1.",
+    },
+    "metadata_filter": {
+        "type": dict,
+        "default": {},
+        "help": 'The metadata the records must have: a value, a list of values, or a range {"min": ..., "max": ...} with inclusive bounds, per key.',
+    },
+}
+
+registry.declare(
+    "ColumnarConnector",
+    "muse.data_importer.columnar.columnar_connector",
+    text_column={
+        "type": str,
+        "default": "text",
+        "help": "The column name for the text.",
+    },
+    summary_column={
+        "type": str,
+        "default": "summary",
+        "help": "The column name for the summary.",
+    },
+    metadata_columns={
+        "type": list[str],
+        "default": [],
+        "help": "The column names for the metadata. If an empty list, all columns except text and summary are considered metadata.",
+    },
+    csv_separator={
+        "type": str,
+        "default": ",",
+        "help": "The separator for the csv file.",
+    },
+    multi_doc_id_column={
+        "type": str,
+        "default": "multi_doc_id",
+        "help": "The column name for the multi document id.",
+    },
+    multi_document_delimiter={
+        "type": str,
+        "default": "#DOCUMENT#",
+        "help": "The delimiter for multi documents (used within the column to separate documents).",
+    },
+    conversation_separator={
+        "type": str,
+        "default": r"#\w+#",
+        "help": "The regex to separate conversations.",
+    },
+    **_SELECTION,
+)
+
+registry.declare(
+    "JSONConnector", "muse.data_importer.json.json_connector", **_SELECTION
+)
+
+registry.declare(
+    "FolderConnector",
+    "muse.data_importer.folder.folder_connector",
+    summary_suffix={
+        "type": str,
+        "default": "_summary",
+        "help": "The suffix for the summary file.",
+    },
+    metadata_suffix={
+        "type": str,
+        "default": "_metadata",
+        "help": "The suffix for the metadata file.",
+    },
+    summary_file={
+        "type": str,
+        "default": "summary",
+        "help": "The name of the summary file.",
+    },
+    metadata_file={
+        "type": str,
+        "default": "metadata",
+        "help": "The name of the metadata file.",
+    },
+    multi_document_delimiter={
+        "type": str,
+        "default": "#DOCUMENT#",
+        "help": "The delimiter for multi documents (used within the column to separate documents).",
+    },
+    conversation_separator={
+        "type": str,
+        "default": r"#\w+#",
+        "help": "The regex to separate conversations.",
+    },
+    workers={
+        "type": int,
+        "default": 8,
+        "help": "The number of threads reading the files.",
+    },
+    **_SELECTION,
+)
+
+registry.declare(
+    "SourceTargetConnector",
+    "muse.data_importer.source_target.source_target_connector",
+    separator={
+        "type": str,
+        "default": "\n",
+        "help": "The separator for the source and target.",
+    },
+    multi_document_delimiter={
+        "type": str,
+        "default": "#DOCUMENT#",
+        "help": "The delimiter for multi documents (used within the column to separate documents).",
+    },
+    conversation_separator={
+        "type": str,
+        "default": r"#\w+#",
+        "help": "The regex to separate conversations.",
+    },
+    **_SELECTION,
+)
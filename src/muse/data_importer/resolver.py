@@ -1,6 +1,8 @@
-from typing import Union
+from typing import Iterator, Union
 
 from muse.data_importer.data_importer import Importer
+from muse.data_importer.fetcher import resolve_resource
+from muse.data_importer.manifest import registry
 from muse.data_manager.conversation.conversation import Conversation
 from muse.data_manager.document.document import Document
 from muse.data_manager.multi_document.multi_document import MultiDocument
@@ -15,6 +17,9 @@ def import_data(
     Import raw data from a given path. we first try to import the data using the plugins, if that fails, we try to import
     the data using the builtin importers.
 
+    The path is fetched, extracted and sniffed once, and the resolved resource is given to the importers, so checking
+    which importer to use does not touch the data again.
+
     :param data_path: Path to the data to be imported.
     :param document_type: Type of document to import, either 'document' or 'multi-document' or 'conversation'.
     :param language: Language of the document.
@@ -22,44 +27,71 @@ def import_data(
     :return: Raw data.
     """
 
-    importers = Importer.__subclasses__()
-    importers.sort(key=lambda x: x.plugin, reverse=True)
-    for importer in importers:
+    resource = resolve_resource(data_path)
+    for importer in registry.load_all():
+        importer = importer(options)
+        if importer.check_data(resource, str(document_type)):
+            return importer.import_data(resource, str(document_type))
+
+    raise UnknownResourceError(data_path)
+
+
+def iter_data(
+    data_path: str,
+    document_type: str,
+    language: str,
+    options: dict[str, any] = None,
+    batch_size: int = 1000,
+) -> Iterator[Union[Document, MultiDocument, Conversation]]:
+    """
+    Iterate over the raw data of a given path, resolving the importer like `import_data`.
+
+    The importer is resolved right away, so unknown resources are reported before iterating.
+
+    :param data_path: Path to the data to be imported.
+    :param document_type: Type of document to import, either 'document' or 'multi-document' or 'conversation'.
+    :param language: Language of the document.
+    :param options: Options to initialize the data importer.
+    :param batch_size: The number of documents the importer reads at once.
+    :return: Iterator of raw data.
+    """
+
+    resource = resolve_resource(data_path)
+    for importer in registry.load_all():
         importer = importer(options)
-        if importer.check_data(data_path, str(document_type)):
-            return importer.import_data(data_path, str(document_type))
+        if importer.check_data(resource, str(document_type)):
+            return importer.iter_data(resource, str(document_type), batch_size)
 
     raise UnknownResourceError(data_path)
 
 
 def get_available_importers() -> list[str]:
     """
-    Get all the available importers.
+    Get all the available importers, without importing them.
 
     :return: List of available importers.
     """
 
-    return [importer.__name__ for importer in Importer.__subclasses__()]
+    return registry.names()
 
 
 def get_importers_options() -> list[tuple[str, dict[str, any]]]:
     """
-    Get the options for all the available importers.
+    Get the options for all the available importers, without importing them.
 
     :return: List of tuples containing the name of the importer and its options.
     """
 
-    return [
-        (
-            importer.__name__,
-            (
-                importer.__init__.valid_options()
-                if hasattr(importer.__init__, "valid_options")
-                else {}
-            ),
-        )
-        for importer in Importer.__subclasses__()
-    ]
+    return registry.describe()
 
 
-import_from_plugin("importer", Importer, "data_importer", "importers", "data_importers")
+registry.add_discovery(
+    lambda: import_from_plugin(
+        "importer",
+        Importer,
+        "data_importer",
+        "importers",
+        "data_importers",
+        registry=registry,
+    )
+)
@@ -0,0 +1,253 @@
+"""
+Selection of the records of a resource, by the options common to the builtin importers.
+
+The records are numbered by their position in the resource, in the order they are imported. A
+record is selected if it belongs to the shard, to the sample and matches the metadata filter, then
+the first `offset` selected records are skipped and at most `limit` records are kept, like the
+WHERE, OFFSET and LIMIT of SQL.
+
+The shards and samples only depend on the positions of the records, so the importers select the
+records before reading them: a sample of 1% of a resource reads about 1% of it, where the format
+allows it. The sample is drawn by hashing the positions with the seed, so it is the same on every
+run and every machine, and a larger fraction selects a superset of the records of a smaller one.
+"""
+
+from typing import Callable, Iterable, Iterator, Sequence, TypeVar
+
+import numpy as np
+
+__all__ = ["Selection"]
+
+T = TypeVar("T")
+
+_MASK = (1 << 64) - 1
+# The size of the blocks of positions hashed at once
+_BLOCK_SIZE = 1 << 16
+
+
+def _mix(x: int) -> int:
+    """
+    The splitmix64 finalizer, a cheap hash of 64-bit integers with well-distributed bits.
+    """
+    x = (x + 0x9E3779B97F4A7C15) & _MASK
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK
+    return x ^ (x >> 31)
+
+
+def _mix_array(x: np.ndarray) -> np.ndarray:
+    """
+    The splitmix64 finalizer of an array of uint64, wrapping around like `_mix`.
+    """
+    with np.errstate(over="ignore"):
+        x = x + np.uint64(0x9E3779B97F4A7C15)
+        x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+class _Window:
+    """
+    The offset and limit of a selection, counted down as the selected records go by.
+    """
+
+    def __init__(self, offset: int, limit: int | None):
+        self.skip = offset
+        self.left = limit
+
+    @property
+    def done(self) -> bool:
+        return self.left == 0
+
+    def take(self, count: int) -> tuple[int, int]:
+        """
+        Take the next selected records.
+
+        :param count: The number of records selected next.
+        :return: The start and stop of the records of them to keep.
+        """
+        start = min(self.skip, count)
+        self.skip -= start
+        stop = count if self.left is None else min(count, start + self.left)
+        if self.left is not None:
+            self.left -= stop - start
+        return start, stop
+
+
+class Selection:
+    """
+    The records of a resource to import, from the selection options of an importer.
+    """
+
+    def __init__(self, options: dict[str, any] = None):
+        """
+        :param options: The options of the importer, only the selection options are used.
+        :raises ValueError: If an option is out of its range.
+        """
+        if options is None:
+            options = {}
+
+        self.limit = options.get("limit")
+        self.offset = options.get("offset", 0)
+        self.sample_fraction = options.get("sample_fraction", 1.0)
+        self.sample_seed = options.get("sample_seed", 0)
+        self.num_shards = options.get("num_shards", 1)
+        self.shard_index = options.get("shard_index", 0)
+        self.metadata_filter = options.get("metadata_filter", {})
+
+        if self.limit is not None and self.limit < 0:
+            raise ValueError("limit must not be negative")
+        if self.offset < 0:
+            raise ValueError("offset must not be negative")
+        if not 0 <= self.sample_fraction <= 1:
+            raise ValueError("sample_fraction must be between 0 and 1")
+        if self.num_shards < 1:
+            raise ValueError("num_shards must be at least 1")
+        if not 0 <= self.shard_index < self.num_shards:
+            raise ValueError("shard_index must be between 0 and num_shards - 1")
+        for key, condition in self.metadata_filter.items():
+            if isinstance(condition, dict) and not set(condition) <= {"min", "max"}:
+                raise ValueError(f"Invalid range for '{key}', expected min and max")
+
+        self._seed = _mix(self.sample_seed & _MASK)
+        self._threshold = int(self.sample_fraction * (1 << 64))
+
+    @property
+    def by_position(self) -> bool:
+        """
+        Whether the records are selected by their position, for a shard or a sample.
+        """
+        return self.num_shards > 1 or self.sample_fraction < 1
+
+    def __bool__(self) -> bool:
+        return (
+            self.by_position
+            or bool(self.metadata_filter)
+            or bool(self.offset)
+            or self.limit is not None
+        )
+
+    def keeps(self, position: int) -> bool:
+        """
+        Check if a record belongs to the shard and the sample.
+
+        :param position: The position of the record in the resource.
+        :return: True if the record is selected by its position.
+        """
+        if position % self.num_shards != self.shard_index:
+            return False
+        if self.sample_fraction < 1:
+            return _mix((self._seed + position) & _MASK) < self._threshold
+        return True
+
+    def keep_mask(self, start: int, count: int) -> np.ndarray:
+        """
+        Check if consecutive records belong to the shard and the sample, like `keeps`.
+
+        :param start: The position of the first record.
+        :param count: The number of records.
+        :return: The boolean mask of the records selected by their position.
+        """
+        positions = np.arange(start, start + count, dtype=np.uint64)
+        mask = positions % np.uint64(self.num_shards) == np.uint64(self.shard_index)
+        if self.sample_fraction < 1:
+            with np.errstate(over="ignore"):
+                hashes = _mix_array(positions + np.uint64(self._seed))
+            mask &= hashes < np.uint64(self._threshold)
+        return mask
+
+    def matches(self, metadata: dict[str, any]) -> bool:
+        """
+        Check if the metadata of a record matches the metadata filter.
+
+        :param metadata: The metadata of the record, a missing key has the value None.
+        :return: True if the record is selected by its metadata.
+        """
+        for key, condition in self.metadata_filter.items():
+            value = metadata.get(key)
+            if isinstance(condition, dict):
+                if value is None:
+                    return False
+                if "min" in condition and value < condition["min"]:
+                    return False
+                if "max" in condition and value > condition["max"]:
+                    return False
+            elif isinstance(condition, list):
+                if value not in condition:
+                    return False
+            elif value != condition:
+                return False
+        return True
+
+    def window(self) -> _Window:
+        """
+        Start counting the offset and limit, for the importers selecting the records in blocks.
+        """
+        return _Window(self.offset, self.limit)
+
+    def select(
+        self,
+        records: Iterable[T],
+        metadata: Callable[[T], dict[str, any]] | None = None,
+    ) -> Iterator[T]:
+        """
+        Select records, stopping the iteration over them at the limit.
+
+        :param records: The records of the resource, or handles to read them, in order.
+        :param metadata: Get the metadata of a record, needed if there is a metadata filter.
+        :return: Iterator of the selected records.
+        """
+        return self.select_range(self.select_by_position(records), metadata)
+
+    def select_by_position(self, records: Iterable[T]) -> Iterator[T]:
+        """
+        Select the records of the shard and the sample, for the importers selecting the records
+        before reading their metadata.
+
+        :param records: The records of the resource, or handles to read them, in order.
+        :return: Iterator of the records selected by their position.
+        """
+        if not self.by_position:
+            return iter(records)
+        return (r for i, r in enumerate(records) if self.keeps(i))
+
+    def select_range(
+        self,
+        records: Iterable[T],
+        metadata: Callable[[T], dict[str, any]] | None = None,
+    ) -> Iterator[T]:
+        """
+        Select records already selected by their position, by their metadata, offset and limit.
+
+        :param records: The records selected by position.
+        :param metadata: Get the metadata of a record, needed if there is a metadata filter.
+        :return: Iterator of the selected records.
+        """
+        window = self.window()
+        if window.done:
+            return
+        for record in records:
+            if self.metadata_filter and not self.matches(metadata(record)):
+                continue
+            start, stop = window.take(1)
+            if start < stop:
+                yield record
+                if window.done:
+                    return
+
+    def blocks(self, start: int, count: int) -> Iterator[Sequence[int]]:
+        """
+        Select consecutive records by their position a block at a time, for the importers with
+        random access to the records, which only read the selected ones.
+
+        :param start: The position of the first record.
+        :param count: The number of records.
+        :return: Iterator of the indexes of the selected records, from 0 to count - 1, in blocks.
+        """
+        for block in range(0, count, _BLOCK_SIZE):
+            size = min(_BLOCK_SIZE, count - block)
+            if self.by_position:
+                mask = self.keep_mask(start + block, size)
+                yield (block + np.flatnonzero(mask)).tolist()
+            else:
+                yield range(block, block + size)
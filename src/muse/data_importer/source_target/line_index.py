@@ -0,0 +1,176 @@
+"""
+Indexes of the records of text files, such as the lines of .source and .target files.
+
+A file is memory-mapped and the offsets of its separators are found once, then persisted in the
+MUSE_CACHE directory, keyed by the path, size and modification time of the file. Any record can then
+be read without reading the records before it, so the files can be iterated over, sampled or
+sharded without holding them in memory.
+
+The files in zip and tar files are mapped in place when they are stored without compression, as a
+range of the archive, and are extracted otherwise.
+"""
+
+import hashlib
+import mmap
+import os
+from array import array
+from pathlib import Path
+from typing import Iterator
+
+from muse.data_importer.filesystem import LOCAL, FileSystem
+from muse.utils.env import get_cache_dir
+
+__all__ = ["LineIndex"]
+
+_INDEX_VERSION = 1
+
+
+class LineIndex:
+    """
+    Records of a text file split by a separator, like `str.split`, read from a memory map.
+
+    The files are decoded as UTF-8 with universal new lines, like text files opened by Python.
+    """
+
+    def __init__(self, path: str | Path, separator: str = "\n", fs: FileSystem = LOCAL):
+        """
+        Map the file and load its index, building it if it is not persisted yet.
+
+        :param path: The text file.
+        :param separator: The separator of the records.
+        :param fs: The file system of the file, the local file system by default.
+        :raises ValueError: If the separator is empty.
+        """
+        if not separator:
+            raise ValueError("Empty separator")
+
+        self.path = Path(path)
+        self.separator = separator
+        self._separator = separator.encode("utf-8")
+        location = fs.byte_range(str(path))
+        if location is None:
+            location = fs.local_path(str(path)), 0, None
+        file, offset, size = location
+        self._file = open(file, "rb")
+        if size is None:
+            size = os.fstat(self._file.fileno()).st_size
+        self._size = size
+        # The file is the range of the map from its start, maps start at a multiple of the
+        # allocation granularity
+        self._start = offset % mmap.ALLOCATIONGRANULARITY
+        # Empty files cannot be mapped, and hold a single empty record
+        self._map = b""
+        if size:
+            self._map = mmap.mmap(
+                self._file.fileno(),
+                self._start + size,
+                access=mmap.ACCESS_READ,
+                offset=offset - self._start,
+            )
+        self._offset = offset
+
+        self._offsets = self._load_index()
+        if self._offsets is None:
+            self._offsets = self._build_index()
+            self._save_index()
+
+    def _index_file(self) -> Path | None:
+        cache_dir = get_cache_dir()
+        if cache_dir is None:
+            return None
+        stat = os.fstat(self._file.fileno())
+        key = [_INDEX_VERSION, os.path.realpath(self._file.name), stat.st_size]
+        key += [stat.st_mtime_ns, self.separator]
+        # The files in archives are keyed by their range of the archive too
+        if self._offset or self._size != stat.st_size:
+            key += [self._offset, self._size]
+        name = hashlib.sha1("\0".join(map(str, key)).encode("utf-8")).hexdigest()
+        return Path(cache_dir, "line_index", f"{name}.idx")
+
+    def _load_index(self) -> array | None:
+        index_file = self._index_file()
+        if index_file is None or not index_file.is_file():
+            return None
+
+        offsets = array("q")
+        try:
+            with open(index_file, "rb") as f:
+                offsets.frombytes(f.read())
+        except (OSError, ValueError):
+            return None
+        # The offsets end with the size of the file
+        if not offsets or offsets[-1] != self._size:
+            return None
+        return offsets
+
+    def _build_index(self) -> array:
+        """
+        Find the offsets of the separators, followed by the size of the file.
+        """
+        offsets = array("q")
+        start, end = self._start, self._start + self._size
+        position = self._map.find(self._separator, start, end)
+        while position != -1:
+            offsets.append(position - start)
+            position = self._map.find(
+                self._separator, position + len(self._separator), end
+            )
+        offsets.append(self._size)
+        return offsets
+
+    def _save_index(self):
+        index_file = self._index_file()
+        if index_file is None:
+            return
+
+        # Written to a temporary file first, so concurrent processes never read a partial index
+        try:
+            index_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = index_file.with_name(f"{index_file.name}.{os.getpid()}.tmp")
+            with open(tmp_file, "wb") as f:
+                f.write(self._offsets.tobytes())
+            os.replace(tmp_file, index_file)
+        except OSError:
+            pass
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, index: int) -> str:
+        """
+        Read a record.
+
+        :param index: The index of the record, negative indexes count from the end.
+        :return: The text of the record, without its separator.
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("record index out of range")
+
+        start = self._start
+        if index:
+            start += self._offsets[index - 1] + len(self._separator)
+        end = self._start + self._offsets[index]
+        # The \r of a \r\n is part of the new line, as in the files opened in text mode
+        if self.separator == "\n" and end > start and self._map[end - 1] == 13:
+            end -= 1
+        text = self._map[start:end].decode("utf-8")
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "LineIndex":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -1,11 +1,23 @@
 import os
+from contextlib import contextmanager
+from typing import Iterator
 
 from muse.data_importer.data_importer import Importer, split_text_by_regex
-from muse.data_importer.fetcher import get_resource_type, handle_uri
+from muse.data_importer.fetcher import (
+    Resource,
+    get_resource_type,
+    handle_uri,
+    resolve_resource,
+)
+from muse.data_importer.filesystem import LOCAL, FileSystem
+from muse.data_importer.manifest import registry
+from muse.data_importer.selection import Selection
+from muse.data_importer.source_target.line_index import LineIndex
 from muse.data_manager.conversation.conversation import Conversation, TextUnit
 from muse.data_manager.document.document import Document
 from muse.data_manager.multi_document.multi_document import MultiDocument
 from muse.utils.decorators import with_valid_options
+from muse.utils.resource_errors import InvalidResourceError
 
 
 class SourceTargetConnector(Importer):
@@ -14,25 +26,16 @@ class SourceTargetConnector(Importer):
 
     The data path is either expected to be a dir containing one or more pairs of .source and .target files,
     or a single file (either .source or .target), where the other file is expected to be in the same directory.
+
+    Each line of the files is a document by default. The files are memory-mapped and the offsets of
+    their documents are indexed, see `LineIndex`, so they are read one document at a time. The
+    documents are selected by the selection options before they are read, so only the selected
+    documents are read, even with a metadata filter as their metadata is only their resource name.
+
+    The pairs in zip and tar files are read in place, see `muse.data_importer.filesystem`.
     """
 
-    @with_valid_options(
-        separator={
-            "type": str,
-            "default": "\n",
-            "help": "The separator for the source and target.",
-        },
-        multi_document_delimiter={
-            "type": str,
-            "default": "#DOCUMENT#",
-            "help": "The delimiter for multi documents (used within the column to separate documents).",
-        },
-        conversation_separator={
-            "type": str,
-            "default": r"#\w+#",
-            "help": "The regex to separate conversations.",
-        },
-    )
+    @with_valid_options(**registry.options("SourceTargetConnector"))
     def __init__(self, options: dict[str, any] = None):
         if options is None:
             options = {}
@@ -43,134 +46,152 @@ class SourceTargetConnector(Importer):
             "multi_document_delimiter", "#DOCUMENT#"
         )
         self.conversation_delimiter = options.get("conversation_separator", r"#\w+#")
+        self.selection = Selection(options)
+        self._pairs = None
 
     def import_data(self, data_path, document_type):
+        return list(self.iter_data(data_path, document_type))
+
+    def iter_data(self, data_path, document_type, batch_size=1000):
+        data_path = resolve_resource(data_path)
         if not self.check_data(data_path, document_type):
             raise ValueError("Invalid data path")
 
-        _data_path = handle_uri(data_path)
-        data_type = get_resource_type(_data_path)
-
-        if data_type == "file":
-            if data_path.endswith(".source"):
-                source_path = _data_path
-                target_path = data_path.replace(".source", ".target")
-            else:
-                target_path = _data_path
-                source_path = data_path.replace(".target", ".source")
-            with (
-                open(source_path, "r") as source_file,
-                open(target_path, "r") as target_file,
-            ):
-                source = source_file.read()
-                target = target_file.read()
-                meta = os.path.basename(source_path)
-            files = [(source, target, meta)]
-        else:
-            files = []
-            for root, dirs, f in os.walk(_data_path):
-                source_files = [f for f in f if f.endswith(".source")]
-                for source_file in source_files:
-                    target_file = source_file.replace(".source", ".target")
-                    with (
-                        open(os.path.join(root, source_file), "r") as s,
-                        open(os.path.join(root, target_file), "r") as t,
-                    ):
-                        source = s.read()
-                        target = t.read()
-                        meta = os.path.basename(source_file)
-                    files.append((source, target, meta))
-
-        return self._import_source_docs(files, document_type)
+        pairs = self._find_pairs(data_path)
+        return self._iter_source_docs(pairs, document_type, data_path.fs)
 
     def check_data(self, data_path, document_type):
-        _data_path = handle_uri(data_path)
-        data_type = get_resource_type(_data_path)
+        return self._find_pairs(resolve_resource(data_path)) is not None
+
+    def _find_pairs(self, data_path: Resource) -> list[tuple[str, str]] | None:
+        """
+        Find the .source and .target files of a resource, once for both checking and importing it.
+
+        :param data_path: The resolved directory or .source or .target file.
+        :return: The paths of the .source and .target file of each pair, or None if the resource is
+                 not made of pairs.
+        """
+        if self._pairs is not None and self._pairs[0] is data_path:
+            return self._pairs[1]
+
+        data_type = get_resource_type(data_path)
+        pairs = []
         if data_type == "directory":
-            for root, dirs, files in os.walk(_data_path):
-                source_files = [f for f in files if f.endswith(".source")]
-                target_files = [f for f in files if f.endswith(".target")]
-                if len(source_files) != len(target_files):
-                    return False
-                for source_file in source_files:
-                    target_file = source_file.replace(".source", ".target")
-                    if target_file not in target_files:
-                        return False
-        elif data_type == "file":
-            if not _data_path.endswith(".source") and not _data_path.endswith(
-                ".target"
-            ):
-                return False
+            for root, dirs, files in data_path.tree:
+                source_files = sorted(f for f in files if f.endswith(".source"))
+                target_files = {f for f in files if f.endswith(".target")}
+                targets = [f.replace(".source", ".target") for f in source_files]
+                if set(targets) != target_files:
+                    pairs = None
+                    break
+                pairs.extend(
+                    (os.path.join(root, source), os.path.join(root, target))
+                    for source, target in zip(source_files, targets)
+                )
+        elif data_type in ["source", "target"]:
+            other_file = self._other_file(data_path)
+            if not data_path.fs.isfile(other_file):
+                pairs = None
+            elif data_type == "source":
+                pairs = [(str(data_path), other_file)]
             else:
-                if data_path.endswith(".source"):
-                    other_file = data_path.replace(".source", ".target")
-                else:
-                    other_file = data_path.replace(".target", ".source")
-
-                other_path = handle_uri(other_file)
-                other_type = get_resource_type(other_path)
-                if other_type != "file":
-                    return False
+                pairs = [(other_file, str(data_path))]
         else:
-            return False
-
-        return True
-
-    def _import_source_docs(self, files, document_type):
+            pairs = None
+
+        self._pairs = (data_path, pairs)
+        return pairs
+
+    @staticmethod
+    def _other_file(data_path: Resource) -> str:
+        """
+        Get the path to the other file of a .source/.target pair, fetching it if the pair is remote.
+
+        :param data_path: The resolved .source or .target file.
+        :return: The path to the .target or .source file.
+        """
+
+        def swap(path: str) -> str:
+            if path.endswith(".source"):
+                return path[: -len(".source")] + ".target"
+            return path[: -len(".target")] + ".source"
+
+        other_path = swap(str(data_path))
+        if not data_path.fs.isfile(other_path) and data_path.uri != str(data_path):
+            try:
+                other_path = handle_uri(swap(data_path.uri))
+            except FileNotFoundError:
+                pass
+        return other_path
+
+    def _iter_source_docs(self, files, document_type, fs=LOCAL):
         if document_type == "conversation":
-            return self._import_conversations(files)
+            create = self._create_conversation
         elif document_type == "multi_document":
-            return self._import_multi_document(files)
+            create = self._create_multi_document
         else:
-            return self._import_single_document(files)
-
-    def _import_single_document(self, files):
-        documents = []
-        for source, target, meta in files:
-            source_documents = source.split(self.separator)
-            target_documents = target.split(self.separator)
-            assert len(source_documents) == len(target_documents)
-            for i, (s, t) in enumerate(zip(source_documents, target_documents)):
-                documents.append(Document(s, t, {"resource_name": f"{meta}-{i}"}))
-
-        return documents
-
-    def _import_multi_document(self, files):
-        multi_documents = []
-        for source, target, meta in files:
-            source_documents = source.split(self.separator)
-            target_documents = target.split(self.separator)
-            assert len(source_documents) == len(target_documents)
-            for i, (s, t) in enumerate(zip(source_documents, target_documents)):
-                docs = s.split(self.multi_document_delimiter)
-                multi_documents.append(
-                    MultiDocument(
-                        [Document(d, t) for d in docs if d],
-                        t,
-                        {"resource_name": f"{meta}-{i}"},
-                    )
+            create = self._create_document
+
+        selection = self.selection
+        window = selection.window()
+        position = 0
+        for source_path, target_path in files:
+            if window.done:
+                return
+            meta = os.path.basename(source_path)
+            with self._open_pair(source_path, target_path, fs) as (sources, targets):
+                for indexes in selection.blocks(position, len(sources)):
+                    if selection.metadata_filter:
+                        indexes = [
+                            i
+                            for i in indexes
+                            if selection.matches({"resource_name": f"{meta}-{i}"})
+                        ]
+                    start, stop = window.take(len(indexes))
+                    for i in indexes[start:stop]:
+                        metadata = {"resource_name": f"{meta}-{i}"}
+                        yield create(sources[i], targets[i], metadata)
+                    if window.done:
+                        return
+                position += len(sources)
+
+    @contextmanager
+    def _open_pair(
+        self, source_path: str, target_path: str, fs: FileSystem = LOCAL
+    ) -> Iterator[tuple]:
+        """
+        Open the indexes of the records of a pair of files.
+
+        :param source_path: The .source file.
+        :param target_path: The .target file.
+        :param fs: The file system of the files.
+        :return: Context manager of the indexes of the source and target documents.
+        :raises InvalidResourceError: If the files do not have the same number of documents.
+        """
+        with (
+            LineIndex(source_path, self.separator, fs) as sources,
+            LineIndex(target_path, self.separator, fs) as targets,
+        ):
+            if len(sources) != len(targets):
+                raise InvalidResourceError(
+                    source_path,
+                    f"{len(sources)} documents, but the target {target_path} has "
+                    f"{len(targets)}",
                 )
-
-        return multi_documents
-
-    def _import_conversations(self, files):
-        conversations = []
-        for source, target, meta in files:
-            source_documents = source.split(self.separator)
-            target_documents = target.split(self.separator)
-            assert len(source_documents) == len(target_documents)
-            for i, (s, t) in enumerate(zip(source_documents, target_documents)):
-                conversation_units = split_text_by_regex(s, self.conversation_delimiter)
-                conversations.append(
-                    Conversation(
-                        [
-                            TextUnit(unit[1], unit[0])
-                            for unit in conversation_units
-                            if unit
-                        ],
-                        t,
-                        {"resource_name": f"{meta}-{i}"},
-                    )
-                )
-
-        return conversations
+            yield sources, targets
+
+    @staticmethod
+    def _create_document(source, target, metadata) -> Document:
+        return Document(source, target, metadata)
+
+    def _create_multi_document(self, source, target, metadata) -> MultiDocument:
+        docs = source.split(self.multi_document_delimiter)
+        return MultiDocument([Document(d, target) for d in docs if d], target, metadata)
+
+    def _create_conversation(self, source, target, metadata) -> Conversation:
+        conversation_units = split_text_by_regex(source, self.conversation_delimiter)
+        return Conversation(
+            [TextUnit(unit[1], unit[0]) for unit in conversation_units if unit],
+            target,
+            metadata,
+        )
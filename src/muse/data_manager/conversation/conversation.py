@@ -1,23 +1,48 @@
-class TextUnit:
+import sys
+
+from muse.data_manager.text_cache import CachedText, Parts
+
+
+class TextUnit(CachedText):
+    __slots__ = ("text", "speaker", "metadata")
+    # Rendered once for the text of the conversation, which is the one cached
+    _cache_text = False
+
     def __init__(self, text: str, speaker: str, metadata: dict | None = None):
+        super().__init__()
         self.text = text
         self.speaker = speaker
         self.metadata = metadata
 
-    def __str__(self):
+    def __setattr__(self, name: str, value: any):
+        # The few speakers of a corpus are shared by all their text units
+        if name == "speaker" and type(value) is str:
+            value = sys.intern(value)
+        super().__setattr__(name, value)
+
+    def _render(self) -> str:
         return f"{str(self.speaker)}: {str(self.text)}"
 
 
-class Conversation:
+class Conversation(CachedText):
+    __slots__ = ("text_units", "summary", "metadata")
+
     def __init__(
         self,
         text_units: list[TextUnit],
         summary: str | None = None,
         metadata: dict | None = None,
     ):
+        super().__init__()
         self.text_units = text_units
         self.summary = summary
         self.metadata = metadata
 
-    def __str__(self):
+    def __setattr__(self, name: str, value: any):
+        if name == "text_units":
+            # Copied, so the cached text follows the changes made through the object
+            value = Parts(self, value)
+        super().__setattr__(name, value)
+
+    def _render(self) -> str:
         return "\n".join([str(text_unit) for text_unit in self.text_units])
@@ -1,10 +1,16 @@
-class Document:
+from muse.data_manager.text_cache import CachedText
+
+
+class Document(CachedText):
+    __slots__ = ("text", "summary", "metadata")
+
     def __init__(
         self, text: str, summary: str | None = None, metadata: dict | None = None
     ):
+        super().__init__()
         self.text = text
         self.summary = summary
         self.metadata = metadata
 
-    def __str__(self):
+    def _render(self) -> str:
         return str(self.text)
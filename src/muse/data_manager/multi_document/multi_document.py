@@ -1,16 +1,26 @@
 from muse.data_manager.document.document import Document
+from muse.data_manager.text_cache import CachedText, Parts
 
 
-class MultiDocument:
+class MultiDocument(CachedText):
+    __slots__ = ("documents", "summary", "metadata")
+
     def __init__(
         self,
         documents: list[Document],
         summary: str | None = None,
         metadata: dict | None = None,
     ):
+        super().__init__()
         self.documents = documents
         self.summary = summary
         self.metadata = metadata
 
-    def __str__(self):
+    def __setattr__(self, name: str, value: any):
+        if name == "documents":
+            # Copied, so the cached text follows the changes made through the object
+            value = Parts(self, value)
+        super().__setattr__(name, value)
+
+    def _render(self) -> str:
         return "\n".join([str(document) for document in self.documents])
@@ -0,0 +1,172 @@
+"""
+Caching of the text rendering of the data objects.
+
+The text of a document, multi-document or conversation is rendered once and cached until the object
+changes: assigning any of its attributes, modifying the list of its parts, or changing one of its
+parts clears the cached text of the object and of the objects containing it. The parts only hold
+weak references to the objects containing them, so that an object and its parts do not make a
+reference cycle.
+
+The lists of parts are copied when assigned, as the changes to the list given can not be followed:
+the parts are changed through the object, such as `multi_document.documents.append(document)`.
+"""
+
+import weakref
+
+__all__ = ["CachedText", "Parts"]
+
+
+class CachedText:
+    """
+    Base of the data objects, caching the text returned by `_render` until the object changes.
+
+    The public attributes are declared by `__slots__` in the subclasses, and `_fields` lists them.
+    Objects whose text is cheap to render, and only read through the objects containing them, can
+    set `_cache_text` to False to save the memory of their cached text.
+    """
+
+    __slots__ = ("_text", "_owners", "__weakref__")
+    _fields: tuple[str, ...] = ()
+    _cache_text = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._fields = tuple(
+            name
+            for klass in reversed(cls.__mro__)
+            for name in klass.__dict__.get("__slots__", ())
+            if not name.startswith("_")
+        )
+
+    def __init__(self):
+        object.__setattr__(self, "_text", None)
+        object.__setattr__(self, "_owners", ())
+
+    def __setattr__(self, name: str, value: any):
+        object.__setattr__(self, name, value)
+        self._invalidate()
+
+    def __delattr__(self, name: str):
+        object.__delattr__(self, name)
+        self._invalidate()
+
+    def _invalidate(self):
+        object.__setattr__(self, "_text", None)
+        for reference in getattr(self, "_owners", ()):
+            owner = reference()
+            if owner is not None:
+                owner._invalidate()
+
+    def _own(self, part: "CachedText"):
+        # The parts of an object clear its cached text when they change, the owners that no longer
+        # exist are dropped
+        if not isinstance(part, CachedText):
+            return
+        owners = tuple(owner for owner in part._owners if owner() is not None)
+        if not any(owner() is self for owner in owners):
+            owners = (*owners, weakref.ref(self))
+        object.__setattr__(part, "_owners", owners)
+
+    def _render(self) -> str:
+        raise NotImplementedError
+
+    def __str__(self) -> str:
+        text = self._text
+        if text is None:
+            text = self._render()
+            if self._cache_text:
+                object.__setattr__(self, "_text", text)
+        return text
+
+    # Only the public attributes are copied or pickled, the cache is rebuilt on demand
+    def __getstate__(self) -> dict[str, any]:
+        state = {name: getattr(self, name) for name in self._fields}
+        if hasattr(self, "__dict__"):
+            state.update(self.__dict__)
+        return state
+
+    def __setstate__(self, state: dict[str, any]):
+        CachedText.__init__(self)
+        for name, value in state.items():
+            setattr(self, name, value)
+
+
+class Parts(list):
+    """
+    List of the parts of a data object, such as the text units of a conversation, clearing the
+    cached text of the object when modified.
+    """
+
+    __slots__ = ("_owner",)
+
+    def __init__(self, owner: CachedText, parts=()):
+        super().__init__(parts)
+        # The owner holds the list, which only holds a weak reference back to it
+        self._owner = weakref.ref(owner)
+        for part in self:
+            owner._own(part)
+
+    def _changed(self, parts=()):
+        owner = self._owner()
+        if owner is None:
+            return
+        for part in parts:
+            owner._own(part)
+        owner._invalidate()
+
+    def __reduce__(self):
+        # Copied or pickled as a plain list, which the owner wraps again
+        return list, (list(self),)
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._changed(self if isinstance(index, slice) else (value,))
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._changed()
+
+    def __iadd__(self, parts):
+        size = len(self)
+        super().__iadd__(parts)
+        self._changed(self[size:])
+        return self
+
+    def __imul__(self, count):
+        super().__imul__(count)
+        self._changed()
+        return self
+
+    def append(self, part):
+        super().append(part)
+        self._changed((part,))
+
+    def extend(self, parts):
+        size = len(self)
+        super().extend(parts)
+        self._changed(self[size:])
+
+    def insert(self, index, part):
+        super().insert(index, part)
+        self._changed((part,))
+
+    def pop(self, index=-1):
+        part = super().pop(index)
+        self._changed()
+        return part
+
+    def remove(self, part):
+        super().remove(part)
+        self._changed()
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._changed()
+
+    def reverse(self):
+        super().reverse()
+        self._changed()
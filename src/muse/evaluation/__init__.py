@@ -1,4 +1,10 @@
-from muse.evaluation.classical import *
 from muse.evaluation.evaluation import Evaluation
-from muse.evaluation.llm import *
+from muse.evaluation.manifest import registry
 from muse.evaluation.resolver import get_available_evaluators, resolve_evaluator
+
+
+def __getattr__(name: str):
+    # Builtin metrics are only imported on first access, see muse.evaluation.manifest
+    if name in registry:
+        return registry.load(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
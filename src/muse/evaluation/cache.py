@@ -0,0 +1,158 @@
+"""
+Persistent cache of the results of the evaluation metrics, per summary.
+
+The metrics evaluated per item (see `Evaluation.per_item`) have the results of each summary stored
+in a SQLite database in the MUSE_CACHE directory, keyed by a hash of the metric (its class and
+options) and of the summary, reference summary and reference text. A metric is then only computed
+for the summaries without cached results, which are merged back in order before being aggregated.
+"""
+
+import json
+
+from muse.evaluation.evaluation import Evaluation
+from muse.utils.cache import Cache
+
+__all__ = ["MetricCache", "evaluation_identity", "evaluation_items"]
+
+
+def evaluation_identity(
+    evaluation: Evaluation, options: dict[str, any] | None = None
+) -> dict[str, any]:
+    """
+    Identify an evaluation metric, so the results of different metrics are never mixed up.
+
+    :param evaluation: The evaluation metric.
+    :param options: The options the metric was created with.
+    :return: The class and options of the metric.
+    """
+    cls = evaluation.__class__
+    return {
+        "evaluation": f"{cls.__module__}.{cls.__qualname__}",
+        "options": options or {},
+    }
+
+
+def evaluation_items(
+    evaluation: Evaluation,
+    summary: list[str],
+    reference_text: list[str] | None = None,
+    reference_summary: list[str] | None = None,
+) -> list[tuple[str, str | None, str | None]] | None:
+    """
+    Get the inputs of each item evaluated, for the metrics evaluated per item.
+
+    :param evaluation: The evaluation metric.
+    :param summary: The summaries to be evaluated.
+    :param reference_text: The reference texts (optional).
+    :param reference_summary: The reference summaries (optional).
+    :return: The summary, reference summary and reference text of each item, or None if the metric
+             is not evaluated per item or there is not one reference per summary.
+    """
+    references = [r for r in (reference_text, reference_summary) if r is not None]
+    if (
+        not evaluation.per_item
+        or not summary
+        or any(len(r) != len(summary) for r in references)
+    ):
+        return None
+
+    return [
+        (
+            str(summary[i]),
+            None if reference_summary is None else str(reference_summary[i]),
+            None if reference_text is None else str(reference_text[i]),
+        )
+        for i in range(len(summary))
+    ]
+
+
+def _select(texts: list | None, indices: list[int]) -> list | None:
+    return None if texts is None else [texts[i] for i in indices]
+
+
+class MetricCache(Cache):
+    """
+    Persistent cache of the results of the evaluation metrics for each summary, see `Cache`.
+    """
+
+    file_name = "metrics.sqlite"
+
+    def evaluate(
+        self,
+        evaluation: Evaluation,
+        options: dict[str, any] | None,
+        summary: list[str],
+        reference_text: list[str] | None = None,
+        reference_summary: list[str] | None = None,
+    ) -> tuple[dict[str, any], dict[str, int] | None]:
+        """
+        Evaluate the summaries, only computing the results of the summaries not in the cache.
+
+        Metrics that are not evaluated per item, or inputs that are not one reference per summary,
+        are evaluated as usual.
+
+        :param evaluation: The evaluation metric.
+        :param options: The options the metric was created with.
+        :param summary: The summaries to be evaluated.
+        :param reference_text: The reference texts (optional).
+        :param reference_summary: The reference summaries (optional).
+        :return: The evaluation results, and the hits, misses and evictions of the cache, or None
+                 if the cache was not used.
+        """
+        if not evaluation_items(evaluation, summary, reference_text, reference_summary):
+            results = evaluation.evaluate(
+                summary,
+                reference_text=reference_text,
+                reference_summary=reference_summary,
+            )
+            return results, None
+
+        items, stats = self.evaluate_items(
+            evaluation, options, summary, reference_text, reference_summary
+        )
+        return evaluation.aggregate(items), stats
+
+    def evaluate_items(
+        self,
+        evaluation: Evaluation,
+        options: dict[str, any] | None,
+        summary: list[str],
+        reference_text: list[str] | None = None,
+        reference_summary: list[str] | None = None,
+    ) -> tuple[list[dict[str, any]], dict[str, int]]:
+        """
+        Evaluate each summary on its own, only computing the results of the summaries not in the
+        cache. The metric must be evaluated per item, see `evaluation_items`.
+
+        :param evaluation: The evaluation metric.
+        :param options: The options the metric was created with.
+        :param summary: The summaries to be evaluated.
+        :param reference_text: The reference texts (optional).
+        :param reference_summary: The reference summaries (optional).
+        :return: The results of each summary, and the hits, misses and evictions of the cache.
+        """
+        items = evaluation_items(evaluation, summary, reference_text, reference_summary)
+        keys = self.keys(evaluation_identity(evaluation, options), items)
+        cached = self.get(keys)
+
+        missing = [i for i, key in enumerate(keys) if key not in cached]
+        computed = []
+        if missing:
+            computed = evaluation.evaluate_items(
+                _select(summary, missing),
+                reference_text=_select(reference_text, missing),
+                reference_summary=_select(reference_summary, missing),
+            )
+        evicted = self.put(
+            {keys[i]: json.dumps(item) for i, item in zip(missing, computed)}
+        )
+
+        merged = [json.loads(cached[key]) if key in cached else None for key in keys]
+        for i, item in zip(missing, computed):
+            merged[i] = item
+        stats = {
+            "hits": len(keys) - len(missing),
+            "misses": len(missing),
+            "evicted": evicted,
+        }
+        return merged, stats
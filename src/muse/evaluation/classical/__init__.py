@@ -1,4 +1,10 @@
-from muse.evaluation.classical.bleu_metric import BleuMetric
-from muse.evaluation.classical.meteor_metric import MeteorMetric
-from muse.evaluation.classical.rouge_metric import RougeMetric
-from muse.evaluation.classical.bertscore_metric import BertScoreMetric
+from muse.evaluation.manifest import registry
+
+__all__ = ["BleuMetric", "MeteorMetric", "RougeMetric", "BertScoreMetric"]
+
+
+def __getattr__(name: str):
+    # The metrics are only imported on first access, see muse.evaluation.manifest
+    if name in __all__:
+        return registry.load(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
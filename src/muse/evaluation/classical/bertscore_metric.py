@@ -1,8 +1,11 @@
 import bert_score
+import torch
 
 from muse.evaluation.evaluation import Evaluation
+from muse.evaluation.manifest import registry
 from muse.utils.decorators import with_valid_options
 
+
 class BertScoreMetric(Evaluation):
     """
     Class to evaluate the BertScore metric
@@ -10,9 +13,9 @@ class BertScoreMetric(Evaluation):
     BertScore only applies to comparing summaries and reference summaries
     """
 
-    @with_valid_options(
-        avg={"type": bool, "default": False, "help": "Whether to average the scores"}
-    )
+    per_item = True
+
+    @with_valid_options(**registry.options("BertScoreMetric"))
     def __init__(self, options):
         if not options:
             options = {}
@@ -39,28 +42,59 @@ class BertScoreMetric(Evaluation):
                 "The number of summaries and reference summaries should be the same"
             )
 
-        if len(summary) == 1:
-            return self._evaluate_single(summary, reference_summary)
-        else:
-            return self._evaluate_multi(summary, reference_summary)
-
-    def _evaluate_single(self, summary, reference_summary):
-        bert_score_res = self.bertscore.score(summary, reference_summary, lang=self.lang)
-        return {
-            "bert_score": bert_score_res,
-        }
+        return self.aggregate(
+            self.evaluate_items(summary, reference_summary=reference_summary)
+        )
 
-    def _evaluate_multi(self, summary, reference_summary):
+    def evaluate_items(self, summary, reference_text=None, reference_summary=None):
         summary = [str(s) for s in summary]
         reference_summary = [str(rs) for rs in reference_summary]
-        bert_score_res = self.bertscore.score(summary, reference_summary, lang=self.lang)
-        results = [float(bert_score_res[0][0]) for i in range(len(bert_score_res))]
+        precision, recall, f1 = self.bertscore.score(
+            summary, reference_summary, lang=self.lang
+        )
+        return [
+            {"precision": float(p), "recall": float(r), "f1": float(f)}
+            for p, r, f in zip(precision, recall, f1)
+        ]
+
+    def aggregate(self, items):
+        if len(items) == 1:
+            # The precision, recall and f1 tensors, as returned by bert_score
+            return {
+                "bert_score": tuple(
+                    torch.tensor([items[0][score]])
+                    for score in ("precision", "recall", "f1")
+                ),
+            }
+
+        results = [item["f1"] for item in items]
         if self.avg:
             return {
                 "bert_score": sum(results) / len(results),
             }
-        
+
         return {
             "bert_score": results,
         }
 
+    def accumulate(self, total, items):
+        # Only the average can be computed without keeping each score
+        if not self.avg:
+            return None
+
+        if total is None:
+            total = {"count": 0, "first": None, "f1": 0}
+        for item in items:
+            if total["first"] is None:
+                total["first"] = item
+            total["count"] += 1
+            total["f1"] += item["f1"]
+        return total
+
+    def aggregate_total(self, total):
+        if total["count"] == 1:
+            return self.aggregate([total["first"]])
+
+        return {
+            "bert_score": total["f1"] / total["count"],
+        }
@@ -2,6 +2,7 @@ from nltk import download, word_tokenize
 from nltk.translate.bleu_score import corpus_bleu
 
 from muse.evaluation.evaluation import Evaluation
+from muse.evaluation.manifest import registry
 from muse.utils.decorators import with_valid_options
 
 
@@ -12,7 +13,7 @@ class BleuMetric(Evaluation):
     BLEU only applies to comparing summaries and reference summaries
     """
 
-    @with_valid_options()
+    @with_valid_options(**registry.options("BleuMetric"))
     def __init__(self, options):
         if not options:
             options = {}
@@ -2,6 +2,7 @@ from nltk import download, word_tokenize
 from nltk.translate import meteor
 
 from muse.evaluation.evaluation import Evaluation
+from muse.evaluation.manifest import registry
 from muse.utils.decorators import with_valid_options
 
 
@@ -12,7 +13,9 @@ class MeteorMetric(Evaluation):
     METEOR only applies to comparing summaries and reference summaries
     """
 
-    @with_valid_options()
+    per_item = True
+
+    @with_valid_options(**registry.options("MeteorMetric"))
     def __init__(self, options):
         if not options:
             options = {}
@@ -27,23 +30,20 @@ class MeteorMetric(Evaluation):
                 "The number of summaries and reference summaries should be the same"
             )
 
-        if len(summary) == 1:
-            return self._evaluate_single(summary[0], reference_summary[0])
-        else:
-            return self._evaluate_multi(summary, reference_summary)
-
-    @staticmethod
-    def _evaluate_single(summary, reference_summary):
-        meteor_score = meteor(
-            [word_tokenize(str(reference_summary))], word_tokenize(str(summary))
+        return self.aggregate(
+            self.evaluate_items(summary, reference_summary=reference_summary)
         )
-        return {"meteor_scores": meteor_score, "meteor": meteor_score}
 
-    @staticmethod
-    def _evaluate_multi(summary, reference_summary):
-        summary = [word_tokenize(str(s)) for s in summary]
-        reference_summary = [word_tokenize(str(rs)) for rs in reference_summary]
-        meteor_score = [meteor([rs], s) for s, rs in zip(summary, reference_summary)]
+    def evaluate_items(self, summary, reference_text=None, reference_summary=None):
+        return [
+            {"meteor": meteor([word_tokenize(str(rs))], word_tokenize(str(s)))}
+            for s, rs in zip(summary, reference_summary)
+        ]
+
+    def aggregate(self, items):
+        meteor_score = [item["meteor"] for item in items]
+        if len(meteor_score) == 1:
+            return {"meteor_scores": meteor_score[0], "meteor": meteor_score[0]}
         return {
             "meteor_scores": meteor_score,
             "meteor": sum(meteor_score) / len(meteor_score),
@@ -1,6 +1,7 @@
 from rouge import Rouge
 
 from muse.evaluation.evaluation import Evaluation
+from muse.evaluation.manifest import registry
 from muse.utils.decorators import with_valid_options
 
 
@@ -11,9 +12,9 @@ class RougeMetric(Evaluation):
     ROUGE only applies to comparing summaries and reference summaries
     """
 
-    @with_valid_options(
-        avg={"type": bool, "default": False, "help": "Whether to average the scores"}
-    )
+    per_item = True
+
+    @with_valid_options(**registry.options("RougeMetric"))
     def __init__(self, options):
         if not options:
             options = {}
@@ -36,21 +37,57 @@ class RougeMetric(Evaluation):
                 "The number of summaries and reference summaries should be the same"
             )
 
-        if len(summary) == 1:
-            return self._evaluate_single(summary[0], reference_summary[0])
-        else:
-            return self._evaluate_multi(summary, reference_summary)
+        return self.aggregate(
+            self.evaluate_items(summary, reference_summary=reference_summary)
+        )
+
+    def evaluate_items(self, summary, reference_text=None, reference_summary=None):
+        return [
+            self.rouge.get_scores(str(s), str(rs))[0]
+            for s, rs in zip(summary, reference_summary)
+        ]
+
+    def aggregate(self, items):
+        if len(items) == 1 or not self.avg:
+            return {
+                "rouge_score": items,
+            }
 
-    def _evaluate_single(self, summary, reference_summary):
-        rouge_score = self.rouge.get_scores(str(summary), str(reference_summary))
+        # Averaged as rouge does, each score summed in order then divided
         return {
-            "rouge_score": rouge_score,
+            "rouge_score": {
+                metric: {
+                    stat: sum(item[metric][stat] for item in items) / len(items)
+                    for stat in scores
+                }
+                for metric, scores in items[0].items()
+            },
         }
 
-    def _evaluate_multi(self, summary, reference_summary):
-        summary = [str(s) for s in summary]
-        reference_summary = [str(rs) for rs in reference_summary]
-        rouge_score = self.rouge.get_scores(summary, reference_summary, avg=self.avg)
+    def accumulate(self, total, items):
+        # Only the average can be computed without keeping each score
+        if not self.avg:
+            return None
+
+        if total is None:
+            total = {"count": 0, "first": None, "sums": {}}
+        for item in items:
+            if total["first"] is None:
+                total["first"] = item
+            total["count"] += 1
+            for metric, scores in item.items():
+                sums = total["sums"].setdefault(metric, {})
+                for stat, score in scores.items():
+                    sums[stat] = sums.get(stat, 0) + score
+        return total
+
+    def aggregate_total(self, total):
+        if total["count"] == 1:
+            return self.aggregate([total["first"]])
+
         return {
-            "rouge_score": rouge_score,
+            "rouge_score": {
+                metric: {stat: score / total["count"] for stat, score in sums.items()}
+                for metric, sums in total["sums"].items()
+            },
         }
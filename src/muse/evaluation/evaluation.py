@@ -7,6 +7,8 @@ class Evaluation(ABC):
     """
 
     plugin = False
+    # Whether the results are computed for each summary on its own, see `evaluate_items`
+    per_item = False
 
     @abstractmethod
     def __init__(self, params: dict[str, any]):
@@ -44,3 +46,62 @@ class Evaluation(ABC):
         if not hasattr(cls.__init__, "valid_options"):
             return {}
         return cls.__init__.valid_options()
+
+    def evaluate_items(
+        self,
+        summary: list[str],
+        reference_text: list[str] | None = None,
+        reference_summary: list[str] | None = None,
+    ) -> list[dict[str, any]]:
+        """
+        Evaluate each summary on its own, for metrics with `per_item` set
+
+        The results of each summary must be serializable to JSON, so they can be cached, and
+        `aggregate` combines them into the results of `evaluate`.
+
+        :param summary: The summaries to be evaluated
+        :param reference_text: The reference texts, one per summary (optional)
+        :param reference_summary: The reference summaries, one per summary (optional)
+        :return: The results of each summary
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} is not evaluated per item"
+        )
+
+    def aggregate(self, items: list[dict[str, any]]) -> dict[str, any]:
+        """
+        Combine the results of each summary into the evaluation results, for metrics with `per_item` set
+
+        :param items: The results of each summary, as returned by `evaluate_items`
+        :return: The evaluation results
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} is not evaluated per item"
+        )
+
+    def accumulate(
+        self, total: dict[str, any] | None, items: list[dict[str, any]]
+    ) -> dict[str, any] | None:
+        """
+        Add the results of some summaries to a running total, for metrics with `per_item` set whose
+        results can be computed without keeping the results of each summary
+
+        The totals are only kept in memory, while streaming, and `aggregate_total` turns them into
+        the results of `evaluate`. The results must be added in the order of the summaries.
+
+        :param total: The running total, None before the first results
+        :param items: The results of the next summaries, as returned by `evaluate_items`
+        :return: The new running total, or None if the metric needs the results of each summary
+        """
+        return None
+
+    def aggregate_total(self, total: dict[str, any]) -> dict[str, any]:
+        """
+        Turn a running total into the evaluation results, for metrics implementing `accumulate`
+
+        :param total: The running total, as returned by `accumulate`
+        :return: The evaluation results
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not keep a running total"
+        )
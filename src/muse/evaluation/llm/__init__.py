@@ -1 +1,10 @@
-from muse.evaluation.llm.ollama_metric import OllamaMetric
+from muse.evaluation.manifest import registry
+
+__all__ = ["OllamaMetric"]
+
+
+def __getattr__(name: str):
+    # The metrics are only imported on first access, see muse.evaluation.manifest
+    if name in __all__:
+        return registry.load(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,6 +5,7 @@ from scipy.spatial.distance import cosine
 from sentence_transformers import SentenceTransformer
 
 from muse.evaluation.evaluation import Evaluation
+from muse.evaluation.manifest import registry
 from muse.utils.decorators import with_valid_options
 
 similarity_languages = {
@@ -31,35 +32,9 @@ class OllamaMetric(Evaluation):
     Class to evaluate the OLLAMA metric
     """
 
-    @with_valid_options(
-        key_facts_model={
-            "type": str,
-            "default": "mistral-small",
-            "help": "The model to use for key facts",
-        },
-        similarity_model={
-            "type": str,
-            "default": "sentence-transformers/distiluse-base-multilingual-cased-v1",
-            "help": "The model to use for similarity",
-        },
-        reference_free={
-            "type": bool,
-            "default": True,
-            "help": "Whether to use reference text for key facts",
-        },
-        similarity_threshold={
-            "type": float,
-            "default": 0.5,
-            "help": "The similarity threshold",
-        },
-        similarity_pair_method={
-            "type": str,
-            "default": "max",
-            "help": "The similarity pair method",
-        },
-        language_source={"type": str, "default": "en", "help": "The source language"},
-        language_target={"type": str, "default": "en", "help": "The target language"},
-    )
+    per_item = True
+
+    @with_valid_options(**registry.options("OllamaMetric"))
     def __init__(self, options):
         if not options:
             options = {}
@@ -142,8 +117,25 @@ class OllamaMetric(Evaluation):
                 "The number of summaries and reference summaries should be the same"
             )
 
+        return self.aggregate(
+            self.evaluate_items(summary, reference_text, reference_summary)
+        )
+
+    def evaluate_items(self, summary, reference_text=None, reference_summary=None):
+        return self._evaluate_multi(summary, reference_text, reference_summary)
+
+    def aggregate(self, items):
+        # The pairs of key facts are lists once the results are cached
         return {
-            "ollama": self._evaluate_multi(summary, reference_text, reference_summary)
+            "ollama": [
+                {
+                    **item,
+                    "key_fact_correspondence": [
+                        tuple(pair) for pair in item["key_fact_correspondence"]
+                    ],
+                }
+                for item in items
+            ]
         }
 
     def _evaluate_single(self, summary, reference_text, reference_summary):
@@ -167,7 +159,9 @@ class OllamaMetric(Evaluation):
         density = self.calculate_density(key_fact_correspondence)
 
         return {
-            "score": self.score_method([float(factuality), float(completeness), float(density)]),
+            "score": self.score_method(
+                [float(factuality), float(completeness), float(density)]
+            ),
             "factuality": float(factuality),
             "completeness": float(completeness),
             "density": float(density),
@@ -198,11 +192,11 @@ class OllamaMetric(Evaluation):
         )
         response = self._query_model(self.key_fact_model, prompt)["response"]
         response = re.sub(r"^\s*[\•\-\*\d]+[\s\.)]*", "", response, flags=re.MULTILINE)
-        response = re.sub(r'<(\w+)>(.*?)</\1>', '', response, flags=re.DOTALL)
-        response = re.sub(r'\[.*?\]', '', response)
+        response = re.sub(r"<(\w+)>(.*?)</\1>", "", response, flags=re.DOTALL)
+        response = re.sub(r"\[.*?\]", "", response)
         response_lines = response.split("\n")
         if response_lines:
-            response_lines[0] = re.sub(r'^[^:\n]*?:\s*', '', response_lines[0])
+            response_lines[0] = re.sub(r"^[^:\n]*?:\s*", "", response_lines[0])
 
         response = "\n".join(response_lines)
 
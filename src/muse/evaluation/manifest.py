@@ -0,0 +1,56 @@
+"""
+Declarations of the builtin evaluation metrics.
+
+Each metric is declared with the module it lives in and the options it accepts, so the metrics can
+be listed, described and configured without importing nltk, bert_score, ollama or
+sentence_transformers. The module of a metric is only imported when the metric is resolved.
+"""
+
+from muse.evaluation.evaluation import Evaluation
+from muse.utils.registry import Registry
+
+registry = Registry(Evaluation)
+
+registry.declare("BleuMetric", "muse.evaluation.classical.bleu_metric")
+registry.declare("MeteorMetric", "muse.evaluation.classical.meteor_metric")
+registry.declare(
+    "RougeMetric",
+    "muse.evaluation.classical.rouge_metric",
+    avg={"type": bool, "default": False, "help": "Whether to average the scores"},
+)
+registry.declare(
+    "BertScoreMetric",
+    "muse.evaluation.classical.bertscore_metric",
+    avg={"type": bool, "default": False, "help": "Whether to average the scores"},
+)
+registry.declare(
+    "OllamaMetric",
+    "muse.evaluation.llm.ollama_metric",
+    key_facts_model={
+        "type": str,
+        "default": "mistral-small",
+        "help": "The model to use for key facts",
+    },
+    similarity_model={
+        "type": str,
+        "default": "sentence-transformers/distiluse-base-multilingual-cased-v1",
+        "help": "The model to use for similarity",
+    },
+    reference_free={
+        "type": bool,
+        "default": True,
+        "help": "Whether to use reference text for key facts",
+    },
+    similarity_threshold={
+        "type": float,
+        "default": 0.5,
+        "help": "The similarity threshold",
+    },
+    similarity_pair_method={
+        "type": str,
+        "default": "max",
+        "help": "The similarity pair method",
+    },
+    language_source={"type": str, "default": "en", "help": "The source language"},
+    language_target={"type": str, "default": "en", "help": "The target language"},
+)
@@ -1,4 +1,5 @@
 from muse.evaluation.evaluation import Evaluation
+from muse.evaluation.manifest import registry
 from muse.utils.plugins import import_from_plugin
 from muse.utils.resource_errors import UnknownResourceError
 
@@ -9,53 +10,48 @@ def resolve_evaluator(
     """
     Import an evaluation metric using the plugins.
 
+    Only the module of the resolved evaluation metric is imported.
+
     :param evaluation_metric: The evaluation metric to import.
     :param options: Options to initialize the evaluation metric.
     :return: The evaluation metric.
     :raises UnknownResourceError: If the evaluation metric is not found.
     """
 
-    evaluations = Evaluation.__subclasses__()
-    evaluations.sort(key=lambda x: x.plugin, reverse=True)
-    for evaluation in evaluations:
-        possible_names = [
-            str(evaluation_metric).lower(),
-            f"{evaluation_metric}Metric".lower(),
-        ]
-        if evaluation.__name__.lower() in possible_names:
-            return evaluation(options)
+    evaluation = registry.get(str(evaluation_metric), f"{evaluation_metric}Metric")
+    if evaluation is None:
+        raise UnknownResourceError(evaluation_metric)
 
-    raise UnknownResourceError(evaluation_metric)
+    return evaluation(options)
 
 
 def get_available_evaluators() -> list[str]:
     """
-    Get all the available evaluation metrics.
+    Get all the available evaluation metrics, without importing them.
 
     :return: List of available evaluation metrics.
     """
 
-    return [importer.__name__ for importer in Evaluation.__subclasses__()]
+    return registry.names()
 
 
 def get_evaluators_options() -> list[tuple[str, dict[str, any]]]:
     """
-    Get the options for all the available evaluation metrics.
+    Get the options for all the available evaluation metrics, without importing them.
 
     :return: List of tuples containing the name of the evaluation metric and its options.
     """
 
-    return [
-        (
-            importer.__name__,
-            (
-                importer.__init__.valid_options()
-                if hasattr(importer.__init__, "valid_options")
-                else {}
-            ),
-        )
-        for importer in Evaluation.__subclasses__()
-    ]
+    return registry.describe()
 
 
-import_from_plugin("evaluations", Evaluation, "evaluation", "evaluator", "evaluators")
+registry.add_discovery(
+    lambda: import_from_plugin(
+        "evaluations",
+        Evaluation,
+        "evaluation",
+        "evaluator",
+        "evaluators",
+        registry=registry,
+    )
+)
@@ -1,18 +1,28 @@
 import json
 import os
+import threading
+import warnings
 from argparse import Namespace
+from contextlib import ExitStack, nullcontext
 from enum import Enum
-from typing import TypedDict, Union, cast
+from itertools import islice
+from typing import ContextManager, Iterator, TextIO, TypedDict, Union, cast
 
-from muse.data_importer.resolver import import_data
+from muse.data_importer.resolver import import_data, iter_data
 from muse.data_manager.conversation.conversation import Conversation
 from muse.data_manager.document.document import Document
 from muse.data_manager.multi_document.multi_document import MultiDocument
+from muse.evaluation.cache import MetricCache, evaluation_identity, evaluation_items
 from muse.evaluation.evaluation import Evaluation
 from muse.evaluation.resolver import get_available_evaluators, resolve_evaluator
+from muse.summarizer.cache import SummaryCache, summarizer_identity
+from muse.summarizer.parallel import ParallelSummarizer
 from muse.summarizer.resolver import get_available_summarizers, resolve_summarizer
 from muse.summarizer.summarizer import Summarizer
+from muse.utils.cache import Cache
+from muse.utils.checkpoint import Checkpoint
 from muse.utils.decorators import with_valid_options
+from muse.utils.pipeline import DONE, Pipeline, Stage
 
 __all__ = [
     "SummarizerSystem",
@@ -57,6 +67,31 @@ class Options(TypedDict):
     output: str
     config: str
     use_cache: bool
+    workers: int
+    summary_cache: bool
+    summary_cache_size: int
+    metric_cache: bool
+    metric_cache_size: int
+    resume: bool
+    checkpoint_interval: int
+    stream: bool
+    chunk_size: int
+    pipeline: bool
+    queue_size: int
+    metric_workers: int
+
+
+def _add_stats(
+    total: dict[str, int] | None, stats: dict[str, int] | None
+) -> dict[str, int] | None:
+    if stats is None:
+        return total
+    return {key: (total or {}).get(key, 0) + value for key, value in stats.items()}
+
+
+def _summarizer_name(summarizer: Summarizer | ParallelSummarizer) -> str:
+    # The summarizers run over a pool of processes are named after the summarizer of the workers
+    return getattr(summarizer, "summarizer_class", summarizer.__class__).__name__
 
 
 def _parse_config(config: str) -> dict[str, any]:
@@ -95,7 +130,7 @@ def evaluate_metric(options: Options) -> None:
         raise ValueError("No data type specified")
 
     muse = Muse(options)
-    
+
     muse.set_data(
         options["data_type"],
         options["data"],
@@ -115,7 +150,13 @@ def evaluate_metric(options: Options) -> None:
         ]
     )
     results = muse.run()
-    if options["output"]:
+    if options["output"] and muse.stream:
+        # The summaries were written as they were streamed
+        print(f"Writing results")
+        with open(f"{options['output']}/results.json", "w") as f:
+            json.dump(results, f)
+        print(results)
+    elif options["output"]:
         os.makedirs(options["output"], exist_ok=True)
         print(f"Writing results")
         with open(f"{options['output']}/results.json", "w") as f:
@@ -131,6 +172,97 @@ def evaluate_metric(options: Options) -> None:
         print(results)
 
 
+class _ChunkResults:
+    """
+    Results of the metrics on the chunks of the data, which may be evaluated in any order.
+
+    The results of each summary are added to a running total as soon as the chunks before them
+    are, for the metrics keeping one, and kept until the end for the others.
+
+    The metrics are not thread safe, their models and resources are shared and may be loaded on
+    first use, so each metric evaluates one chunk at a time, under its own lock. Several metric
+    workers evaluate different metrics at the same time.
+    """
+
+    def __init__(self):
+        # The results of each summary, or the inputs of the metrics not evaluated per item, by
+        # summarizer and metric, then by chunk
+        self.items: dict[tuple[str, str], dict[int, list[dict[str, any]]]] = {}
+        self.inputs: dict[tuple[str, str], dict[int, dict[str, list[str]]]] = {}
+        # The running totals, and the number of summaries evaluated, by summarizer and metric
+        self.totals: dict[tuple[str, str], dict[str, any]] = {}
+        self.counts: dict[tuple[str, str], int] = {}
+        self.stats: dict[tuple[str, str], dict[str, int]] = {}
+        # The results of the chunks waiting for the chunks before them to be added to the totals
+        self._pending: dict[tuple[str, str], dict[int, list[dict[str, any]]]] = {}
+        self._next: dict[tuple[str, str], int] = {}
+        self._metric_locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def metric_lock(self, metric: str) -> threading.Lock:
+        """
+        Get the lock a metric is evaluated under.
+
+        :param metric: The name of the metric.
+        :return: The lock.
+        """
+        with self._lock:
+            return self._metric_locks.setdefault(metric, threading.Lock())
+
+    def add_inputs(
+        self, key: tuple[str, str], index: int, inputs: dict[str, list[str]]
+    ):
+        """
+        Add the inputs of a chunk, for a metric not evaluated per item.
+
+        :param key: The summarizer and the metric.
+        :param index: The index of the chunk.
+        :param inputs: The inputs of the metric on the chunk.
+        """
+        with self._lock:
+            self.inputs.setdefault(key, {})[index] = inputs
+
+    def add_items(
+        self,
+        key: tuple[str, str],
+        evaluation: Evaluation,
+        index: int,
+        items: list[dict[str, any]],
+    ):
+        """
+        Add the results of the summaries of a chunk.
+
+        :param key: The summarizer and the metric.
+        :param evaluation: The metric.
+        :param index: The index of the chunk.
+        :param items: The results of each summary of the chunk, empty if none was evaluated.
+        """
+        with self._lock:
+            self.counts[key] = self.counts.get(key, 0) + len(items)
+            if key in self.items:
+                self.items[key][index] = items
+                return
+
+            # Added in the order of the chunks, so the totals are summed in the order of the data
+            pending = self._pending.setdefault(key, {})
+            pending[index] = items
+            while (index := self._next.get(key, 0)) in pending:
+                total = evaluation.accumulate(self.totals.get(key), pending[index])
+                if total is None:
+                    # The metric needs the results of each summary
+                    self.items[key] = self._pending.pop(key)
+                    return
+                self.totals[key] = total
+                del pending[index]
+                self._next[key] = index + 1
+
+    def add_stats(self, key: tuple[str, str], stats: dict[str, int] | None):
+        if stats is None:
+            return
+        with self._lock:
+            self.stats[key] = _add_stats(self.stats.get(key), stats)
+
+
 class Muse:
     @with_valid_options(
         use_cache={"type": bool, "default": False, "help": "Use cached summaries"},
@@ -139,9 +271,81 @@ class Muse:
             "default": None,
             "help": "Output directory to save results, if none, results are printed",
         },
+        workers={
+            "type": int,
+            "default": 1,
+            "help": "Number of processes summarizing the data, each with its own summarizer, "
+            "for the extractive summarizers bound by the cpu",
+        },
+        summary_cache={
+            "type": bool,
+            "default": False,
+            "help": "Cache the summary of each document in the cache directory, so only new or "
+            "changed documents are summarized",
+        },
+        summary_cache_size={
+            "type": int,
+            "default": 1024,
+            "help": "Size of the summary cache in MB, the least recently used summaries are "
+            "evicted past it",
+        },
+        metric_cache={
+            "type": bool,
+            "default": False,
+            "help": "Cache the results of the metrics for each summary in the cache directory, "
+            "so only new summaries are evaluated",
+        },
+        metric_cache_size={
+            "type": int,
+            "default": 1024,
+            "help": "Size of the metric cache in MB, the least recently used results are "
+            "evicted past it",
+        },
+        resume={
+            "type": bool,
+            "default": False,
+            "help": "Resume from the checkpoints in the output directory, only computing the "
+            "summaries and scores of the documents after the last one checkpointed",
+        },
+        checkpoint_interval={
+            "type": int,
+            "default": 256,
+            "help": "Number of documents summarized or evaluated between two checkpoints, "
+            "which are written to the output directory whenever there is one",
+        },
+        stream={
+            "type": bool,
+            "default": False,
+            "help": "Stream the data through the summarizers and metrics in chunks, so the "
+            "documents and summaries held in memory are bounded by the chunk size rather than by "
+            "the size of the data, the metrics still keep the results of each summary unless they "
+            "are averaged as they come (rouge and bertScore with avg)",
+        },
+        chunk_size={
+            "type": int,
+            "default": 1000,
+            "help": "Number of documents held in memory at once when streaming",
+        },
+        pipeline={
+            "type": bool,
+            "default": False,
+            "help": "Read, summarize and evaluate the chunks of data at the same time, each "
+            "summarizer and the metrics in their own threads, reporting the utilization of each",
+        },
+        queue_size={
+            "type": int,
+            "default": 2,
+            "help": "Number of chunks waiting between two stages of the pipeline",
+        },
+        metric_workers={
+            "type": int,
+            "default": 1,
+            "help": "Number of threads evaluating the summaries in the pipeline, each metric "
+            "evaluates one chunk at a time as the metrics are not thread safe",
+        },
     )
     def __init__(self, options: Options = None):
-        self.summarizers: list[Summarizer] = []
+        self.summarizers: list[Summarizer | ParallelSummarizer] = []
         self.evaluations: list[Evaluation] = []
         self.data: (
             Union[list[Document], list[MultiDocument], list[Conversation]] | None
@@ -154,6 +358,38 @@ class Muse:
         self.use_cache = options.get("use_cache", False)
         self.cache_dir = options.get("output", None)
         self.summaries: dict[str, list[str]] = {}
+        self.workers = options.get("workers") or 1
+        self._summarizer_params: dict[str, tuple[str, dict[str, any]]] = {}
+        self.summary_cache = (
+            SummaryCache(max_size=(options.get("summary_cache_size") or 1024) << 20)
+            if options.get("summary_cache")
+            else None
+        )
+        self.summary_cache_stats: dict[str, dict[str, int]] = {}
+        self._evaluation_params: dict[str, dict[str, any]] = {}
+        self.metric_cache = (
+            MetricCache(max_size=(options.get("metric_cache_size") or 1024) << 20)
+            if options.get("metric_cache")
+            else None
+        )
+        # The summaries and scores are checkpointed as they are produced, when there is an output
+        self.checkpoint_dir = (
+            os.path.join(self.cache_dir, "checkpoint") if self.cache_dir else None
+        )
+        self.checkpoint_interval = options.get("checkpoint_interval") or 256
+        self.resume = options.get("resume", False)
+        if self.resume and self.checkpoint_dir is None:
+            raise ValueError("An output directory is required to resume a run")
+
+        self.stream = options.get("stream", False)
+        self.chunk_size = options.get("chunk_size") or 1000
+        self.pipeline = options.get("pipeline", False)
+        self.queue_size = options.get("queue_size") or 2
+        self.metric_workers = options.get("metric_workers") or 1
+        if (self.stream or self.pipeline) and (self.use_cache or self.resume):
+            raise ValueError(
+                "Cached summaries and resuming are not supported when streaming"
+            )
 
     def set_data(
         self,
@@ -164,6 +400,12 @@ class Muse:
     ):
         if not isinstance(datatype, DataType):
             datatype = DataType(datatype)
+        if self.stream:
+            # The data is only read as it is streamed, see `_run_stream`
+            self.data = iter_data(
+                data_path, str(datatype), data_language, options, self.chunk_size
+            )
+            return
         self.data = import_data(data_path, str(datatype), data_language, options)
         if isinstance(self.data, list):
             if isinstance(self.data[0], Document):
@@ -179,7 +421,17 @@ class Muse:
                 params = {}
             if not isinstance(summarizer, SummarizerSystem):
                 summarizer = SummarizerSystem(summarizer.lower())
-            self.summarizers.append(resolve_summarizer(str(summarizer), params))
+            if self.workers > 1 and ParallelSummarizer.supports(summarizer.name):
+                # Each worker builds its own summarizer, none is built in this process
+                self.summarizers.append(
+                    ParallelSummarizer(str(summarizer), params, self.workers)
+                )
+            else:
+                self.summarizers.append(resolve_summarizer(str(summarizer), params))
+            self._summarizer_params[_summarizer_name(self.summarizers[-1])] = (
+                str(summarizer),
+                params,
+            )
 
     def add_evaluation(self, *evaluations: str | tuple[str, dict[str, any]]):
         for evaluation in evaluations:
@@ -188,8 +440,16 @@ class Muse:
             else:
                 params = {}
             self.evaluations.append(resolve_evaluator(evaluation, params))
+            self._evaluation_params[self.evaluations[-1].__class__.__name__] = params
 
     def run(self):
+        if self.pipeline:
+            self._run_pipeline()
+            return self.get_results()
+        if self.stream:
+            self._run_stream()
+            return self.get_results()
+
         if self.use_cache:
             file = f"{self.cache_dir}/summaries.json"
             if os.path.isfile(file):
@@ -204,22 +464,345 @@ class Muse:
         return self.get_results()
 
     def _evaluate_summarizer(self, summarizer: Summarizer) -> None:
+        name = _summarizer_name(summarizer)
         if not self.use_cache:
-            self.summaries[summarizer.__class__.__name__] = summarizer.summarize(
-                self.data
-            )
+            self.summaries[name] = self._summarize(summarizer)
 
-        summary = self.summaries[summarizer.__class__.__name__]
+        summary = self.summaries[name]
 
+        inputs = self._evaluation_inputs(summary, self.data)
         results = {}
+        metric_cache_stats = {}
+        for evaluation in self.evaluations:
+            metric = evaluation.__class__.__name__
+            results[metric], stats = self._evaluate(summarizer, evaluation, inputs)
+            if stats is not None:
+                metric_cache_stats[metric] = stats
+        if metric_cache_stats:
+            results["metric_cache"] = metric_cache_stats
+        if name in self.summary_cache_stats:
+            results["summary_cache"] = self.summary_cache_stats[name]
+        self.results[name] = results
+
+    def _evaluate(
+        self,
+        summarizer: Summarizer,
+        evaluation: Evaluation,
+        inputs: dict[str, list[str]],
+    ) -> tuple[any, dict[str, int] | None]:
+        name = evaluation.__class__.__name__
+        params = self._evaluation_params.get(name)
+        items = evaluation_items(evaluation, **inputs)
+        if items is None or self.checkpoint_dir is None:
+            if self.metric_cache is None:
+                return evaluation.evaluate(**inputs), None
+            return self.metric_cache.evaluate(evaluation, params, **inputs)
+
+        # The results of each summary are checkpointed, and aggregated once all are evaluated
+        stats = None
+        keys = Cache.keys(evaluation_identity(evaluation, params), items)
+        file = f"scores.{_summarizer_name(summarizer)}.{name}.jsonl"
+        path = os.path.join(self.checkpoint_dir, file)
+        with Checkpoint(path, keys, self.resume) as checkpoint:
+            while checkpoint.remaining:
+                start = len(checkpoint.values)
+                chunk = {
+                    key: texts[start : start + self.checkpoint_interval]
+                    for key, texts in inputs.items()
+                }
+                chunk_items, chunk_stats = self._evaluate_items(evaluation, chunk)
+                checkpoint.append(chunk_items)
+                stats = _add_stats(stats, chunk_stats)
+            return evaluation.aggregate(checkpoint.values), stats
+
+    def _evaluate_items(
+        self, evaluation: Evaluation, inputs: dict[str, list[str]]
+    ) -> tuple[list[dict[str, any]], dict[str, int] | None]:
+        if self.metric_cache is None:
+            return evaluation.evaluate_items(**inputs), None
+        params = self._evaluation_params.get(evaluation.__class__.__name__)
+        return self.metric_cache.evaluate_items(evaluation, params, **inputs)
+
+    @staticmethod
+    def _evaluation_inputs(summary: list[str], data: list) -> dict[str, list[str]]:
+        return {
+            "summary": [elem for elem in summary if elem != ""],
+            "reference_summary": [s.summary for s in data if s.summary != ""],
+            "reference_text": [str(s) for s in data if str(s) != ""],
+        }
+
+    def _run_stream(self):
+        """
+        Summarize and evaluate the data chunk by chunk, so only a chunk of documents and summaries
+        is held in memory at once.
+
+        The memory used by the metrics still grows with the data, unless they keep a running total:
+        rouge and bertScore averaged (`avg`) add up the results of each summary as they come, the
+        other metrics evaluated per item keep the results of each summary until they are aggregated,
+        and the metrics not evaluated per item are evaluated on the whole data, whose inputs are
+        then kept in memory.
+        """
+        self._warn_corpus_metrics()
+        results = _ChunkResults()
+        outputs = self._open_summary_outputs()
+        try:
+            with ExitStack() as pools:
+                # The processes of the parallel summarizers are started once, for all the chunks
+                for summarizer in self.summarizers:
+                    pools.enter_context(self._pool(summarizer))
+                for index, chunk in enumerate(self._chunks()):
+                    for summarizer in self.summarizers:
+                        summaries = self._summarize_chunk(summarizer, chunk, outputs)
+                        self._evaluate_chunk(
+                            results, summarizer, index, chunk, summaries
+                        )
+        finally:
+            for output in outputs.values():
+                output.close()
+        self._collect_results(results)
+
+    def _run_pipeline(self):
+        """
+        Summarize and evaluate the data chunk by chunk like `_run_stream`, with the reading of the
+        data, each summarizer and the metrics running at the same time, in threads connected by
+        bounded queues.
+
+        The time each stage spent working and waiting on the others is reported in the results.
+        """
+        self._warn_corpus_metrics()
+        results = _ChunkResults()
+        outputs = self._open_summary_outputs()
+
+        pipeline = Pipeline(self.queue_size)
+        chunks = {_summarizer_name(s): pipeline.queue() for s in self.summarizers}
+        summaries = pipeline.queue()
+        remaining = [len(self.summarizers)]
+        lock = threading.Lock()
+
+        def read(stage: Stage):
+            data = self._chunks()
+            while True:
+                with stage.work():
+                    item = next(data, DONE)
+                for queue in chunks.values():
+                    stage.put(queue, item)
+                if item is DONE:
+                    break
+
+        def summarize(summarizer: Summarizer, stage: Stage):
+            name = _summarizer_name(summarizer)
+            index = 0
+            # The processes of a parallel summarizer are started once, for all the chunks
+            with self._pool(summarizer):
+                while (chunk := stage.get(chunks[name])) is not DONE:
+                    with stage.work():
+                        summary = self._summarize_chunk(summarizer, chunk, outputs)
+                    stage.put(summaries, (summarizer, index, chunk, summary))
+                    index += 1
+
+            # The last summarizer done stops the metric workers
+            with lock:
+                remaining[0] -= 1
+                if remaining[0] == 0:
+                    for _ in range(self.metric_workers):
+                        stage.put(summaries, DONE)
+
+        def evaluate(stage: Stage):
+            while (item := stage.get(summaries)) is not DONE:
+                with stage.work():
+                    self._evaluate_chunk(results, *item)
+
+        pipeline.stage("read", read)
+        for summarizer in self.summarizers:
+            pipeline.stage(
+                f"summarize {_summarizer_name(summarizer)}",
+                lambda stage, summarizer=summarizer: summarize(summarizer, stage),
+            )
+        pipeline.stage("evaluate", evaluate, self.metric_workers)
+        try:
+            pipeline.run()
+        finally:
+            for output in outputs.values():
+                output.close()
+        self._collect_results(results)
+
+        report = pipeline.report()
+        for summarizer in self.summarizers:
+            name = _summarizer_name(summarizer)
+            self.results[name]["pipeline"] = {
+                "read": report["read"],
+                "summarize": report[f"summarize {name}"],
+                "evaluate": report["evaluate"],
+            }
+
+    def _warn_corpus_metrics(self):
+        for evaluation in self.evaluations:
+            if not evaluation.per_item:
+                warnings.warn(
+                    f"{evaluation.__class__.__name__} is evaluated on the whole data, "
+                    "its inputs are kept in memory while streaming"
+                )
+
+    def _chunks(self) -> Iterator[list]:
+        data = (
+            doc
+            for doc in self.data
+            if not (isinstance(doc, Document) and doc.text == "")
+        )
+        while chunk := list(islice(data, self.chunk_size)):
+            yield chunk
+
+    def _open_summary_outputs(self) -> dict[str, TextIO]:
+        # The summaries are written as they are produced, rather than kept when streaming
+        if not self.stream or not self.cache_dir:
+            return {}
+        os.makedirs(self.cache_dir, exist_ok=True)
+        return {
+            _summarizer_name(s): open(
+                f"{self.cache_dir}/summaries.{_summarizer_name(s)}.jsonl", "w"
+            )
+            for s in self.summarizers
+        }
+
+    def _summarize_chunk(
+        self, summarizer: Summarizer, chunk: list, outputs: dict[str, TextIO]
+    ) -> list[str]:
+        name = _summarizer_name(summarizer)
+        summaries = self._summarize_data(summarizer, chunk)
+        if name in outputs:
+            outputs[name].write("".join(json.dumps(s) + "\n" for s in summaries))
+        if not self.stream:
+            self.summaries.setdefault(name, []).extend(summaries)
+        return summaries
+
+    def _evaluate_chunk(
+        self,
+        results: "_ChunkResults",
+        summarizer: Summarizer,
+        index: int,
+        chunk: list,
+        summaries: list[str],
+    ):
+        inputs = self._evaluation_inputs(summaries, chunk)
         for evaluation in self.evaluations:
-            result = evaluation.evaluate(
-                [elem for elem in summary if elem != ""],
-                reference_summary=[s.summary for s in self.data if s.summary != ""],
-                reference_text=[str(s) for s in self.data if str(s) != ""],
+            key = (_summarizer_name(summarizer), evaluation.__class__.__name__)
+            if not evaluation.per_item:
+                results.add_inputs(key, index, inputs)
+                continue
+            if not inputs["summary"]:
+                results.add_items(key, evaluation, index, [])
+                continue
+            if evaluation_items(evaluation, **inputs) is None:
+                raise ValueError(
+                    f"{key[1]} needs a reference per summary when streaming"
+                )
+
+            with results.metric_lock(key[1]):
+                items, stats = self._evaluate_items(evaluation, inputs)
+            results.add_items(key, evaluation, index, items)
+            results.add_stats(key, stats)
+
+    def _collect_results(self, chunk_results: "_ChunkResults"):
+        for summarizer in self.summarizers:
+            name = _summarizer_name(summarizer)
+            results = {}
+            stats = {}
+            for evaluation in self.evaluations:
+                key = (name, evaluation.__class__.__name__)
+                if not evaluation.per_item:
+                    inputs = self._evaluation_inputs([], [])
+                    chunks = chunk_results.inputs.get(key, {})
+                    for index in sorted(chunks):
+                        for arg, texts in chunks[index].items():
+                            inputs[arg].extend(texts)
+                    results[key[1]] = evaluation.evaluate(**inputs)
+                elif not chunk_results.counts.get(key):
+                    # No summary was evaluated
+                    pass
+                elif key in chunk_results.totals:
+                    results[key[1]] = evaluation.aggregate_total(
+                        chunk_results.totals[key]
+                    )
+                else:
+                    chunks = chunk_results.items[key]
+                    results[key[1]] = evaluation.aggregate(
+                        [item for index in sorted(chunks) for item in chunks[index]]
+                    )
+                if key in chunk_results.stats:
+                    stats[key[1]] = chunk_results.stats[key]
+            if stats:
+                results["metric_cache"] = stats
+            if name in self.summary_cache_stats:
+                results["summary_cache"] = self.summary_cache_stats[name]
+            self.results[name] = results
+
+    def _summarize(self, summarizer: Summarizer) -> list[str]:
+        # The processes of a parallel summarizer are started once, for all the checkpoints
+        with self._pool(summarizer):
+            if self.checkpoint_dir is None:
+                return self._summarize_data(summarizer, self.data)
+
+            name = _summarizer_name(summarizer)
+            _, params = self._summarizer_params.get(name, (name, {}))
+            keys = Cache.keys(
+                summarizer_identity(summarizer, params), [str(s) for s in self.data]
             )
-            results[evaluation.__class__.__name__] = result
-        self.results[summarizer.__class__.__name__] = results
+            path = os.path.join(self.checkpoint_dir, f"summaries.{name}.jsonl")
+            with Checkpoint(path, keys, self.resume) as checkpoint:
+                while checkpoint.remaining:
+                    start = len(checkpoint.values)
+                    data = self.data[start : start + self.checkpoint_interval]
+                    checkpoint.append(self._summarize_data(summarizer, data))
+                return checkpoint.values
+
+    @staticmethod
+    def _pool(summarizer: Summarizer | ParallelSummarizer) -> ContextManager:
+        """
+        Keep the pool of processes of a summarizer, if it is run over one, while in the context.
+
+        :param summarizer: The summarizer.
+        :return: The context manager.
+        """
+        if isinstance(summarizer, ParallelSummarizer):
+            return summarizer
+        return nullcontext()
+
+    def _summarize_data(self, summarizer: Summarizer, data: list) -> list[str]:
+        if self.summary_cache is None:
+            return self._run_summarizer(summarizer, data)
+
+        name = _summarizer_name(summarizer)
+        _, params = self._summarizer_params.get(name, (name, {}))
+        keys = self.summary_cache.keys(
+            summarizer_identity(summarizer, params), [str(s) for s in data]
+        )
+        cached = self.summary_cache.get(keys)
+
+        # Only the documents without a cached summary are summarized
+        missing = [i for i, key in enumerate(keys) if key not in cached]
+        summaries = self._run_summarizer(summarizer, [data[i] for i in missing])
+        evicted = self.summary_cache.put(
+            {keys[i]: summary for i, summary in zip(missing, summaries)}
+        )
+        self.summary_cache_stats[name] = _add_stats(
+            self.summary_cache_stats.get(name),
+            {
+                "hits": len(keys) - len(missing),
+                "misses": len(missing),
+                "evicted": evicted,
+            },
+        )
+
+        merged = [cached.get(key) for key in keys]
+        for i, summary in zip(missing, summaries):
+            merged[i] = summary
+        return merged
+
+    @staticmethod
+    def _run_summarizer(summarizer: Summarizer, data: list) -> list[str]:
+        if not data:
+            return []
+        return summarizer.summarize(data)
 
     def get_results(self) -> dict[str, dict[str, any]]:
         return self.results
@@ -236,6 +819,18 @@ def main(options: Options | Namespace) -> int:
             "config": options.config,
             "language": options.language,
             "use_cache": options.use_cache,
+            "workers": options.workers,
+            "summary_cache": options.summary_cache,
+            "summary_cache_size": options.summary_cache_size,
+            "metric_cache": options.metric_cache,
+            "metric_cache_size": options.metric_cache_size,
+            "resume": options.resume,
+            "checkpoint_interval": options.checkpoint_interval,
+            "stream": options.stream,
+            "chunk_size": options.chunk_size,
+            "pipeline": options.pipeline,
+            "queue_size": options.queue_size,
+            "metric_workers": options.metric_workers,
         }
     options = cast(Options, options)
 
@@ -1,4 +1,10 @@
-from muse.summarizer.abstractive import *
-from muse.summarizer.extractive import *
+from muse.summarizer.manifest import registry
 from muse.summarizer.resolver import get_available_summarizers, resolve_summarizer
 from muse.summarizer.summarizer import Summarizer
+
+
+def __getattr__(name: str):
+    # Builtin summarizers are only imported on first access, see muse.summarizer.manifest
+    if name in registry:
+        return registry.load(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
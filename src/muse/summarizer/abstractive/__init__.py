@@ -1,4 +1,10 @@
-from muse.summarizer.abstractive.conversation import Conversation
-from muse.summarizer.abstractive.crossSum import CrossSum
-from muse.summarizer.abstractive.falconsAI import FalconsAI
-from muse.summarizer.abstractive.mT5 import MT5
+from muse.summarizer.manifest import registry
+
+__all__ = ["Conversation", "CrossSum", "FalconsAI", "MT5"]
+
+
+def __getattr__(name: str):
+    # The summarizers are only imported on first access, see muse.summarizer.manifest
+    if name in __all__:
+        return registry.load(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,100 @@
+"""
+Execution backends for the sequence-to-sequence summarizers.
+
+The supported backends are:
+- torch: The transformers model, run eagerly by PyTorch at the given precision.
+- onnx: The encoder and decoder exported to ONNX and run by ONNX Runtime, with the decoder reusing
+        the past key values so each step of the beam search only runs on the newest token. The
+        exported graphs are cached in the MUSE_MODELS directory, so a model is only exported once.
+        It needs optimum with ONNX Runtime, from the optional requirements.
+
+Both backends return a model with the transformers `generate` interface.
+"""
+
+import os
+import shutil
+from pathlib import Path
+
+from transformers import AutoModelForSeq2SeqLM
+
+from muse.summarizer.abstractive.precision import apply_precision
+from muse.utils.env import get_models_dir
+
+BACKENDS = ["torch", "onnx"]
+
+
+def onnx_model_dir(model_name: str) -> Path | None:
+    """
+    Get the directory the ONNX export of a model is cached in.
+
+    :param model_name: The name of the model on the hub.
+    :return: The directory, or None if there is no models directory.
+    """
+    models_dir = get_models_dir()
+    if models_dir is None:
+        return None
+    return Path(models_dir, "onnx", model_name.replace("/", "--"))
+
+
+def _load_onnx_model(model_name: str, device: str):
+    try:
+        from optimum.onnxruntime import ORTModelForSeq2SeqLM
+    except ImportError as e:
+        raise ImportError(
+            "The onnx backend needs optimum with ONNX Runtime, install it with "
+            "pip install 'optimum[onnxruntime]'"
+        ) from e
+
+    provider = (
+        "CUDAExecutionProvider"
+        if str(device).startswith("cuda")
+        else "CPUExecutionProvider"
+    )
+    export_dir = onnx_model_dir(model_name)
+    if export_dir is not None and Path(export_dir, "encoder_model.onnx").is_file():
+        return ORTModelForSeq2SeqLM.from_pretrained(
+            export_dir, use_cache=True, provider=provider
+        )
+
+    model = ORTModelForSeq2SeqLM.from_pretrained(
+        model_name, export=True, use_cache=True, provider=provider
+    )
+    if export_dir is not None:
+        # Saved to a temporary directory first, so a concurrent load never sees a partial export
+        tmp_dir = export_dir.with_name(f"{export_dir.name}.{os.getpid()}.tmp")
+        try:
+            model.save_pretrained(tmp_dir)
+            os.replace(tmp_dir, export_dir)
+        except OSError:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    return model
+
+
+def load_seq2seq_model(
+    model_name: str, device: str, backend: str = "torch", precision: str = "fp32"
+):
+    """
+    Load a sequence-to-sequence model on the given backend.
+
+    :param model_name: The name of the model on the hub.
+    :param device: The device to run the model on.
+    :param backend: One of "torch" or "onnx".
+    :param precision: The precision of the model, see `apply_precision`. The onnx backend only
+                      runs the exported fp32 graphs.
+    :return: The model.
+    :raises ValueError: If the backend is unknown, or does not support the precision.
+    :raises ImportError: If the onnx backend is used without optimum installed.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(
+            f"Unknown backend {backend}, expected one of {', '.join(BACKENDS)}"
+        )
+
+    if backend == "onnx":
+        if precision != "fp32":
+            raise ValueError("The onnx backend only supports the fp32 precision")
+        return _load_onnx_model(model_name, device)
+
+    model = AutoModelForSeq2SeqLM.from_pretrained(model_name)
+    model.to(device)
+    return apply_precision(model, precision, device)
@@ -0,0 +1,111 @@
+"""
+Batched generation for the sequence-to-sequence summarizers.
+
+Texts are tokenized once, without padding, and grouped into batches of similar length, so each
+batch is only padded to the longest text within it rather than to the maximum input length. The
+summarizers built on a summarization pipeline get the same grouping, with the pipeline batching and
+padding the texts itself.
+"""
+
+
+def length_buckets(lengths: list[int], batch_size: int) -> list[list[int]]:
+    """
+    Group the indices of the inputs into batches of inputs of similar length.
+
+    The inputs are sorted longest first, so any out of memory error shows up on the first batch.
+
+    :param lengths: The length of each input.
+    :param batch_size: The maximum number of inputs in a batch.
+    :return: The batches, as lists of indices into the inputs.
+    """
+    batch_size = max(1, batch_size)
+    order = sorted(range(len(lengths)), key=lambda i: lengths[i], reverse=True)
+    return [order[i : i + batch_size] for i in range(0, len(order), batch_size)]
+
+
+def generate_batched(
+    model,
+    tokenizer,
+    texts: list[str],
+    device: str,
+    batch_size: int,
+    max_input_length: int = 512,
+    **generate_kwargs,
+) -> list[str]:
+    """
+    Generate a summary for each text, in batches of texts of similar length.
+
+    :param model: The sequence-to-sequence model.
+    :param tokenizer: The tokenizer of the model.
+    :param texts: The texts to summarize.
+    :param device: The device the model is on.
+    :param batch_size: The maximum number of texts generated together.
+    :param max_input_length: The number of tokens texts are truncated to.
+    :param generate_kwargs: The arguments to `model.generate`.
+    :return: The summaries, in the order of the texts.
+    """
+    if not texts:
+        return []
+
+    input_ids = tokenizer(texts, truncation=True, max_length=max_input_length)[
+        "input_ids"
+    ]
+
+    summaries = [""] * len(texts)
+    for batch in length_buckets([len(ids) for ids in input_ids], batch_size):
+        inputs = tokenizer.pad(
+            {"input_ids": [input_ids[i] for i in batch]}, return_tensors="pt"
+        ).to(device)
+        output_ids = model.generate(
+            input_ids=inputs["input_ids"],
+            attention_mask=inputs["attention_mask"],
+            **generate_kwargs,
+        )
+        decoded = tokenizer.batch_decode(
+            output_ids, skip_special_tokens=True, clean_up_tokenization_spaces=False
+        )
+        for i, summary in zip(batch, decoded):
+            summaries[i] = summary
+
+    return summaries
+
+
+def pipeline_batched(
+    summarizer, texts: list[str], batch_size: int, num_workers: int = 0
+) -> list[str]:
+    """
+    Summarize the texts with a summarization pipeline, in batches of texts of similar length.
+
+    The texts are given to the pipeline at once, so it batches them itself and prepares the next
+    batches in the background while the model generates. Each text is truncated to the maximum
+    input length of the model, so one overlong text does not fail its batch.
+
+    :param summarizer: The summarization pipeline.
+    :param texts: The texts to summarize.
+    :param batch_size: The maximum number of texts generated together.
+    :param num_workers: The number of processes preparing the texts, 0 prepares them in the
+                        main process.
+    :return: The summaries, in the order of the texts.
+    """
+    if not texts:
+        return []
+
+    # Sorting by length groups texts of similar length in the batches of the pipeline
+    order = [
+        i
+        for batch in length_buckets([len(text) for text in texts], batch_size)
+        for i in batch
+    ]
+    outputs = summarizer(
+        [texts[i] for i in order],
+        batch_size=max(1, batch_size),
+        num_workers=num_workers,
+        truncation=True,
+    )
+
+    summaries = [""] * len(texts)
+    for i, output in zip(order, outputs):
+        if isinstance(output, list):
+            output = output[0]
+        summaries[i] = output["summary_text"]
+    return summaries
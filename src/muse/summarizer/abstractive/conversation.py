@@ -1,18 +1,15 @@
 import torch
 from transformers import pipeline
 
+from muse.summarizer.abstractive.batching import pipeline_batched
+from muse.summarizer.abstractive.precision import apply_precision
+from muse.summarizer.manifest import registry
 from muse.summarizer.summarizer import Summarizer
 from muse.utils.decorators import with_valid_options
 
 
 class Conversation(Summarizer):
-    @with_valid_options(
-        device={
-            "type": str,
-            "default": "cuda" if torch.cuda.is_available() else "cpu",
-            "help": "The device to use",
-        },
-    )
+    @with_valid_options(**registry.options("Conversation"))
     def __init__(self, options: dict[str, any]):
         if options is None:
             options = {}
@@ -36,6 +33,12 @@ class Conversation(Summarizer):
                 "summarization",
                 model="kabita-choudhary/finetuned-bart-for-conversation-summary",
             )
+        self.precision = options.get("precision", "fp32")
+        self.summarizer.model = apply_precision(
+            self.summarizer.model, self.precision, self.summarizer.device
+        )
+        self.batch_size = options.get("batch_size", 8)
+        self.num_workers = options.get("num_workers", 0)
 
     def summarize(self, texts) -> list[str]:
         if isinstance(texts, list):
@@ -43,7 +46,19 @@ class Conversation(Summarizer):
         return [self._summarize_single(texts[0])]
 
     def _summarize_single(self, text):
-        return self.summarizer(text.text)[0]["summary_text"]
+        return self._summary_multi([text])[0]
+
+    @staticmethod
+    def _input_text(text) -> str:
+        # The model is finetuned on dialogues of "speaker: text" lines
+        if hasattr(text, "text_units"):
+            return "\n".join(str(text_unit) for text_unit in text.text_units)
+        return text.text
 
     def _summary_multi(self, texts):
-        return [self._summarize_single(text) for text in texts]
+        return pipeline_batched(
+            self.summarizer,
+            [self._input_text(text) for text in texts],
+            self.batch_size,
+            self.num_workers,
+        )
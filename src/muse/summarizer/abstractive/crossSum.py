@@ -1,35 +1,31 @@
 import re
 
 import torch
-from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+from transformers import AutoTokenizer
 
+from muse.summarizer.abstractive.backend import load_seq2seq_model
+from muse.summarizer.abstractive.batching import generate_batched
+from muse.summarizer.manifest import registry
 from muse.summarizer.summarizer import Summarizer
 from muse.utils.decorators import with_valid_options
 
 
 class CrossSum(Summarizer):
-    @with_valid_options(
-        model_name={
-            "type": str,
-            "default": "csebuetnlp/mT5_m2m_crossSum",
-            "help": "The model name to use",
-        },
-        device={
-            "type": str,
-            "default": "cuda" if torch.cuda.is_available() else "cpu",
-            "help": "The device to use",
-        },
-    )
+    @with_valid_options(**registry.options("CrossSum"))
     def __init__(self, options):
         if not options:
             options = {}
         self.model_name = options.get("model_name", "csebuetnlp/mT5_m2m_crossSum")
         self.tokenizer = AutoTokenizer.from_pretrained(self.model_name, use_fast=False)
-        self.model = AutoModelForSeq2SeqLM.from_pretrained(self.model_name)
         self.device = options.get(
             "device", "cuda" if torch.cuda.is_available() else "cpu"
         )
-        self.model.to(self.device)
+        self.backend = options.get("backend", "torch")
+        self.precision = options.get("precision", "fp32")
+        self.model = load_seq2seq_model(
+            self.model_name, self.device, self.backend, self.precision
+        )
+        self.batch_size = options.get("batch_size", 8)
         self.get_lang_id = lambda lang: self.tokenizer._convert_token_to_id(
             self.model.config.task_specific_params["langid_map"][lang][1]
         )
@@ -42,27 +38,19 @@ class CrossSum(Summarizer):
         return [self._summarize_single(texts[0])]
 
     def _summarize_single(self, text):
-        WHITESPACE_HANDLER = lambda k: re.sub("\s+", " ", re.sub("\n+", " ", k.strip()))
-        input_ids = self.tokenizer(
-            [WHITESPACE_HANDLER(text.text)],
-            return_tensors="pt",
-            padding="max_length",
-            truncation=True,
-            max_length=512,
-        )["input_ids"].to(self.device)
+        return self._summary_multi([text])[0]
 
-        output_ids = self.model.generate(
-            input_ids=input_ids,
+    def _summary_multi(self, texts):
+        WHITESPACE_HANDLER = lambda k: re.sub("\s+", " ", re.sub("\n+", " ", k.strip()))
+        return generate_batched(
+            self.model,
+            self.tokenizer,
+            [WHITESPACE_HANDLER(text.text) for text in texts],
+            self.device,
+            self.batch_size,
+            max_input_length=512,
             decoder_start_token_id=self.get_lang_id(self.target_lang),
             max_length=84,
             no_repeat_ngram_size=2,
             num_beams=4,
-        )[0]
-
-        summary = self.tokenizer.decode(
-            output_ids, skip_special_tokens=True, clean_up_tokenization_spaces=False
         )
-        return summary
-
-    def _summary_multi(self, texts):
-        return [self._summarize_single(text) for text in texts]
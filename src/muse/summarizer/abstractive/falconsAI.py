@@ -1,25 +1,36 @@
 import torch
-from transformers import pipeline
+from transformers import AutoTokenizer, pipeline
 
+from muse.summarizer.abstractive.backend import load_seq2seq_model
+from muse.summarizer.abstractive.batching import pipeline_batched
+from muse.summarizer.abstractive.precision import apply_precision
+from muse.summarizer.manifest import registry
 from muse.summarizer.summarizer import Summarizer
 from muse.utils.decorators import with_valid_options
 
 
 class FalconsAI(Summarizer):
-    @with_valid_options(
-        device={
-            "type": str,
-            "default": "cuda" if torch.cuda.is_available() else "cpu",
-            "help": "The device to use",
-        },
-    )
+    @with_valid_options(**registry.options("FalconsAI"))
     def __init__(self, options: dict[str, any]):
         if options is None:
             options = {}
         self.device = options.get(
             "device", "cuda" if torch.cuda.is_available() else "cpu"
         )
-        if self.device == "cuda":
+        self.backend = options.get("backend", "torch")
+        self.precision = options.get("precision", "fp32")
+        if self.backend != "torch":
+            self.summarizer = pipeline(
+                "summarization",
+                model=load_seq2seq_model(
+                    "Falconsai/text_summarization",
+                    self.device,
+                    self.backend,
+                    self.precision,
+                ),
+                tokenizer=AutoTokenizer.from_pretrained("Falconsai/text_summarization"),
+            )
+        elif self.device == "cuda":
             try:
                 self.summarizer = pipeline(
                     "summarization", model="Falconsai/text_summarization", device=0
@@ -32,6 +43,11 @@ class FalconsAI(Summarizer):
             self.summarizer = pipeline(
                 "summarization", model="Falconsai/text_summarization"
             )
+        self.summarizer.model = apply_precision(
+            self.summarizer.model, self.precision, self.summarizer.device
+        )
+        self.batch_size = options.get("batch_size", 8)
+        self.num_workers = options.get("num_workers", 0)
 
     def summarize(self, texts) -> list[str]:
         if isinstance(texts, list):
@@ -39,7 +55,12 @@ class FalconsAI(Summarizer):
         return [self._summarize_single(texts[0])]
 
     def _summarize_single(self, text):
-        return self.summarizer(text.text)[0]["summary_text"]
+        return self._summary_multi([text])[0]
 
     def _summary_multi(self, texts):
-        return [self._summarize_single(text) for text in texts]
+        return pipeline_batched(
+            self.summarizer,
+            [text.text for text in texts],
+            self.batch_size,
+            self.num_workers,
+        )
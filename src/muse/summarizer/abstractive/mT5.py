@@ -1,35 +1,31 @@
 import re
 
 import torch
-from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+from transformers import AutoTokenizer
 
+from muse.summarizer.abstractive.backend import load_seq2seq_model
+from muse.summarizer.abstractive.batching import generate_batched
+from muse.summarizer.manifest import registry
 from muse.summarizer.summarizer import Summarizer
 from muse.utils.decorators import with_valid_options
 
 
 class MT5(Summarizer):
-    @with_valid_options(
-        model_name={
-            "type": str,
-            "default": "csebuetnlp/mT5_multilingual_XLSum",
-            "help": "The model name to use",
-        },
-        device={
-            "type": str,
-            "default": "cuda" if torch.cuda.is_available() else "cpu",
-            "help": "The device to use",
-        },
-    )
+    @with_valid_options(**registry.options("MT5"))
     def __init__(self, options):
         if not options:
             options = {}
         self.model_name = options.get("model_name", "csebuetnlp/mT5_multilingual_XLSum")
         self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
-        self.model = AutoModelForSeq2SeqLM.from_pretrained(self.model_name)
         self.device = options.get(
             "device", "cuda" if torch.cuda.is_available() else "cpu"
         )
-        self.model.to(self.device)
+        self.backend = options.get("backend", "torch")
+        self.precision = options.get("precision", "fp32")
+        self.model = load_seq2seq_model(
+            self.model_name, self.device, self.backend, self.precision
+        )
+        self.batch_size = options.get("batch_size", 8)
 
     def summarize(self, texts) -> list[str]:
         if isinstance(texts, list):
@@ -37,23 +33,18 @@ class MT5(Summarizer):
         return [self._summarize_single(texts[0])]
 
     def _summarize_single(self, text):
-        WHITESPACE_HANDLER = lambda k: re.sub("\s+", " ", re.sub("\n+", " ", k.strip()))
-        input_ids = self.tokenizer(
-            [WHITESPACE_HANDLER(text.text)],
-            return_tensors="pt",
-            padding="max_length",
-            truncation=True,
-            max_length=512,
-        )["input_ids"].to(self.device)
-
-        output_ids = self.model.generate(
-            input_ids=input_ids, max_length=84, no_repeat_ngram_size=2, num_beams=4
-        )[0]
-
-        summary = self.tokenizer.decode(
-            output_ids, skip_special_tokens=True, clean_up_tokenization_spaces=False
-        )
-        return summary
+        return self._summary_multi([text])[0]
 
     def _summary_multi(self, texts):
-        return [self._summarize_single(text) for text in texts]
+        WHITESPACE_HANDLER = lambda k: re.sub("\s+", " ", re.sub("\n+", " ", k.strip()))
+        return generate_batched(
+            self.model,
+            self.tokenizer,
+            [WHITESPACE_HANDLER(text.text) for text in texts],
+            self.device,
+            self.batch_size,
+            max_input_length=512,
+            max_length=84,
+            no_repeat_ngram_size=2,
+            num_beams=4,
+        )
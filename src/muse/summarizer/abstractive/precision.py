@@ -0,0 +1,39 @@
+"""
+Reduced precision inference for the transformer summarizers.
+
+The supported precisions are:
+- fp32: The full precision checkpoint, as loaded.
+- bf16: The weights and activations are cast to bfloat16, halving the memory of the weights.
+- int8-dynamic: The linear layers are dynamically quantized to int8, their weights are stored in
+                int8 and their activations quantized on the fly. Only available on cpu.
+"""
+
+import torch
+
+PRECISIONS = ["fp32", "bf16", "int8-dynamic"]
+
+
+def apply_precision(model: torch.nn.Module, precision: str, device: str):
+    """
+    Convert a model, already on its device, to the given precision.
+
+    :param model: The model.
+    :param precision: One of "fp32", "bf16" or "int8-dynamic".
+    :param device: The device the model is on.
+    :return: The converted model.
+    :raises ValueError: If the precision is unknown, or not available on the device.
+    """
+    if precision == "fp32":
+        return model
+    if precision == "bf16":
+        return model.to(torch.bfloat16)
+    if precision == "int8-dynamic":
+        if str(device) != "cpu":
+            raise ValueError("The int8-dynamic precision is only available on cpu")
+        return torch.ao.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+
+    raise ValueError(
+        f"Unknown precision {precision}, expected one of {', '.join(PRECISIONS)}"
+    )
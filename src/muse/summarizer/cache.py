@@ -0,0 +1,43 @@
+"""
+Persistent cache of the summary of each document.
+
+The summaries are stored in a SQLite database in the MUSE_CACHE directory, keyed by a hash of the
+summarizer (its class, options and the name and revision of its model) and of the text of the
+document, so a document is only summarized again when it, or the summarizer, changes. SQLite takes
+care of the locking when several processes share the cache.
+
+The cache has a size budget: once the summaries stored exceed it, the least recently used ones are
+evicted.
+"""
+
+from muse.summarizer.summarizer import Summarizer
+from muse.utils.cache import Cache
+
+__all__ = ["SummaryCache", "summarizer_identity"]
+
+
+def summarizer_identity(
+    summarizer: Summarizer, options: dict[str, any] | None = None
+) -> dict[str, any]:
+    """
+    Identify a summarizer, so the summaries of different summarizers are never mixed up.
+
+    :param summarizer: The summarizer.
+    :param options: The options the summarizer was created with.
+    :return: The class, options and model identity of the summarizer.
+    """
+    # A summarizer run over a pool of processes is identified as the summarizer of its workers
+    cls = getattr(summarizer, "summarizer_class", summarizer.__class__)
+    return {
+        "summarizer": f"{cls.__module__}.{cls.__qualname__}",
+        "options": options or {},
+        **summarizer.model_identity(),
+    }
+
+
+class SummaryCache(Cache):
+    """
+    Persistent cache of the summary of each document, see `Cache`.
+    """
+
+    file_name = "summaries.sqlite"
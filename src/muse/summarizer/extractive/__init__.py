@@ -1,2 +1,10 @@
-from muse.summarizer.extractive.spacy_connector import Spacy
-from muse.summarizer.extractive.sumy_connector import Sumy
+from muse.summarizer.manifest import registry
+
+__all__ = ["Spacy", "Sumy"]
+
+
+def __getattr__(name: str):
+    # The summarizers are only imported on first access, see muse.summarizer.manifest
+    if name in __all__:
+        return registry.load(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,23 +1,23 @@
-from collections import Counter
-from heapq import nlargest
 from string import punctuation
 
+import numpy as np
 import spacy
 import spacy.cli
+from spacy.attrs import ORTH, POS
 from spacy.lang.en.stop_words import STOP_WORDS
+from spacy.symbols import ADJ, NOUN, PROPN, VERB
 
+from muse.summarizer.manifest import registry
 from muse.summarizer.summarizer import Summarizer
 from muse.utils.decorators import with_valid_options
 
+# The summaries only use the tags and the sentences, the other components are disabled
+_UNUSED_PIPES = ["ner", "lemmatizer"]
+_KEYWORD_POS = [PROPN, ADJ, NOUN, VERB]
+
 
 class Spacy(Summarizer):
-    @with_valid_options(
-        language_spacy={
-            "type": str,
-            "default": "en_core_web_sm",
-            "help": "The language model to use",
-        },
-    )
+    @with_valid_options(**registry.options("Spacy"))
     def __init__(self, options: dict[str, any]):
         if options is None:
             options = {}
@@ -26,8 +26,24 @@ class Spacy(Summarizer):
         try:
             self.nlp = spacy.load(ln)
         except:
-            spacy.cli.download(ln,  False, False, "--break-system-packages")
+            spacy.cli.download(ln, False, False, "--break-system-packages")
             self.nlp = spacy.load(ln)
+        self.nlp.select_pipes(
+            disable=[pipe for pipe in _UNUSED_PIPES if pipe in self.nlp.pipe_names]
+        )
+        self.batch_size = options.get("batch_size", 64)
+        self.n_process = options.get("n_process", 1)
+
+        self.excluded = np.array(
+            [self.nlp.vocab.strings.add(word) for word in (*STOP_WORDS, *punctuation)],
+            dtype=np.uint64,
+        )
+
+    def model_identity(self) -> dict[str, any]:
+        return {
+            "model": f"{self.nlp.meta['lang']}_{self.nlp.meta['name']}",
+            "revision": self.nlp.meta["version"],
+        }
 
     def summarize(self, texts) -> list[str]:
         if isinstance(texts, list):
@@ -35,30 +51,51 @@ class Spacy(Summarizer):
         return [self._summarize_single(texts[0])]
 
     def _summarize_single(self, text):
-        doc = self.nlp(str(text))
-        keyword = []
-        stopwords = list(STOP_WORDS)
-        pos_tag = ["PROPN", "ADJ", "NOUN", "VERB"]
-        for token in doc:
-            if token.text in stopwords or token.text in punctuation:
-                continue
-            if token.pos_ in pos_tag:
-                keyword.append(token.text)
-        word_freq = Counter(keyword)
-        for word in word_freq.keys():
-            word_freq[word] = word_freq[word] / max(word_freq.values())
-        sent_strength = {}
-        for sent in doc.sents:
-            for word in sent:
-                if word.text in word_freq.keys():
-                    if sent in sent_strength.keys():
-                        sent_strength[sent] += word_freq[word.text]
-                    else:
-                        sent_strength[sent] = word_freq[word.text]
-        summarized_sentences = nlargest(3, sent_strength, key=sent_strength.get)
-        final_sentences = [w.text for w in summarized_sentences]
-        summary = " ".join(final_sentences)
-        return summary
+        return self._summarize_doc(self.nlp(str(text)))
+
+    def _summarize_doc(self, doc, length: int = 3) -> str:
+        """
+        Extract the sentences with the most frequent keywords of a parsed document.
+
+        The keywords are the nouns, proper nouns, adjectives and verbs that are not stopwords or
+        punctuation. Each sentence is scored by the sum of the frequencies of its keywords, relative
+        to the most frequent keyword, and sentences without keywords are never extracted.
+
+        :param doc: The parsed document.
+        :param length: The number of sentences to extract.
+        :return: The extracted sentences, by decreasing score.
+        """
+        tokens = doc.to_array([ORTH, POS])
+        orth, pos = tokens[:, 0], tokens[:, 1]
+        keywords = np.isin(pos, _KEYWORD_POS) & ~np.isin(orth, self.excluded)
+        if not keywords.any():
+            return ""
+
+        words, counts = np.unique(orth[keywords], return_counts=True)
+        frequency = counts / counts.max()
+
+        # Tokens with the text of a keyword count towards their sentence, whatever their tag
+        word = np.minimum(np.searchsorted(words, orth), len(words) - 1)
+        matches = words[word] == orth
+
+        sentences = list(doc.sents)
+        starts = np.array([sentence.start for sentence in sentences])
+        sentence = np.searchsorted(starts, np.arange(len(doc)), side="right") - 1
+        scores = np.bincount(
+            sentence[matches],
+            weights=frequency[word[matches]],
+            minlength=len(sentences),
+        )
+
+        found = np.bincount(sentence[matches], minlength=len(sentences))
+        candidates = np.flatnonzero(found)
+        best = candidates[np.argsort(-scores[candidates], kind="stable")[:length]]
+        return " ".join(sentences[i].text for i in best)
 
     def _summary_multi(self, texts):
-        return [self._summarize_single(text) for text in texts]
+        docs = self.nlp.pipe(
+            (str(text) for text in texts),
+            batch_size=self.batch_size,
+            n_process=self.n_process,
+        )
+        return [self._summarize_doc(doc) for doc in docs]
@@ -1,32 +1,157 @@
-from nltk import download
+from functools import lru_cache
+
+import nltk
+import numpy as np
+from scipy.sparse import csc_matrix, diags
+from scipy.sparse.linalg import LinearOperator, svds
+from sumy.nlp.stemmers import Stemmer, null_stemmer
 from sumy.nlp.tokenizers import Tokenizer
 from sumy.parsers.plaintext import PlaintextParser
+from sumy.summarizers.lex_rank import LexRankSummarizer
 from sumy.summarizers.lsa import LsaSummarizer
+from sumy.summarizers.luhn import LuhnSummarizer
+from sumy.summarizers.text_rank import TextRankSummarizer
+from sumy.utils import get_stop_words
 
+from muse.summarizer.manifest import registry
 from muse.summarizer.summarizer import Summarizer
 from muse.utils.decorators import with_valid_options
 
 
+class SparseLsaSummarizer(LsaSummarizer):
+    """
+    The LSA summarizer of sumy, on a sparse term-sentence matrix.
+
+    Sumy fills a dense matrix cell by cell and decomposes it fully. Here the word counts are kept in
+    a sparse matrix, with the smoothing of the term frequencies applied as a rank-one term, and only
+    the singular values used by the ranks are computed. When all of them are used, as with the
+    reduction ratio of sumy, the rank of a sentence is the norm of its column, computed directly.
+    """
+
+    def __call__(self, document, sentences_count):
+        dictionary = self._create_dictionary(document)
+        # empty document
+        if not dictionary:
+            return ()
+
+        counts = self._create_sparse_matrix(document, dictionary)
+        ranks = iter(self._compute_sparse_ranks(counts))
+        return self._get_best_sentences(
+            document.sentences, sentences_count, lambda s: next(ranks)
+        )
+
+    def _create_sparse_matrix(self, document, dictionary) -> csc_matrix:
+        rows, cols = [], []
+        for col, sentence in enumerate(document.sentences):
+            for word in map(self.stem_word, sentence.words):
+                if word in dictionary:
+                    rows.append(dictionary[word])
+                    cols.append(col)
+
+        # Duplicate entries are summed, counting the occurrences of each word
+        return csc_matrix(
+            (np.ones(len(rows)), (rows, cols)),
+            shape=(len(dictionary), len(document.sentences)),
+        )
+
+    def _compute_sparse_ranks(self, counts: csc_matrix, smooth: float = 0.4):
+        words, sentences = counts.shape
+
+        # The smoothed frequency of every word of a sentence with words is
+        # smooth + (1 - smooth) * count / max count, a sparse matrix plus a rank-one term
+        max_counts = counts.max(axis=0).toarray().ravel()
+        has_words = (max_counts > 0).astype(float)
+        scaled = counts @ diags((1.0 - smooth) / np.maximum(max_counts, 1.0))
+
+        dimensions = max(
+            self.MIN_DIMENSIONS, int(min(words, sentences) * self.REDUCTION_RATIO)
+        )
+        if dimensions >= min(words, sentences):
+            norms = (
+                scaled.multiply(scaled).sum(axis=0).A1
+                + 2 * smooth * scaled.sum(axis=0).A1 * has_words
+                + smooth**2 * words * has_words
+            )
+            return np.sqrt(norms)
+
+        def matvec(x):
+            x = np.ravel(x)
+            return scaled @ x + smooth * (has_words @ x)
+
+        def rmatvec(y):
+            y = np.ravel(y)
+            return scaled.T @ y + smooth * y.sum() * has_words
+
+        matrix = LinearOperator(
+            (words, sentences), matvec=matvec, rmatvec=rmatvec, dtype=float
+        )
+        _, sigma, v = svds(matrix, k=dimensions)
+        return np.sqrt((sigma[:, None] ** 2 * v**2).sum(axis=0))
+
+
+_ALGORITHMS = {
+    "lsa": SparseLsaSummarizer,
+    "lexrank": LexRankSummarizer,
+    "luhn": LuhnSummarizer,
+    "textrank": TextRankSummarizer,
+}
+
+
+@lru_cache
+def _download_punkt():
+    try:
+        nltk.data.find("tokenizers/punkt_tab")
+    except LookupError:
+        nltk.download("punkt_tab")
+
+
+# The tokenizers, stemmers and stopwords are shared by all the summarizers of a language
+@lru_cache
+def _tokenizer(language: str) -> Tokenizer:
+    return Tokenizer(language)
+
+
+@lru_cache
+def _stemmer(language: str) -> Stemmer:
+    return Stemmer(language)
+
+
+@lru_cache
+def _stop_words(language: str) -> frozenset[str]:
+    return frozenset(get_stop_words(language))
+
+
 class Sumy(Summarizer):
-    @with_valid_options()
+    @with_valid_options(**registry.options("Sumy"))
     def __init__(self, options):
         if not options:
             options = {}
-        download("punkt_tab")
+        _download_punkt()
+
+        self.language = options.get("language", "english")
+        self.algorithm = options.get("algorithm", "lsa").lower()
+        self.sentences = options.get("sentences", 1)
+        if self.algorithm not in _ALGORITHMS:
+            raise ValueError(
+                f"Unknown algorithm {self.algorithm}, "
+                f"expected one of {', '.join(_ALGORITHMS)}"
+            )
+
+        self.tokenizer = _tokenizer(self.language)
+        stemmer = _stemmer(self.language) if options.get("stem") else null_stemmer
+        self.summarizer = _ALGORITHMS[self.algorithm](stemmer)
+        if options.get("stop_words"):
+            self.summarizer.stop_words = _stop_words(self.language)
 
     def summarize(self, texts) -> list[str]:
         if isinstance(texts, list):
             return self._summary_multi(texts)
         return [self._summarize_single(texts[0])]
 
-    @staticmethod
-    def _summarize_single(text):
-        parser = PlaintextParser.from_string(str(text), Tokenizer("english"))
-        summarizer = LsaSummarizer()
-        summary = summarizer(parser.document, 1)
-        if len(summary) == 0:
-            return ""
-        return str(summary[0])
+    def _summarize_single(self, text):
+        parser = PlaintextParser.from_string(str(text), self.tokenizer)
+        summary = self.summarizer(parser.document, self.sentences)
+        return " ".join(str(sentence) for sentence in summary)
 
     def _summary_multi(self, texts):
         return [self._summarize_single(text) for text in texts]
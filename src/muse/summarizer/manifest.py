@@ -0,0 +1,135 @@
+"""
+Declarations of the builtin summarizers.
+
+Each summarizer is declared with the module it lives in and the options it accepts, so the
+summarizers can be listed, described and configured without importing torch, transformers or
+spacy. The module of a summarizer is only imported when the summarizer is resolved.
+
+The extractive summarizers are declared `parallel`, as they are bound by the cpu: `--workers` runs
+them over a pool of processes. The transformer summarizers would load a copy of their model in each
+process, they batch their texts instead.
+"""
+
+from muse.summarizer.summarizer import Summarizer
+from muse.utils.registry import Registry
+
+registry = Registry(Summarizer)
+
+_DEVICE = {
+    "type": str,
+    "default": None,
+    "help": "The device to use, defaults to cuda if available, otherwise cpu",
+}
+_PRECISION = {
+    "type": str,
+    "default": "fp32",
+    "help": "The precision of the model, one of fp32, bf16 (bfloat16 weights) or int8-dynamic "
+    "(dynamically quantized linear layers, cpu only)",
+}
+_BACKEND = {
+    "type": str,
+    "default": "torch",
+    "help": "The backend running the model, torch or onnx (exported once to the models "
+    "directory and run by ONNX Runtime, fp32 only, needs optimum[onnxruntime])",
+}
+_BATCH_SIZE = {
+    "type": int,
+    "default": 8,
+    "help": "The number of texts generated together, texts of similar length are batched together",
+}
+_NUM_WORKERS = {
+    "type": int,
+    "default": 0,
+    "help": "The number of processes preparing the next batches in the background, 0 prepares "
+    "them in the main process",
+}
+
+registry.declare(
+    "Conversation",
+    "muse.summarizer.abstractive.conversation",
+    device=_DEVICE,
+    precision=_PRECISION,
+    batch_size=_BATCH_SIZE,
+    num_workers=_NUM_WORKERS,
+)
+registry.declare(
+    "CrossSum",
+    "muse.summarizer.abstractive.crossSum",
+    model_name={
+        "type": str,
+        "default": "csebuetnlp/mT5_m2m_crossSum",
+        "help": "The model name to use",
+    },
+    device=_DEVICE,
+    precision=_PRECISION,
+    backend=_BACKEND,
+    batch_size=_BATCH_SIZE,
+)
+registry.declare(
+    "FalconsAI",
+    "muse.summarizer.abstractive.falconsAI",
+    device=_DEVICE,
+    precision=_PRECISION,
+    backend=_BACKEND,
+    batch_size=_BATCH_SIZE,
+    num_workers=_NUM_WORKERS,
+)
+registry.declare(
+    "MT5",
+    "muse.summarizer.abstractive.mT5",
+    model_name={
+        "type": str,
+        "default": "csebuetnlp/mT5_multilingual_XLSum",
+        "help": "The model name to use",
+    },
+    device=_DEVICE,
+    precision=_PRECISION,
+    backend=_BACKEND,
+    batch_size=_BATCH_SIZE,
+)
+registry.declare(
+    "Spacy",
+    "muse.summarizer.extractive.spacy_connector",
+    parallel=True,
+    language_spacy={
+        "type": str,
+        "default": "en_core_web_sm",
+        "help": "The language model to use",
+    },
+    batch_size={
+        "type": int,
+        "default": 64,
+        "help": "The number of texts parsed together",
+    },
+    n_process={
+        "type": int,
+        "default": 1,
+        "help": "The number of processes parsing the texts",
+    },
+)
+registry.declare(
+    "Sumy",
+    "muse.summarizer.extractive.sumy_connector",
+    parallel=True,
+    algorithm={
+        "type": str,
+        "default": "lsa",
+        "help": "The algorithm to use, one of lsa, lexrank, luhn or textrank",
+    },
+    sentences={
+        "type": int,
+        "default": 1,
+        "help": "The number of sentences of the summaries",
+    },
+    language={
+        "type": str,
+        "default": "english",
+        "help": "The language of the tokenizer, stemmer and stopwords",
+    },
+    stem={"type": bool, "default": False, "help": "Whether to stem the words"},
+    stop_words={
+        "type": bool,
+        "default": False,
+        "help": "Whether to ignore the stopwords of the language",
+    },
+)
@@ -0,0 +1,158 @@
+"""
+Parallel summarization over a pool of processes, for the summarizers bound by the cpu.
+
+Each worker resolves its own summarizer once, from its name and options, then summarizes chunks of
+the texts as it becomes free, so a worker that finishes early takes the next chunk. The texts are
+chunked longest first, so the long texts are not left for the end, and there are several chunks per
+worker to even out the skew of the remaining ones.
+
+Only the summarizers declared `parallel` in the manifest are run over a pool, see
+`ParallelSummarizer`.
+"""
+
+import math
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+from muse.summarizer.abstractive.batching import length_buckets
+from muse.summarizer.manifest import registry
+from muse.summarizer.resolver import resolve_summarizer
+from muse.summarizer.summarizer import Summarizer
+
+__all__ = ["ParallelSummarizer", "chunk_size_for", "summarize_parallel"]
+
+_CHUNKS_PER_WORKER = 8
+_MAX_CHUNK_SIZE = 32
+
+_summarizer: Summarizer | None = None
+
+
+def _init_worker(summarizer_system: str, options: dict[str, any]):
+    global _summarizer
+    _summarizer = resolve_summarizer(summarizer_system, options)
+
+
+def _summarize_chunk(texts) -> list[str]:
+    return _summarizer.summarize(texts)
+
+
+def _model_identity() -> dict[str, any]:
+    return _summarizer.model_identity()
+
+
+def chunk_size_for(texts: int, workers: int) -> int:
+    """
+    Get the number of texts per chunk, leaving several chunks for each worker.
+
+    :param texts: The number of texts.
+    :param workers: The number of workers.
+    :return: The chunk size.
+    """
+    chunks = max(1, workers) * _CHUNKS_PER_WORKER
+    return max(1, min(_MAX_CHUNK_SIZE, math.ceil(texts / chunks)))
+
+
+class ParallelSummarizer:
+    """
+    A summarizer run over a pool of processes, each with its own instance of the summarizer.
+
+    It summarizes and identifies its model like the summarizer, but is not a `Summarizer`, so it is
+    never listed among the summarizers.
+
+    The summarizer is never built in this process. The pool is started when the summarizer is
+    entered as a context manager, and kept until it is exited, so the summarizers of the workers are
+    built once for all the texts summarized in between. Outside of a context, each call starts a
+    pool of its own.
+    """
+
+    def __init__(self, summarizer_system: str, options: dict[str, any], workers: int):
+        """
+        :param summarizer_system: The name of the summarizer, as given to `resolve_summarizer`.
+        :param options: The options of the summarizer.
+        :param workers: The number of processes.
+        """
+        self.summarizer_system = str(summarizer_system)
+        self.options = options
+        self.workers = workers
+        # The class of the summarizer, its module is imported but no model is loaded
+        self.summarizer_class = registry.get(self.summarizer_system)
+        self._executor: Executor | None = None
+        self._depth = 0
+        self._identity = None
+
+    @staticmethod
+    def supports(summarizer_system: str) -> bool:
+        """
+        Check whether a summarizer is worth running over a pool of processes.
+
+        :param summarizer_system: The name of the summarizer.
+        :return: Whether the summarizer is declared `parallel` in the manifest.
+        """
+        return registry.parallel(str(summarizer_system))
+
+    def __enter__(self) -> "ParallelSummarizer":
+        if self._depth == 0:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self.summarizer_system, self.options),
+            )
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc_info):
+        self._depth -= 1
+        if self._depth == 0:
+            self._executor.shutdown()
+            self._executor = None
+
+    def summarize(self, texts, chunk_size: int | None = None) -> list[str]:
+        """
+        Summarize the texts over the pool of processes.
+
+        :param texts: The texts to summarize.
+        :param chunk_size: The number of texts per chunk, defaults to several chunks per worker.
+        :return: The summaries, in the order of the texts.
+        """
+        if not texts:
+            return []
+        if chunk_size is None:
+            chunk_size = chunk_size_for(len(texts), self.workers)
+
+        chunks = length_buckets([len(str(text)) for text in texts], chunk_size)
+        summaries = [""] * len(texts)
+        with self:
+            results = self._executor.map(
+                _summarize_chunk, [[texts[i] for i in chunk] for chunk in chunks]
+            )
+            for chunk, chunk_summaries in zip(chunks, results):
+                for i, summary in zip(chunk, chunk_summaries):
+                    summaries[i] = summary
+        return summaries
+
+    def model_identity(self) -> dict[str, any]:
+        # Identified by the summarizer of a worker, once
+        if self._identity is None:
+            with self:
+                self._identity = self._executor.submit(_model_identity).result()
+        return self._identity
+
+
+def summarize_parallel(
+    summarizer_system: str,
+    options: dict[str, any] | None,
+    texts: list,
+    workers: int,
+    chunk_size: int | None = None,
+) -> list[str]:
+    """
+    Summarize the texts over a pool of processes, started for this call only.
+
+    :param summarizer_system: The name of the summarizer, as given to `resolve_summarizer`.
+    :param options: The options of the summarizer.
+    :param texts: The texts to summarize.
+    :param workers: The number of processes.
+    :param chunk_size: The number of texts per chunk, defaults to several chunks per worker.
+    :return: The summaries, in the order of the texts.
+    """
+    summarizer = ParallelSummarizer(summarizer_system, options, workers)
+    return summarizer.summarize(texts, chunk_size)
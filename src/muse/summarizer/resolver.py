@@ -1,3 +1,4 @@
+from muse.summarizer.manifest import registry
 from muse.summarizer.summarizer import Summarizer
 from muse.utils.plugins import import_from_plugin
 from muse.utils.resource_errors import UnknownResourceError
@@ -9,49 +10,43 @@ def resolve_summarizer(
     """
     Import summarizer using the plugins.
 
+    Only the module of the resolved summarizer is imported.
+
     :param summarizer_system: The summarizer to import.
     :param options: Options to initialize the evaluation metric.
     :return: The summarizer.
     :raises UnknownResourceError: If the evaluation metric is not found.
     """
 
-    summarizers = Summarizer.__subclasses__()
-    summarizers.sort(key=lambda x: x.plugin, reverse=True)
-    for summarizer in summarizers:
-        if summarizer.__name__.lower() == str(summarizer_system).lower():
-            return summarizer(options)
+    summarizer = registry.get(str(summarizer_system))
+    if summarizer is None:
+        raise UnknownResourceError(summarizer_system)
 
-    raise UnknownResourceError(summarizer_system)
+    return summarizer(options)
 
 
 def get_available_summarizers() -> list[str]:
     """
-    Get all the available summarizers.
+    Get all the available summarizers, without importing them.
 
     :return: List of available summarizers.
     """
 
-    return [importer.__name__ for importer in Summarizer.__subclasses__()]
+    return registry.names()
 
 
 def get_summarizers_options() -> list[tuple[str, dict[str, any]]]:
     """
-    Get the options for all the available summarizers.
+    Get the options for all the available summarizers, without importing them.
 
     :return: List of tuples containing the name of the summarizer and its options.
     """
 
-    return [
-        (
-            importer.__name__,
-            (
-                importer.__init__.valid_options()
-                if hasattr(importer.__init__, "valid_options")
-                else {}
-            ),
-        )
-        for importer in Summarizer.__subclasses__()
-    ]
+    return registry.describe()
 
 
-import_from_plugin("summarizers", Summarizer, "summarizer", "summarizer", "summarizers")
+registry.add_discovery(
+    lambda: import_from_plugin(
+        "summarizers", Summarizer, "summarizer", registry=registry
+    )
+)
@@ -39,3 +39,23 @@ class Summarizer(ABC):
         if not hasattr(cls.__init__, "valid_options"):
             return {}
         return cls.__init__.valid_options()
+
+    def model_identity(self) -> dict[str, any]:
+        """
+        Identify the model of the summarizer, part of the key of its cached summaries
+
+        So the cached summaries are not reused when the model changes. By default, the name and revision of the transformers model in the `model` attribute, or in
+        the `summarizer` pipeline.
+
+        :return: The identity of the model, empty if the summarizer has no model
+        """
+        model = getattr(self, "model", None)
+        if model is None:
+            model = getattr(getattr(self, "summarizer", None), "model", None)
+        config = getattr(model, "config", None)
+        if config is None:
+            return {}
+        return {
+            "model": getattr(config, "_name_or_path", None),
+            "revision": getattr(config, "_commit_hash", None),
+        }
@@ -1,6 +1,8 @@
+from muse.utils.cache import Cache
 from muse.utils.data_fetcher import fetch_data, fetch_datasets
 from muse.utils.decorators import with_valid_options
 from muse.utils.env import get_data_dir, get_models_dir, get_plugins_dir
+from muse.utils.registry import Registry
 from muse.utils.resource_errors import (
     InvalidResourceError,
     ResourceNotFoundError,
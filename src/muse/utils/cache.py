@@ -0,0 +1,199 @@
+"""
+Persistent caches, shared by the processes of a machine.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+from muse.utils.env import get_cache_dir
+
+__all__ = ["Cache"]
+
+# Stays below the maximum number of variables of a SQLite statement
+_BATCH = 500
+# The recency of the entries is a counter shared by all the processes, rather than a timestamp,
+# so the least recently used entry is never ambiguous
+_NEXT_USE = "(SELECT COALESCE(MAX(last_used), 0) + 1 FROM entries)"
+
+
+def _hash(text: str | None) -> str:
+    return "-" if text is None else hashlib.sha256(str(text).encode()).hexdigest()
+
+
+class Cache:
+    """
+    Persistent cache of strings, such as summaries or serialized results, by key.
+
+    The entries are stored in a SQLite database, which takes care of the locking when several
+    processes share the cache, and a lock serializes the threads of a process sharing the
+    connection. Once the entries stored exceed the size budget, the least recently used ones are
+    evicted. The total size of the entries is kept up to date by triggers, so it is not summed on
+    every insertion.
+    """
+
+    file_name = "cache.sqlite"
+
+    def __init__(self, path: str | Path | None = None, max_size: int = 1 << 30):
+        """
+        Open the cache, creating it if needed.
+
+        :param path: The database file, defaults to `file_name` in the MUSE_CACHE directory.
+        :param max_size: The budget, in bytes of entries, after which the least recently used
+                         entries are evicted.
+        :raises ValueError: If no path is given and there is no cache directory.
+        """
+        if path is None:
+            cache_dir = get_cache_dir()
+            if cache_dir is None:
+                raise ValueError("No cache directory, set MUSE_CACHE")
+            path = Path(cache_dir, self.file_name)
+
+        self.path = Path(path)
+        self.max_size = max_size
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Transactions are managed explicitly, so eviction happens along with the insertions
+        self._connection = sqlite3.connect(
+            self.path, timeout=60, isolation_level=None, check_same_thread=False
+        )
+        self._lock = threading.RLock()
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        # The entries replaced by INSERT OR REPLACE only fire the delete trigger with this on
+        self._connection.execute("PRAGMA recursive_triggers=ON")
+        with self._transaction():
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "size INTEGER NOT NULL, last_used INTEGER NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used)"
+            )
+            self._create_total()
+
+    def _create_total(self):
+        # The total size of the entries, summed once for the caches created without it
+        self._connection.execute("CREATE TABLE IF NOT EXISTS total (size INTEGER)")
+        if self._connection.execute("SELECT 1 FROM total").fetchone() is None:
+            self._connection.execute(
+                "INSERT INTO total SELECT COALESCE(SUM(size), 0) FROM entries"
+            )
+        self._connection.execute(
+            "CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries "
+            "BEGIN UPDATE total SET size = size + NEW.size; END"
+        )
+        self._connection.execute(
+            "CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries "
+            "BEGIN UPDATE total SET size = size - OLD.size; END"
+        )
+
+    @staticmethod
+    def keys(identity: dict[str, any], items: list) -> list[str]:
+        """
+        Get the keys of the entries of the items, for the component with the given identity.
+
+        :param identity: The identity of the component computing the entries, such as its class and
+                         options.
+        :param items: The inputs of each entry, either a text or a tuple of texts (or None).
+        :return: The keys, one per item.
+        """
+        prefix = _hash(json.dumps(identity, sort_keys=True, default=str))
+        keys = []
+        for item in items:
+            parts = item if isinstance(item, tuple) else (item,)
+            keys.append(_hash("\0".join([prefix, *map(_hash, parts)])))
+        return keys
+
+    def get(self, keys: list[str]) -> dict[str, str]:
+        """
+        Get the cached entries, marking them as recently used.
+
+        :param keys: The keys of the entries.
+        :return: The values found, by key.
+        """
+        found = {}
+        unique = list(dict.fromkeys(keys))
+        with self._lock:
+            for i in range(0, len(unique), _BATCH):
+                batch = unique[i : i + _BATCH]
+                rows = self._connection.execute(
+                    "SELECT key, value FROM entries "
+                    f"WHERE key IN ({', '.join('?' * len(batch))})",
+                    batch,
+                )
+                found.update(rows)
+
+        if found:
+            with self._transaction():
+                self._connection.executemany(
+                    f"UPDATE entries SET last_used = {_NEXT_USE} WHERE key = ?",
+                    [(key,) for key in found],
+                )
+        return found
+
+    def put(self, entries: dict[str, str]) -> int:
+        """
+        Store entries, evicting the least recently used ones if over the size budget.
+
+        :param entries: The entries, by key.
+        :return: The number of entries evicted.
+        """
+        if not entries:
+            return 0
+
+        with self._transaction():
+            self._connection.executemany(
+                f"INSERT OR REPLACE INTO entries VALUES (?, ?, ?, {_NEXT_USE})",
+                [(key, value, len(value.encode())) for key, value in entries.items()],
+            )
+            return self._evict()
+
+    def _evict(self) -> int:
+        (size,) = self._connection.execute("SELECT size FROM total").fetchone()
+        if size <= self.max_size:
+            return 0
+
+        evicted = []
+        rows = self._connection.execute(
+            "SELECT key, size FROM entries ORDER BY last_used"
+        )
+        for key, entry_size in rows:
+            if size <= self.max_size:
+                break
+            evicted.append((key,))
+            size -= entry_size
+        self._connection.executemany("DELETE FROM entries WHERE key = ?", evicted)
+        return len(evicted)
+
+    @contextmanager
+    def _transaction(self):
+        # BEGIN IMMEDIATE takes the write lock up front, so concurrent writers wait on each other
+        # instead of failing to upgrade a read lock
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM entries"
+            ).fetchone()
+        return count
+
+    def clear(self):
+        """
+        Remove every cached value.
+        """
+        with self._transaction():
+            self._connection.execute("DELETE FROM entries")
+
+    def close(self):
+        self._connection.close()
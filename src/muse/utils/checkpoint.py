@@ -0,0 +1,102 @@
+"""
+Checkpoints of the results of a run, so an interrupted run can be resumed.
+
+The results computed for each document, such as the summaries of a summarizer or the scores of a
+metric, are appended to a JSONL file as they are produced, one line per document. Each line holds a
+key identifying the component and the document the result was computed for, so a resumed run only
+reuses the longest prefix of lines matching its configuration and data.
+"""
+
+import json
+import os
+import warnings
+from pathlib import Path
+
+__all__ = ["Checkpoint"]
+
+
+class Checkpoint:
+    """
+    Checkpoint of the results of a component for a list of documents, in a JSONL file.
+    """
+
+    def __init__(self, path: str | Path, keys: list[str], resume: bool = False):
+        """
+        Open the checkpoint, keeping the results already checkpointed if resuming.
+
+        :param path: The JSONL file of the checkpoint.
+        :param keys: The key of each document, such as `Cache.keys` of the component and documents.
+        :param resume: Whether to keep the results of the file matching the keys, otherwise the file
+                       is started over.
+        """
+        self.path = Path(path)
+        self.keys = keys
+        self.values: list[any] = self._read() if resume else []
+
+        # The file is rewritten with the results kept, dropping any stale or partial line
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            for key, value in zip(self.keys, self.values):
+                f.write(json.dumps({"key": key, "value": value}) + "\n")
+        os.replace(tmp_path, self.path)
+        self._file = open(self.path, "a")
+
+    def _read(self) -> list[any]:
+        if not self.path.is_file():
+            return []
+
+        values = []
+        with open(self.path, "r") as f:
+            for line, key in zip(f, self.keys):
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # The last line of an interrupted run may be incomplete
+                    break
+                if entry.get("key") != key:
+                    warnings.warn(
+                        f"The checkpoint {self.path} does not match the configuration or data "
+                        f"after {len(values)} documents, the rest is computed again"
+                    )
+                    break
+                values.append(entry["value"])
+        return values
+
+    @property
+    def remaining(self) -> int:
+        """
+        The number of documents without a checkpointed result.
+        """
+        return len(self.keys) - len(self.values)
+
+    def append(self, values: list[any]):
+        """
+        Checkpoint the results of the next documents.
+
+        :param values: The results, which must be JSON-serializable, in the order of the documents.
+        """
+        if len(values) > self.remaining:
+            raise ValueError(
+                f"Got {len(values)} results for {self.remaining} remaining documents"
+            )
+
+        keys = self.keys[len(self.values) : len(self.values) + len(values)]
+        self._file.write(
+            "".join(
+                json.dumps({"key": key, "value": value}) + "\n"
+                for key, value in zip(keys, values)
+            )
+        )
+        # Flushed, so the results survive the process being killed
+        self._file.flush()
+        self.values.extend(values)
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self) -> "Checkpoint":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,197 @@
+"""
+Pipelines of stages running in threads, connected by bounded queues.
+
+Each stage times the work it does, the time it waits on its input queue and the time it is blocked
+on a full output queue, so the report of a pipeline shows which stage is the bottleneck: its
+utilization is high while the other stages wait on it. Threads suit stages that release the GIL,
+such as the generation of the models, overlapping with the stages that hold it.
+"""
+
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable
+
+__all__ = ["DONE", "Pipeline", "Stage"]
+
+# Marks the end of the items of a queue
+DONE = object()
+
+# How often the stages waiting on a queue check whether the pipeline failed, in seconds
+_POLL = 0.1
+
+
+class _Stopped(Exception):
+    pass
+
+
+class Stage:
+    """
+    A stage of a pipeline, run by one or more threads.
+    """
+
+    def __init__(self, pipeline: "Pipeline", name: str, workers: int = 1):
+        self.pipeline = pipeline
+        self.name = name
+        self.workers = workers
+        self.busy = 0.0
+        self.waiting = 0.0
+        self.blocked = 0.0
+        self._lock = threading.Lock()
+
+    def _add(self, attribute: str, seconds: float):
+        with self._lock:
+            setattr(self, attribute, getattr(self, attribute) + seconds)
+
+    @contextmanager
+    def work(self):
+        """
+        Time the work done by the stage.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._add("busy", time.perf_counter() - start)
+
+    def get(self, items: queue.Queue) -> any:
+        """
+        Get the next item of a queue, waiting for it.
+
+        :param items: The input queue.
+        :return: The item, or `DONE` once the producers are done.
+        """
+        start = time.perf_counter()
+        try:
+            while True:
+                self.pipeline.check()
+                try:
+                    return items.get(timeout=_POLL)
+                except queue.Empty:
+                    pass
+        finally:
+            self._add("waiting", time.perf_counter() - start)
+
+    def put(self, items: queue.Queue, item: any):
+        """
+        Put an item in a queue, waiting for room in it.
+
+        :param items: The output queue.
+        :param item: The item.
+        """
+        start = time.perf_counter()
+        try:
+            while True:
+                self.pipeline.check()
+                try:
+                    return items.put(item, timeout=_POLL)
+                except queue.Full:
+                    pass
+        finally:
+            self._add("blocked", time.perf_counter() - start)
+
+    def report(self, seconds: float) -> dict[str, float]:
+        """
+        Report the time spent by the stage.
+
+        :param seconds: The duration of the pipeline.
+        :return: The seconds spent working, waiting on the input and blocked on the output, summed
+                 over the threads of the stage, and the share of the time the threads were working.
+        """
+        return {
+            "busy": self.busy,
+            "waiting": self.waiting,
+            "blocked": self.blocked,
+            "utilization": self.busy / (seconds * self.workers) if seconds else 0.0,
+        }
+
+
+class Pipeline:
+    """
+    Pipeline of stages, each running a function in its threads until its input is done.
+
+    When a stage fails, the other stages stop at their next access to a queue, and `run` raises the
+    error of the failed stage.
+    """
+
+    def __init__(self, queue_size: int = 2):
+        """
+        :param queue_size: The number of items each queue holds before blocking its producers.
+        """
+        self.queue_size = queue_size
+        self.stages: list[Stage] = []
+        self.seconds = 0.0
+        self._targets: list[tuple[Stage, Callable[[Stage], None]]] = []
+        self._errors: list[BaseException] = []
+        self._failed = threading.Event()
+
+    def queue(self) -> queue.Queue:
+        """
+        Create a queue connecting two stages.
+
+        :return: The queue.
+        """
+        return queue.Queue(maxsize=self.queue_size)
+
+    def stage(
+        self, name: str, target: Callable[[Stage], None], workers: int = 1
+    ) -> Stage:
+        """
+        Add a stage to the pipeline.
+
+        :param name: The name of the stage, in the report.
+        :param target: The function run by each thread of the stage, given the stage.
+        :param workers: The number of threads running the stage.
+        :return: The stage.
+        """
+        stage = Stage(self, name, workers)
+        self.stages.append(stage)
+        self._targets.extend((stage, target) for _ in range(workers))
+        return stage
+
+    def check(self):
+        """
+        Stop the calling stage if another stage failed.
+        """
+        if self._failed.is_set():
+            raise _Stopped()
+
+    def _run_target(self, stage: Stage, target: Callable[[Stage], None]):
+        try:
+            target(stage)
+        except _Stopped:
+            pass
+        except BaseException as e:
+            self._errors.append(e)
+            self._failed.set()
+
+    def run(self):
+        """
+        Run all the stages until they are done.
+
+        :raises: The error of the first stage that failed, if any.
+        """
+        start = time.perf_counter()
+        threads = [
+            threading.Thread(
+                target=self._run_target, args=(stage, target), name=stage.name
+            )
+            for stage, target in self._targets
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.seconds = time.perf_counter() - start
+
+        if self._errors:
+            raise self._errors[0]
+
+    def report(self) -> dict[str, dict[str, float]]:
+        """
+        Report the time spent by each stage, see `Stage.report`.
+
+        :return: The report of each stage, by name.
+        """
+        return {stage.name: stage.report(self.seconds) for stage in self.stages}
@@ -1,41 +1,253 @@
-import importlib
+"""
+Discovery of the plugins in the MUSE_PLUGINS directory.
+
+Discovering the plugins of a folder requires executing every python file in it, to find the classes
+it defines. To avoid doing this on every start, the classes (and their options) found in each file
+are stored in a discovery cache in the MUSE_CACHE directory, keyed by the path of the file, and
+validated against its modification time, size and hash.
+
+When a registry is given, the classes found in the cache are only declared to the registry, and the
+plugin file is only executed once one of its classes is loaded.
+"""
+
+import builtins
+import hashlib
+import json
 import os
-import sys
+import time
+from pathlib import Path
 
-from muse.utils.env import get_plugins_dir
+from muse.utils.env import get_cache_dir, get_plugins_dir
+from muse.utils.registry import Declaration, Registry, import_from_path
 
+__all__ = [
+    "import_from_plugin",
+    "clear_plugin_cache",
+    "get_plugin_discovery_report",
+]
 
-def _importer_handler(path: str, base_class: type, plugin_folder: str):
-    for importer_file in os.listdir(path):
-        if importer_file.endswith(".py"):
-            spec = importlib.util.spec_from_file_location(
-                f"muse.plugins.{plugin_folder}.{importer_file[:-3]}",
-                os.path.join(path, importer_file),
-            )
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            sys.modules[f"muse.plugins.{plugin_folder}.{importer_file[:-3]}"] = module
+_CACHE_VERSION = 1
+
+_discovery_report: list[dict[str, any]] = []
+
+
+def _get_cache_file() -> Path | None:
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return None
+    return Path(cache_dir, "plugins.json")
+
+
+def _read_cache() -> dict[str, any]:
+    cache_file = _get_cache_file()
+    if cache_file is None or not cache_file.is_file():
+        return {}
+
+    try:
+        with open(cache_file, "r") as f:
+            cache = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+    if cache.get("version") != _CACHE_VERSION:
+        return {}
+    return cache.get("files", {})
 
-            for name, obj in module.__dict__.items():
-                if (
-                    isinstance(obj, type)
-                    and issubclass(obj, base_class)
-                    and obj != base_class
-                ):
-                    obj.plugin = True
 
+def _write_cache(files: dict[str, any]):
+    cache_file = _get_cache_file()
+    if cache_file is None:
+        return
 
-def import_from_plugin(plugin_folder: str, base_class: type, *alternative_folders: str):
+    # Written to a temporary file first, so concurrent processes never read a partial cache
+    try:
+        os.makedirs(cache_file.parent, exist_ok=True)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, "w") as f:
+            json.dump({"version": _CACHE_VERSION, "files": files}, f)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+
+def clear_plugin_cache():
+    """
+    Invalidate the plugin discovery cache, so every plugin is executed again on its next discovery.
+    """
+    cache_file = _get_cache_file()
+    if cache_file is not None and cache_file.is_file():
+        os.remove(cache_file)
+
+
+def get_plugin_discovery_report() -> list[dict[str, any]]:
+    """
+    Get the timings of the plugin discoveries of this process.
+
+    Each entry has the plugin `file`, the `base_class` it was searched for, the `classes` found,
+    the cache `status` ("hit", "rehashed" when the file was touched but not changed, or "miss" when
+    the file had to be executed) and the `seconds` taken.
+
+    :return: List of entries, one per plugin file discovered.
+    """
+    return [dict(entry) for entry in _discovery_report]
+
+
+def _hash_file(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _dump_options(options: dict[str, dict[str, any]]) -> dict[str, dict[str, any]]:
+    dumped = {}
+    for name, meta in options.items():
+        meta = dict(meta)
+        meta["type"] = getattr(meta.get("type"), "__name__", "str")
+        try:
+            json.dumps(meta["default"])
+        except (TypeError, ValueError, KeyError):
+            meta["default"] = str(meta.get("default"))
+        dumped[name] = meta
+    return dumped
+
+
+def _load_options(options: dict[str, dict[str, any]]) -> dict[str, dict[str, any]]:
+    # Only the name of the type is cached, which is enough to describe the option
+    return {
+        name: {**meta, "type": getattr(builtins, meta["type"], str)}
+        for name, meta in options.items()
+    }
+
+
+def _discover_file(path: str, module_name: str, base_class: type) -> dict[str, any]:
+    module = import_from_path(module_name, path)
+
+    classes = {}
+    for name, obj in module.__dict__.items():
+        if (
+            isinstance(obj, type)
+            and issubclass(obj, base_class)
+            and obj != base_class
+            and obj.__module__ == module_name
+        ):
+            obj.plugin = True
+            classes[name] = _dump_options(obj.valid_options())
+    return classes
+
+
+def _importer_handler(
+    path: str,
+    base_class: type,
+    plugin_folder: str,
+    cache: dict[str, any],
+    registry: Registry | None,
+) -> bool:
+    changed = False
+    base_name = f"{base_class.__module__}.{base_class.__name__}"
+    seen = set()
+    for importer_file in sorted(os.listdir(path)):
+        if not importer_file.endswith(".py"):
+            continue
+
+        start = time.perf_counter()
+        file_path = os.path.abspath(os.path.join(path, importer_file))
+        module_name = f"muse.plugins.{plugin_folder}.{importer_file[:-3]}"
+        key = f"{file_path}:{base_name}"
+        seen.add(key)
+        stat = os.stat(file_path)
+        entry = cache.get(key)
+
+        if (
+            entry
+            and entry["mtime"] == stat.st_mtime_ns
+            and entry["size"] == stat.st_size
+        ):
+            status = "hit"
+        else:
+            digest = _hash_file(file_path)
+            if entry and entry["sha256"] == digest:
+                status = "rehashed"
+            else:
+                status = "miss"
+                entry = {
+                    "sha256": digest,
+                    "classes": _discover_file(file_path, module_name, base_class),
+                }
+            entry = {**entry, "mtime": stat.st_mtime_ns, "size": stat.st_size}
+            cache[key] = entry
+            changed = True
+
+        if registry is None:
+            for name in entry["classes"]:
+                Declaration(name, module_name, plugin=True, path=file_path).load()
+        else:
+            for name, options in entry["classes"].items():
+                registry.add(
+                    Declaration(
+                        name,
+                        module_name,
+                        _load_options(options),
+                        plugin=True,
+                        path=file_path,
+                    )
+                )
+
+        _discovery_report.append(
+            {
+                "file": file_path,
+                "base_class": base_class.__name__,
+                "classes": list(entry["classes"]),
+                "status": status,
+                "seconds": time.perf_counter() - start,
+            }
+        )
+
+    # Forget the plugins that were removed from the folder
+    folder = os.path.abspath(path)
+    for key in list(cache):
+        file_path, _, key_base_name = key.rpartition(":")
+        if (
+            key not in seen
+            and key_base_name == base_name
+            and os.path.dirname(file_path) == folder
+        ):
+            del cache[key]
+            changed = True
+
+    return changed
+
+
+def import_from_plugin(
+    plugin_folder: str,
+    base_class: type,
+    *alternative_folders: str,
+    registry: Registry | None = None,
+):
     """
     Import all the importers from the plugins directory.
 
     :param plugin_folder: The folder where the importers are stored.
     :param base_class: The base class of the importers.
     :param alternative_folders: Alternative folders where the importers are stored.
+    :param registry: The registry to declare the plugins to. If given, plugins found in the discovery
+                     cache are only executed when one of their classes is loaded from the registry,
+                     otherwise all the plugins are executed.
     """
 
     plugins_dir = get_plugins_dir()
-    if os.path.exists(plugins_dir):
-        for folder in plugin_folder, *alternative_folders:
-            if os.path.exists(os.path.join(plugins_dir, folder)):
-                _importer_handler(os.path.join(plugins_dir, folder), base_class, folder)
+    if plugins_dir is None or not os.path.exists(plugins_dir):
+        return
+
+    cache = _read_cache()
+    changed = False
+    for folder in dict.fromkeys((plugin_folder, *alternative_folders)):
+        if os.path.exists(os.path.join(plugins_dir, folder)):
+            changed |= _importer_handler(
+                os.path.join(plugins_dir, folder),
+                base_class,
+                folder,
+                cache,
+                registry,
+            )
+
+    if changed:
+        _write_cache(cache)
@@ -0,0 +1,247 @@
+import importlib
+import importlib.util
+import sys
+from typing import Callable
+
+
+class Declaration:
+    """
+    A component declared by name, along with the module it lives in and the options it accepts.
+
+    The module is only imported when the component is loaded. Modules that are not importable by
+    name, such as plugins, are executed from the file given by `path`. Components bound by the cpu,
+    which are worth running over a pool of processes, are declared `parallel`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        module: str,
+        options: dict[str, dict[str, any]] | None = None,
+        plugin: bool = False,
+        path: str | None = None,
+        parallel: bool = False,
+    ):
+        self.name = name
+        self.module = module
+        self.options = options or {}
+        self.plugin = plugin
+        self.path = path
+        self.parallel = parallel
+
+    def load(self) -> type:
+        """
+        Import the module of the component and return the component class.
+
+        :return: The component class.
+        """
+        if self.path is not None:
+            module = import_from_path(self.module, self.path)
+        else:
+            module = importlib.import_module(self.module)
+
+        component = getattr(module, self.name)
+        if self.plugin:
+            component.plugin = True
+        return component
+
+
+def import_from_path(module_name: str, path: str):
+    """
+    Import a module from a file, unless a module with that name is already imported.
+
+    :param module_name: The name to register the module under in `sys.modules`.
+    :param path: The path to the python file.
+    :return: The module.
+    """
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    return module
+
+
+class Registry:
+    """
+    Registry of the components (summarizers, evaluations, ...) of one of the MuSE systems.
+
+    Builtin components are declared up front with their module and options, so they can be listed
+    and described without importing anything heavy (torch, transformers, spacy, ...). A component is
+    only imported once it is loaded, usually when it is resolved to be instantiated.
+
+    Subclasses of the base class that are not declared, such as plugins or classes defined by the
+    user, are found through `__subclasses__`. Plugins take priority over declared components, which
+    take priority over any other subclass. Plugins are discovered on the first use of the registry.
+    """
+
+    def __init__(self, base_class: type):
+        self.base_class = base_class
+        self._declarations: dict[tuple[str, str], Declaration] = {}
+        self._discoveries: list[Callable[[], None]] = []
+
+    def declare(
+        self,
+        name: str,
+        module: str,
+        plugin: bool = False,
+        parallel: bool = False,
+        **options,
+    ):
+        """
+        Declare a component without importing it.
+
+        :param name: The name of the component, which is also the name of its class in the module.
+        :param module: The module the component is defined in.
+        :param plugin: Whether the component comes from a plugin.
+        :param parallel: Whether the component is bound by the cpu, and worth running over a pool
+                         of processes.
+        :param options: The options accepted by the component, as given to `with_valid_options`.
+        """
+        self.add(Declaration(name, module, options, plugin, parallel=parallel))
+
+    def add(self, declaration: Declaration):
+        """
+        Add a declaration, replacing any declaration of the same component.
+
+        :param declaration: The declaration to add.
+        """
+        self._declarations[(declaration.module, declaration.name)] = declaration
+
+    def add_discovery(self, discover: Callable[[], None]):
+        """
+        Add a function discovering more components, such as plugins, run on first use of the registry.
+
+        :param discover: The function, which should declare the components it finds.
+        """
+        self._discoveries.append(discover)
+
+    def _declaration(self, name: str) -> Declaration | None:
+        # Builtin declarations take priority, so plugins never shadow `from muse.x import Name`
+        declarations = [d for d in self._declarations.values() if d.name == name]
+        declarations.sort(key=lambda d: d.plugin)
+        return declarations[0] if declarations else None
+
+    def __contains__(self, name: str) -> bool:
+        return self._declaration(name) is not None
+
+    def options(self, name: str) -> dict[str, dict[str, any]]:
+        """
+        Get the declared options of a component.
+
+        :param name: The name of the component.
+        :return: The options of the component.
+        """
+        if name not in self:
+            raise KeyError(name)
+        return dict(self._declaration(name).options)
+
+    def parallel(self, name: str) -> bool:
+        """
+        Check whether a component is declared as worth running over a pool of processes.
+
+        :param name: The name of the component (case-insensitive).
+        :return: Whether the component is declared `parallel`, False if it is not declared or is
+                 shadowed by a plugin.
+        """
+        declarations = [
+            d
+            for d in self._declarations.values()
+            if d.name.lower() == str(name).lower()
+        ]
+        return bool(declarations) and all(d.parallel for d in declarations)
+
+    def load(self, name: str) -> type:
+        """
+        Load a declared component.
+
+        :param name: The name of the component.
+        :return: The component class.
+        :raises AttributeError: If no component is declared with that name.
+        """
+        if name not in self:
+            raise AttributeError(f"No {self.base_class.__name__} named {name}")
+        return self._declaration(name).load()
+
+    def get(self, *names: str) -> type | None:
+        """
+        Load the first component, by priority, matching any of the given names (case-insensitive).
+
+        :param names: The names to look for.
+        :return: The component class, or None if there is no match.
+        """
+        names = [str(name).lower() for name in names]
+        for name, _, load, _ in self._components():
+            if name.lower() in names:
+                return load()
+        return None
+
+    def load_all(self) -> list[type]:
+        """
+        Load all the components, by priority.
+
+        :return: List of component classes.
+        """
+        components = []
+        for _, _, load, _ in self._components():
+            component = load()
+            if component not in components:
+                components.append(component)
+        return components
+
+    def names(self) -> list[str]:
+        """
+        Get the names of all the available components, without loading them.
+
+        :return: List of component names.
+        """
+        names = []
+        for name, *_ in self._components():
+            if name not in names:
+                names.append(name)
+        return names
+
+    def describe(self) -> list[tuple[str, dict[str, any]]]:
+        """
+        Get the names and options of all the available components, without loading them.
+
+        :return: List of tuples containing the name of the component and its options.
+        """
+        described = {}
+        for name, _, _, options in self._components():
+            described.setdefault(name, options())
+        return list(described.items())
+
+    def _components(self):
+        while self._discoveries:
+            self._discoveries.pop(0)()
+
+        declared = list(self._declarations.values())
+        undeclared = [
+            cls
+            for cls in self.base_class.__subclasses__()
+            if not any(
+                d.name == cls.__name__ and d.module == cls.__module__ for d in declared
+            )
+        ]
+
+        loaded = [
+            (cls.__name__, cls.plugin, lambda cls=cls: cls, cls.valid_options)
+            for cls in undeclared
+        ]
+        lazy = [
+            (d.name, d.plugin, d.load, lambda d=d: dict(d.options)) for d in declared
+        ]
+
+        return (
+            [c for c in loaded if c[1]]
+            + [c for c in lazy if c[1]]
+            + [c for c in lazy if not c[1]]
+            + [c for c in loaded if not c[1]]
+        )
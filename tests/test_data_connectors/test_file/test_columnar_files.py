@@ -2,7 +2,7 @@ import os.path
 
 from pytest import fixture
 
-from muse.data_importer import import_data
+from muse.data_importer import import_data, iter_data
 
 
 @fixture
@@ -78,3 +78,115 @@ def test_import_parquet_csv(conversation_csv_path):
     documents = import_data(conversation_csv_path, "conversation", "en")
     assert isinstance(documents, list)
     assert len(documents) == 9
+
+
+def test_import_metadata_columns(document_csv_path):
+    documents = import_data(
+        document_csv_path, "document", "en", {"metadata_columns": ["date", "press"]}
+    )
+    assert documents[-1].metadata == {
+        "date": "2022-07-01 08:29:01",
+        "press": documents[-1].metadata["press"],
+    }
+
+
+def test_import_parquet_row_groups(tmp_path):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    path = tmp_path / "groups.parquet"
+    table = pa.table(
+        {
+            "text": [f"Text {i}" for i in range(10)],
+            "summary": [f"Summary {i}" for i in range(10)],
+            "id": list(range(10)),
+        }
+    )
+    pq.write_table(table, path, row_group_size=3)
+
+    documents = import_data(str(path), "document", "en")
+    assert [d.text for d in documents] == [f"Text {i}" for i in range(10)]
+    assert [d.metadata for d in documents] == [{"id": i} for i in range(10)]
+
+
+def test_iter_parquet_batches(tmp_path):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    path = tmp_path / "batches.parquet"
+    pq.write_table(pa.table({"text": [f"Text {i}" for i in range(10)]}), path)
+
+    documents = iter_data(str(path), "document", "en", batch_size=4)
+    assert not isinstance(documents, list)
+    assert next(documents).text == "Text 0"
+    assert [d.text for d in documents] == [f"Text {i}" for i in range(1, 10)]
+
+
+def test_iter_csv(document_csv_path, multi_document_csv_path):
+    for path, document_type in [
+        (document_csv_path, "document"),
+        (multi_document_csv_path, "multi-document"),
+    ]:
+        documents = import_data(path, document_type, "en")
+        iterated = list(iter_data(path, document_type, "en", batch_size=2))
+        assert [str(d) for d in iterated] == [str(d) for d in documents]
+        assert [d.metadata for d in iterated] == [d.metadata for d in documents]
+
+
+def test_import_parquet_selection(tmp_path):
+    import pyarrow as pa
+    import pyarrow.csv as csv
+    import pyarrow.parquet as pq
+
+    from muse.data_importer.selection import Selection
+
+    table = pa.table(
+        {
+            "text": [f"Text {i}" for i in range(100)],
+            "id": list(range(100)),
+            "lang": ["en" if i % 3 else "fr" for i in range(100)],
+        }
+    )
+    pq.write_table(table, tmp_path / "data.parquet", row_group_size=10)
+    csv.write_csv(table, tmp_path / "data.csv")
+
+    sample = Selection({"sample_fraction": 0.2})
+    for path in [str(tmp_path / "data.parquet"), str(tmp_path / "data.csv")]:
+
+        def ids(options):
+            documents = iter_data(path, "document", "en", options, batch_size=7)
+            return [d.metadata["id"] for d in documents]
+
+        assert ids({"offset": 18, "limit": 4}) == [18, 19, 20, 21]
+        assert ids({"num_shards": 30, "shard_index": 29}) == [29, 59, 89]
+        assert ids({"sample_fraction": 0.2}) == [
+            i for i in range(100) if sample.keeps(i)
+        ]
+        metadata_filter = {"lang": "fr", "id": {"min": 40}}
+        assert ids({"metadata_filter": metadata_filter, "limit": 3}) == [42, 45, 48]
+
+
+def test_import_empty_files(tmp_path):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    csv_path = tmp_path / "empty.csv"
+    csv_path.write_text("text,summary,multi_doc_id\n")
+    parquet_path = tmp_path / "empty.parquet"
+    pq.write_table(
+        pa.table(
+            {"text": [], "summary": [], "multi_doc_id": []},
+            pa.schema(
+                [
+                    ("text", pa.string()),
+                    ("summary", pa.string()),
+                    ("multi_doc_id", pa.int64()),
+                ]
+            ),
+        ),
+        parquet_path,
+    )
+
+    for path in (csv_path, parquet_path):
+        assert import_data(str(path), "document", "en") == []
+        assert import_data(str(path), "multi-document", "en") == []
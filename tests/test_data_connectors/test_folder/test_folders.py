@@ -1,8 +1,9 @@
+import json
 import os.path
 
 from pytest import fixture
 
-from muse.data_importer import import_data
+from muse.data_importer import import_data, iter_data
 
 
 @fixture
@@ -72,3 +73,66 @@ def test_import_conversations_folder(conversations_path):
             assert conversation.summary.startswith(
                 "Person1 and Person2 are discussing weekend plans"
             )
+
+
+def test_iter_folder(document_path, multi_document_path, conversations_path):
+    for path, document_type in [
+        (document_path, "document"),
+        (multi_document_path, "multi-document"),
+        (conversations_path, "conversation"),
+    ]:
+        data = import_data(path, document_type, "en")
+        iterated = iter_data(path, document_type, "en")
+        assert not isinstance(iterated, list)
+        assert [str(d) for d in iterated] == [str(d) for d in data]
+
+
+def test_import_folder_grouped_by_stem(tmp_path):
+    for name in ["b", "a", "a.b"]:
+        (tmp_path / f"{name}.txt").write_text(f"Text {name}")
+        (tmp_path / f"{name}_summary.txt").write_text(f"Summary {name}")
+    (tmp_path / "a_metadata.json").write_text('[{"author": "Someone"}]')
+    (tmp_path / "c").mkdir()
+    (tmp_path / "c" / "first.txt").write_text("First text")
+    (tmp_path / "c" / "second.txt").write_text("Second text")
+    (tmp_path / "c" / "summary.txt").write_text("Summary c")
+    (tmp_path / "c" / "metadata.json").write_text('[{"author": "Someone else"}]')
+
+    multidocs = import_data(str(tmp_path), "multi-document", "en", {"workers": 2})
+    assert [m.metadata["resource_name"] for m in multidocs] == [
+        "a.b.txt",
+        "a.txt",
+        "b.txt",
+        "c",
+    ]
+    assert [m.summary for m in multidocs] == [
+        "Summary a.b",
+        "Summary a",
+        "Summary b",
+        "Summary c",
+    ]
+    assert multidocs[1].metadata == {
+        "id": "a.txt",
+        "author": "Someone",
+        "resource_name": "a.txt",
+    }
+    assert multidocs[3].metadata["author"] == "Someone else"
+    assert [d.text for d in multidocs[3].documents] == ["First text", "Second text"]
+
+
+def test_import_folder_selection(tmp_path):
+    for i in range(6):
+        (tmp_path / f"{i}.txt").write_text(f"Text {i}")
+        metadata = json.dumps([{"even": i % 2 == 0}])
+        (tmp_path / f"{i}_metadata.json").write_text(metadata)
+    # Only the selected files are read
+    (tmp_path / "6.txt").write_bytes(b"\xff")
+
+    documents = import_data(str(tmp_path), "document", "en", {"limit": 2})
+    assert [d.text for d in documents] == ["Text 0", "Text 1"]
+    options = {"num_shards": 3, "shard_index": 1}
+    documents = import_data(str(tmp_path), "document", "en", options)
+    assert [d.text for d in documents] == ["Text 1", "Text 4"]
+    options = {"metadata_filter": {"even": True}, "offset": 1, "limit": 2}
+    documents = import_data(str(tmp_path), "document", "en", options)
+    assert [d.text for d in documents] == ["Text 2", "Text 4"]
@@ -0,0 +1,144 @@
+import json
+
+from pytest import raises
+
+from muse.data_importer import import_data, iter_data
+from muse.data_importer.json import json_connector
+from muse.data_importer.json.json_connector import parse_json
+from muse.utils.resource_errors import InvalidResourceError
+
+
+def test_iter_json(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text(
+        json.dumps(
+            {
+                "data": [
+                    {"text": "First text", "summary": "First summary"},
+                    {"text": "Second text", "meta": {"id": 2}},
+                ]
+            }
+        )
+    )
+
+    documents = iter_data(str(path), "document", "en")
+    assert not isinstance(documents, list)
+    assert next(documents).summary == "First summary"
+    assert [d.metadata for d in documents] == [{"id": 2}]
+    assert [d.text for d in import_data(str(path), "document", "en")] == [
+        "First text",
+        "Second text",
+    ]
+
+
+def test_iter_json_conversation(tmp_path):
+    path = tmp_path / "conversation.json"
+    path.write_text(
+        json.dumps(
+            [
+                {
+                    "summary": "A greeting",
+                    "conversation_units": [
+                        {"speaker": "Person1", "text": "Hello"},
+                        {"speaker": "Person2", "text": "Hi"},
+                    ],
+                }
+            ]
+        )
+    )
+
+    conversations = list(iter_data(str(path), "conversation", "en"))
+    assert [u.speaker for u in conversations[0].text_units] == ["Person1", "Person2"]
+
+
+def test_import_json_folder(tmp_path):
+    for i in range(5):
+        (tmp_path / f"{i}.json").write_text(
+            json.dumps({"text": f"Text {i}", "summary": f"Summary {i}"})
+        )
+
+    documents = import_data(str(tmp_path), "document", "en", {"workers": 2})
+    assert [d.text for d in documents] == [f"Text {i}" for i in range(5)]
+
+
+def test_import_json_folder_invalid_file(tmp_path):
+    (tmp_path / "valid.json").write_text(json.dumps({"text": "Text"}))
+    (tmp_path / "broken.json").write_text('{"text": ')
+    with raises(InvalidResourceError) as error:
+        import_data(str(tmp_path), "document", "en")
+    assert error.value.resource == str(tmp_path / "broken.json")
+
+    (tmp_path / "broken.json").write_text(json.dumps({"summary": "No text"}))
+    with raises(InvalidResourceError) as error:
+        import_data(str(tmp_path), "document", "en")
+    assert error.value.resource == str(tmp_path / "broken.json")
+    assert error.value.reason == "Text is required for a document"
+
+
+def test_parse_json_without_orjson(monkeypatch):
+    content = b'{"text": "Caf\\u00e9", "score": NaN, "ids": [1, 2]}'
+    parsed = parse_json(content)
+    monkeypatch.setattr(json_connector, "orjson", None)
+    assert repr(parse_json(content)) == repr(parsed)
+    with raises(json.JSONDecodeError):
+        parse_json(b'{"text": ')
+
+
+def test_iter_json_data_array_in_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(json_connector, "_CHUNK_SIZE", 8)
+    path = tmp_path / "data.json"
+    path.write_text(
+        json.dumps(
+            {
+                "version": 1,
+                "data": [{"text": f"Text {i}", "meta": {"id": i}} for i in range(20)],
+                "after": {"ignored": True},
+            },
+            indent=2,
+        )
+    )
+
+    documents = list(iter_data(str(path), "document", "en"))
+    assert [d.text for d in documents] == [f"Text {i}" for i in range(20)]
+    assert [d.metadata for d in documents] == [{"id": i} for i in range(20)]
+
+
+def test_import_json_lines(tmp_path):
+    lines = [
+        json.dumps({"text": f"Text {i}", "summary": f"Summary {i}"}) for i in range(3)
+    ]
+    for extension in ["jsonl", "ndjson"]:
+        path = tmp_path / f"data.{extension}"
+        path.write_text("\n".join(lines[:2]) + "\n\n" + lines[2] + "\n")
+        documents = import_data(str(path), "document", "en")
+        assert [d.summary for d in documents] == [f"Summary {i}" for i in range(3)]
+
+
+def test_import_json_lines_invalid_line(tmp_path):
+    path = tmp_path / "data.jsonl"
+    path.write_text(json.dumps({"text": "Text"}) + '\n{"text": \n')
+
+    documents = iter_data(str(path), "document", "en")
+    assert next(documents).text == "Text"
+    with raises(InvalidResourceError) as error:
+        next(documents)
+    assert error.value.reason.startswith("Invalid JSON on line 2")
+
+
+def test_import_json_selection(tmp_path):
+    records = [{"text": f"Text {i}", "meta": {"id": i}} for i in range(10)]
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps({"data": records}))
+    options = {"metadata_filter": {"id": [2, 5, 7, 9]}, "offset": 1, "limit": 2}
+    documents = import_data(str(path), "document", "en", options)
+    assert [d.text for d in documents] == ["Text 5", "Text 7"]
+
+    # The lines after the limit, or not in the shard, are not parsed
+    path = tmp_path / "data.jsonl"
+    lines = [json.dumps(r) for r in records]
+    path.write_text("\n".join(lines[:4] + ['{"text": '] + lines[5:]))
+    documents = import_data(str(path), "document", "en", {"limit": 3})
+    assert [d.text for d in documents] == ["Text 0", "Text 1", "Text 2"]
+    options = {"num_shards": 2, "shard_index": 1}
+    documents = import_data(str(path), "document", "en", options)
+    assert [d.text for d in documents] == [f"Text {i}" for i in [1, 3, 5, 7, 9]]
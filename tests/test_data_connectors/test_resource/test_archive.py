@@ -0,0 +1,90 @@
+import hashlib
+import json
+import tarfile
+import zipfile
+from pathlib import Path
+
+from pytest import fixture
+
+from muse.data_importer import handle_uri, import_data, resolve_resource
+from muse.data_importer.filesystem import LOCAL
+from muse.data_importer.source_target.line_index import LineIndex
+
+SOURCES = "First text.\nSecond text.\r\nThird text."
+TARGETS = "First summary.\nSecond summary.\nThird summary."
+
+
+@fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("MUSE_CACHE", str(tmp_path / "cache"))
+    return tmp_path / "cache"
+
+
+@fixture
+def pair_dir(tmp_path):
+    directory = tmp_path / "pair"
+    directory.mkdir()
+    (directory / "train.source").write_text(SOURCES, newline="")
+    (directory / "train.target").write_text(TARGETS)
+    return directory
+
+
+def _summaries(path):
+    return [document.summary for document in import_data(path, "document", "en")]
+
+
+def test_read_tar_in_place(tmp_path, cache_dir, pair_dir):
+    archive = tmp_path / "data.tar"
+    with tarfile.open(archive, "w") as tar:
+        tar.add(pair_dir, arcname="english")
+
+    resource = resolve_resource(str(archive / "english"))
+    assert resource.fs is not LOCAL
+    assert resource.resource_type == "directory"
+    assert resource.files == ["train.source", "train.target"]
+    assert _summaries(str(archive / "english")) == TARGETS.split("\n")
+    assert _summaries(str(archive / "english" / "train.target")) == TARGETS.split("\n")
+
+    # The members are mapped in place, and the archive never extracted
+    with LineIndex(archive / "english" / "train.source", fs=resource.fs) as index:
+        assert list(index) == ["First text.", "Second text.", "Third text."]
+    assert not (cache_dir / "extracted").exists()
+    assert len(list((cache_dir / "archive_index").iterdir())) == 1
+
+
+def test_read_zip_in_place(tmp_path, cache_dir):
+    archive = tmp_path / "data.zip"
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        zip_file.writestr("docs/one.txt", "Text one")
+        zip_file.writestr("docs/one_summary.txt", "Summary one")
+        zip_file.writestr("docs/one_metadata.json", json.dumps([{"lang": "en"}]))
+        zip_file.writestr("docs/two.txt", "Text two")
+        zip_file.writestr(
+            "data.jsonl",
+            '{"text": "First text.", "summary": "First summary."}\n{"text": "Text."}\n',
+            compress_type=zipfile.ZIP_DEFLATED,
+        )
+
+    documents = import_data(str(archive / "docs"), "document", "en")
+    assert [document.text for document in documents] == ["Text one", "Text two"]
+    assert documents[0].summary == "Summary one"
+    assert documents[0].metadata["lang"] == "en"
+
+    documents = import_data(str(archive / "data.jsonl"), "document", "en")
+    assert [document.text for document in documents] == ["First text.", "Text."]
+    assert not (cache_dir / "extracted").exists()
+
+
+def test_compressed_tar_is_extracted_once(tmp_path, cache_dir, pair_dir):
+    archive = tmp_path / "data.tar.gz"
+    with tarfile.open(archive, "w:gz") as tar:
+        tar.add(pair_dir, arcname="english")
+
+    resource = resolve_resource(str(archive / "english"))
+    assert resource.fs is LOCAL
+    digest = hashlib.sha256(archive.read_bytes()).hexdigest()
+    assert Path(resource) == cache_dir / "extracted" / digest / "english"
+    assert _summaries(str(archive / "english")) == TARGETS.split("\n")
+
+    assert handle_uri(str(archive)) == str(cache_dir / "extracted" / digest)
+    assert [p.name for p in (cache_dir / "extracted").iterdir()] == [digest]
@@ -0,0 +1,135 @@
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+from pytest import fixture, raises
+
+from muse.data_importer import fetcher, handle_uri
+from muse.utils.resource_errors import InvalidResourceError
+
+
+class FileHandler(BaseHTTPRequestHandler):
+    """
+    Serves the files of the server, with an ETag and byte ranges, cutting the responses after
+    `server.cut` bytes if set.
+    """
+
+    def do_GET(self):
+        self.server.requests.append(dict(self.headers))
+        content = self.server.files.get(self.path)
+        if content is None:
+            self.send_error(404)
+            return
+
+        etag = f'"{hashlib.md5(content).hexdigest()}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        start = 0
+        byte_range = self.headers.get("Range")
+        if byte_range and self.headers.get("If-Range") in (None, etag):
+            start = int(byte_range[len("bytes=") : -1])
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(content) - 1}/*")
+        else:
+            self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(content) - start))
+        self.end_headers()
+
+        body = content[start:]
+        if self.server.cut is not None:
+            body, self.server.cut = body[: self.server.cut], None
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FileHandler)
+    server.files, server.requests, server.cut = {}, [], None
+    server.url = f"http://127.0.0.1:{server.server_port}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("MUSE_CACHE", str(tmp_path / "cache"))
+    return tmp_path / "cache"
+
+
+def test_download_is_cached_and_revalidated(server, cache_dir):
+    server.files["/data.json"] = b'{"text": "Text"}'
+
+    path = fetcher.download(f"{server.url}/data.json")
+    assert Path(path).name == "data.json"
+    assert Path(path).read_bytes() == b'{"text": "Text"}'
+    assert Path(path).parent.name == hashlib.sha256(b'{"text": "Text"}').hexdigest()
+
+    assert fetcher.download(f"{server.url}/data.json") == path
+    assert "If-None-Match" in server.requests[-1]
+
+    server.files["/data.json"] = b'{"text": "New text"}'
+    new_path = fetcher.download(f"{server.url}/data.json")
+    assert new_path != path
+    assert Path(new_path).read_bytes() == b'{"text": "New text"}'
+
+
+def test_download_is_resumed(server, cache_dir, monkeypatch):
+    content = bytes(range(256)) * 1000
+    server.files["/data.bin"] = content
+    server.cut = 100000
+    monkeypatch.setattr(fetcher, "DOWNLOAD_RETRIES", 0)
+
+    with raises(requests.exceptions.ChunkedEncodingError):
+        fetcher.download(f"{server.url}/data.bin")
+
+    path = fetcher.download(f"{server.url}/data.bin")
+    assert Path(path).read_bytes() == content
+    assert server.requests[-1]["Range"] == f"bytes={fetcher.CHUNK_SIZE}-"
+
+    # Within a download, the interrupted responses are resumed too
+    server.files["/other.bin"] = content
+    server.cut = 100000
+    monkeypatch.setattr(fetcher, "DOWNLOAD_RETRIES", 1)
+    path = fetcher.download(f"{server.url}/other.bin")
+    assert Path(path).read_bytes() == content
+
+
+def test_download_checksum(server, cache_dir):
+    content = b"Some text."
+    digest = hashlib.sha256(content).hexdigest()
+    server.files["/text.txt"] = content
+
+    with raises(InvalidResourceError):
+        fetcher.download(f"{server.url}/text.txt", f"sha256:{'0' * 64}")
+
+    path = handle_uri(f"{server.url}/text.txt#sha256={digest}")
+    assert Path(path).read_bytes() == content
+
+    # The content is known by its sha256, other checksums revalidate the cached download
+    count = len(server.requests)
+    md5 = hashlib.md5(content).hexdigest()
+    assert fetcher.download(f"{server.url}/text.txt", f"sha256:{digest}") == path
+    assert fetcher.download(f"{server.url}/text.txt", f"md5:{md5}") == path
+    assert len(server.requests) == count + 1
+
+
+def test_download_without_cache(server, monkeypatch):
+    monkeypatch.setattr(fetcher, "get_cache_dir", lambda: None)
+    server.files["/data.json"] = b"[]"
+
+    first = fetcher.download(f"{server.url}/data.json")
+    second = fetcher.download(f"{server.url}/data.json")
+    assert first != second
+    assert Path(first).name == Path(second).name == "data.json"
@@ -0,0 +1,62 @@
+import json
+
+from pytest import fixture
+
+from muse.data_importer import fetcher, handle_uri, import_data, resolve_resource
+
+
+@fixture
+def json_path(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text(
+        json.dumps(
+            {"data": [{"text": "Some text.", "summary": "A summary."}]}, indent=2
+        )
+    )
+    return str(path)
+
+
+@fixture
+def source_path(tmp_path):
+    (tmp_path / "pair.source").write_text("First text.\nSecond text.")
+    (tmp_path / "pair.target").write_text("First summary.\nSecond summary.")
+    return str(tmp_path / "pair.source")
+
+
+@fixture
+def extract_calls(monkeypatch):
+    calls = []
+    extract = fetcher.extract
+
+    def counting_extract(file_path):
+        calls.append(file_path)
+        return extract(file_path)
+
+    monkeypatch.setattr(fetcher, "extract", counting_extract)
+    return calls
+
+
+def test_resource_is_sniffed_once(json_path):
+    resource = resolve_resource(json_path)
+    assert resource == json_path
+    assert resource.uri == json_path
+    assert resource.resource_type == "json"
+    assert resource.text_start().startswith("{")
+    assert handle_uri(resource) is resource
+    assert resolve_resource(resource) is resource
+
+
+def test_import_data_resolves_once(json_path, extract_calls):
+    documents = import_data(json_path, "document", "en")
+    assert len(documents) == 1
+    assert documents[0].summary == "A summary."
+    assert extract_calls == [json_path]
+
+
+def test_import_single_source_file(source_path, extract_calls):
+    documents = import_data(source_path, "document", "en")
+    assert [document.summary for document in documents] == [
+        "First summary.",
+        "Second summary.",
+    ]
+    assert extract_calls == [source_path]
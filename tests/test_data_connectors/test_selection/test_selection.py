@@ -0,0 +1,83 @@
+import numpy as np
+from pytest import raises
+
+from muse.data_importer.selection import Selection
+
+
+def test_keep_mask_matches_keeps():
+    selection = Selection(
+        {"sample_fraction": 0.3, "sample_seed": 7, "num_shards": 3, "shard_index": 2}
+    )
+    mask = selection.keep_mask(1000, 5000)
+    assert list(np.flatnonzero(mask) + 1000) == [
+        i for i in range(1000, 6000) if selection.keeps(i)
+    ]
+
+
+def test_sample_is_deterministic():
+    small = Selection({"sample_fraction": 0.01})
+    large = Selection({"sample_fraction": 0.1})
+    sample = [i for i in range(100000) if small.keeps(i)]
+    again = Selection({"sample_fraction": 0.01})
+    assert sample == [i for i in range(100000) if again.keeps(i)]
+    assert 900 < len(sample) < 1100
+    assert all(large.keeps(i) for i in sample)
+
+    other = Selection({"sample_fraction": 0.01, "sample_seed": 1})
+    assert sample != [i for i in range(100000) if other.keeps(i)]
+
+
+def test_shards_split_the_records():
+    shards = [Selection({"num_shards": 3, "shard_index": i}) for i in range(3)]
+    records = list(range(10))
+    selected = [list(shard.select(records)) for shard in shards]
+    assert selected == [[0, 3, 6, 9], [1, 4, 7], [2, 5, 8]]
+
+
+def test_select_by_metadata_offset_and_limit():
+    records = [{"id": i, "lang": "en" if i % 2 else "fr"} for i in range(20)]
+    selection = Selection(
+        {
+            "metadata_filter": {"lang": ["fr"], "id": {"min": 4}},
+            "offset": 1,
+            "limit": 3,
+        }
+    )
+    selected = selection.select(iter(records), lambda r: r)
+    assert [r["id"] for r in selected] == [6, 8, 10]
+
+    assert Selection({"metadata_filter": {"lang": "en"}}).matches({"lang": "en"})
+    assert not Selection({"metadata_filter": {"lang": "en"}}).matches({})
+    assert not Selection({"metadata_filter": {"id": {"max": 3}}}).matches({})
+
+
+def test_select_stops_at_the_limit():
+    read = []
+
+    def records():
+        for i in range(100):
+            read.append(i)
+            yield i
+
+    assert list(Selection({"limit": 3}).select(records())) == [0, 1, 2]
+    assert read == [0, 1, 2]
+    assert list(Selection({"limit": 0}).select(records())) == []
+
+
+def test_blocks():
+    selection = Selection({"num_shards": 2, "shard_index": 1})
+    assert [list(b) for b in selection.blocks(5, 6)] == [[0, 2, 4]]
+    assert [list(b) for b in Selection().blocks(0, 3)] == [[0, 1, 2]]
+
+
+def test_invalid_selection():
+    for options in [
+        {"limit": -1},
+        {"offset": -1},
+        {"sample_fraction": 1.5},
+        {"num_shards": 0},
+        {"num_shards": 2, "shard_index": 2},
+        {"metadata_filter": {"id": {"from": 1}}},
+    ]:
+        with raises(ValueError):
+            Selection(options)
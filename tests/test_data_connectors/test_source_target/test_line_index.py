@@ -0,0 +1,55 @@
+import os
+
+from pytest import fixture, raises
+
+from muse.data_importer.source_target.line_index import LineIndex
+
+
+@fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("MUSE_CACHE", str(tmp_path / "cache"))
+    return tmp_path / "cache"
+
+
+def test_records_like_split(tmp_path, cache_dir):
+    path = tmp_path / "test.source"
+    for text in ["", "one", "one\ntwo", "one\n\ntwo\n", "\n"]:
+        path.write_text(text)
+        with LineIndex(path) as index:
+            assert list(index) == text.split("\n")
+            assert len(index) == len(text.split("\n"))
+
+    path.write_text("one#two##three")
+    with LineIndex(path, "#") as index:
+        assert list(index) == ["one", "two", "", "three"]
+
+
+def test_random_access(tmp_path, cache_dir):
+    path = tmp_path / "test.source"
+    path.write_bytes("first\r\nsécond\r\nthird".encode("utf-8"))
+    with LineIndex(path) as index:
+        assert index[1] == "sécond"
+        assert index[-1] == "third"
+        assert index[0] == "first"
+        with raises(IndexError):
+            index[3]
+
+
+def test_persisted_index(tmp_path, cache_dir):
+    path = tmp_path / "test.source"
+    path.write_text("one\ntwo\nthree")
+    with LineIndex(path) as index:
+        assert len(index) == 3
+    index_files = list((cache_dir / "line_index").iterdir())
+    assert len(index_files) == 1
+
+    with LineIndex(path) as index:
+        assert list(index) == ["one", "two", "three"]
+    assert list((cache_dir / "line_index").iterdir()) == index_files
+
+    # A modified file gets a new index
+    path.write_text("one\ntwo\nthree\nfour")
+    os.utime(path, ns=(0, 0))
+    with LineIndex(path) as index:
+        assert list(index) == ["one", "two", "three", "four"]
+    assert len(list((cache_dir / "line_index").iterdir())) == 2
@@ -1,8 +1,9 @@
 import os
 
-from pytest import fixture
+from pytest import fixture, raises
 
-from muse.data_importer import import_data
+from muse.data_importer import import_data, iter_data
+from muse.utils.resource_errors import InvalidResourceError
 
 
 @fixture
@@ -21,3 +22,53 @@ def test_import_document_source_target(document_path):
                 "A large void was temporarily plugged with granite"
             )
             assert doc.summary.startswith("Work to repair a sea wall")
+
+
+def test_iter_source_target_lines(tmp_path):
+    (tmp_path / "test.source").write_text("First text\nSecond text\n")
+    (tmp_path / "test.target").write_text("First summary\nSecond summary\n")
+
+    documents = iter_data(str(tmp_path), "document", "en")
+    assert next(documents).summary == "First summary"
+    assert [(d.text, d.summary) for d in documents] == [
+        ("Second text", "Second summary"),
+        ("", ""),
+    ]
+    assert len(import_data(str(tmp_path), "document", "en")) == 3
+
+
+def test_iter_source_target_mismatch(tmp_path):
+    (tmp_path / "test.source").write_text("First text\nSecond text")
+    (tmp_path / "test.target").write_text("First summary")
+
+    with raises(InvalidResourceError) as error:
+        list(iter_data(str(tmp_path), "document", "en"))
+    assert error.value.resource == str(tmp_path / "test.source")
+
+
+def test_iter_source_target_selection(tmp_path):
+    from muse.data_importer.selection import Selection
+
+    for name in ["a", "b"]:
+        (tmp_path / f"{name}.source").write_text(
+            "\n".join(f"Text {name}{i}" for i in range(50))
+        )
+        (tmp_path / f"{name}.target").write_text(
+            "\n".join(f"Summary {name}{i}" for i in range(50))
+        )
+
+    def texts(options):
+        return [d.text for d in iter_data(str(tmp_path), "document", "en", options)]
+
+    assert texts({"offset": 48, "limit": 3}) == ["Text a48", "Text a49", "Text b0"]
+    assert texts({"num_shards": 40, "shard_index": 5}) == [
+        "Text a5",
+        "Text a45",
+        "Text b35",
+    ]
+    sample = Selection({"sample_fraction": 0.1})
+    assert texts({"sample_fraction": 0.1}) == [
+        f"Text {'ab'[i // 50]}{i % 50}" for i in range(100) if sample.keeps(i)
+    ]
+    options = {"metadata_filter": {"resource_name": ["b.source-7", "a.source-3"]}}
+    assert texts(options) == ["Text a3", "Text b7"]
@@ -0,0 +1,106 @@
+import copy
+import gc
+import pickle
+import weakref
+
+import pytest
+
+from muse.data_manager import Conversation, Document, MultiDocument, TextUnit
+
+
+def conversation():
+    return Conversation(
+        [TextUnit("Hello", "Alice"), TextUnit("Hi", "Bob")], "Greetings", {"id": 1}
+    )
+
+
+def test_text_is_cached():
+    data = conversation()
+    assert str(data) == "Alice: Hello\nBob: Hi"
+    assert str(data) is str(data)
+
+
+def test_changes_clear_the_cached_text():
+    data = conversation()
+    str(data)
+
+    data.text_units[0].text = "Hey"
+    assert str(data) == "Alice: Hey\nBob: Hi"
+    data.text_units.append(TextUnit("Bye", "Carol"))
+    assert str(data) == "Alice: Hey\nBob: Hi\nCarol: Bye"
+    data.text_units[2].speaker = "Dan"
+    assert str(data) == "Alice: Hey\nBob: Hi\nDan: Bye"
+    del data.text_units[0]
+    assert str(data) == "Bob: Hi\nDan: Bye"
+    data.text_units = [TextUnit("Alone", "Eve")]
+    assert str(data) == "Eve: Alone"
+
+    documents = MultiDocument([Document("One"), Document("Two")])
+    assert str(documents) == "One\nTwo"
+    documents.documents[1].text = "Three"
+    assert str(documents) == "One\nThree"
+
+
+def test_speakers_are_interned():
+    speaker = "".join(["Ali", "ce"])
+    assert TextUnit("Hello", speaker).speaker is TextUnit("Hi", "Alice").speaker
+
+
+def test_slots():
+    with pytest.raises(AttributeError):
+        Document("Text").title = "Title"
+
+
+def test_copy_and_pickle():
+    data = conversation()
+    str(data)
+    for other in (pickle.loads(pickle.dumps(data)), copy.deepcopy(data)):
+        assert str(other) == str(data)
+        assert other.summary == "Greetings" and other.metadata == {"id": 1}
+        other.text_units[0].text = "Hey"
+        assert str(other) == "Alice: Hey\nBob: Hi"
+    assert str(data) == "Alice: Hello\nBob: Hi"
+
+
+def test_parts_do_not_keep_their_owners():
+    gc.disable()
+    try:
+        data = conversation()
+        documents = MultiDocument([Document("One"), Document("Two")])
+        units, parts = data.text_units, documents.documents[0]
+        references = [weakref.ref(data), weakref.ref(documents)]
+        str(data), str(documents)
+
+        # Freed as soon as they are no longer referenced, without a collection
+        del data, documents
+        assert [reference() for reference in references] == [None, None]
+    finally:
+        gc.enable()
+
+    # Their parts can still be changed
+    units[0].text = "Hey"
+    units.append(TextUnit("Bye", "Carol"))
+    parts.text = "Three"
+    assert str(parts) == "Three"
+
+    # And their dead owners are dropped when they are owned again
+    owner = MultiDocument([parts])
+    assert [reference() for reference in parts._owners] == [owner]
+
+
+def test_parts_are_copied():
+    documents = [Document("One")]
+    data = MultiDocument(documents)
+    str(data)
+
+    # The list given is not followed, the changes are made through the object
+    documents.append(Document("Two"))
+    assert len(data.documents) == 1 and str(data) == "One"
+    data.documents.append(Document("Two"))
+    assert str(data) == "One\nTwo"
+    assert len(documents) == 2 and data.documents is not documents
+
+    units = [TextUnit("Hello", "Alice")]
+    conversation = Conversation(units)
+    units.append(TextUnit("Hi", "Bob"))
+    assert str(conversation) == "Alice: Hello"
@@ -0,0 +1,105 @@
+from muse.data_manager import Document
+from muse.evaluation.cache import MetricCache, evaluation_identity
+from muse.evaluation.evaluation import Evaluation
+from muse.muse import Muse
+from muse.summarizer.summarizer import Summarizer
+
+
+class CountingMetric(Evaluation):
+    per_item = True
+
+    def __init__(self, options):
+        self.evaluated = 0
+
+    def evaluate(self, summary, reference_text=None, reference_summary=None):
+        items = self.evaluate_items(summary, reference_text, reference_summary)
+        return self.aggregate(items)
+
+    def evaluate_items(self, summary, reference_text=None, reference_summary=None):
+        self.evaluated += len(summary)
+        return [
+            {"overlap": len(set(s.split()) & set(rs.split()))}
+            for s, rs in zip(summary, reference_summary)
+        ]
+
+    def aggregate(self, items):
+        return {"overlap": [item["overlap"] for item in items]}
+
+
+class CorpusMetric(CountingMetric):
+    per_item = False
+
+
+class FirstSentence(Summarizer):
+    def __init__(self, options):
+        pass
+
+    def summarize(self, texts):
+        return [text.text.split(".")[0] for text in texts]
+
+
+def test_evaluation_identity():
+    assert evaluation_identity(CountingMetric({}), {"avg": True}) == {
+        "evaluation": f"{__name__}.CountingMetric",
+        "options": {"avg": True},
+    }
+
+
+def test_only_missing_items_are_evaluated(tmp_path):
+    cache = MetricCache(tmp_path / "metrics.sqlite")
+    metric = CountingMetric({})
+    summary = ["a b", "a", "c d e"]
+    reference_summary = ["a b c", "b", "c d"]
+
+    results, stats = cache.evaluate(
+        metric, {}, summary[1:], reference_summary=reference_summary[1:]
+    )
+    assert results == {"overlap": [0, 2]}
+    assert stats == {"hits": 0, "misses": 2, "evicted": 0}
+
+    results, stats = cache.evaluate(
+        metric, {}, summary, reference_summary=reference_summary
+    )
+    assert metric.evaluated == 3
+    assert results == {"overlap": [2, 0, 2]}
+    assert stats == {"hits": 2, "misses": 1, "evicted": 0}
+
+    # The options of the metric are part of the key
+    _, stats = cache.evaluate(
+        metric, {"avg": True}, summary, reference_summary=reference_summary
+    )
+    assert stats["misses"] == 3
+
+
+def test_not_per_item_is_not_cached(tmp_path):
+    cache = MetricCache(tmp_path / "metrics.sqlite")
+    metric = CorpusMetric({})
+    for _ in range(2):
+        results, stats = cache.evaluate(metric, {}, ["a"], reference_summary=["a"])
+        assert results == {"overlap": [1]}
+        assert stats is None
+    assert metric.evaluated == 2
+    assert len(cache) == 0
+
+
+def test_muse_only_evaluates_new_summaries(monkeypatch, tmp_path):
+    monkeypatch.setenv("MUSE_CACHE", str(tmp_path))
+    data = [Document(f"Document {i}. Text.", f"Document {i}") for i in range(5)]
+
+    muse = Muse({"metric_cache": True})
+    muse.data = data
+    muse.summarizers = [FirstSentence({})]
+    muse.evaluations = [CountingMetric({})]
+    results = muse.run()
+    assert results["FirstSentence"]["CountingMetric"] == {"overlap": [2] * 5}
+
+    muse = Muse({"metric_cache": True})
+    muse.data = data + [Document("Document 5. Text.", "Document 5")]
+    muse.summarizers = [FirstSentence({})]
+    muse.evaluations = [CountingMetric({})]
+    results = muse.run()
+    assert muse.evaluations[0].evaluated == 1
+    assert results["FirstSentence"]["CountingMetric"] == {"overlap": [2] * 6}
+    assert results["FirstSentence"]["metric_cache"] == {
+        "CountingMetric": {"hits": 5, "misses": 1, "evicted": 0}
+    }
@@ -1,6 +1,7 @@
 from muse.evaluation import RougeMetric
 import statistics
 
+
 def test_rouge_metric_single():
     rouge_metric = RougeMetric({})
     summaries = [
@@ -28,10 +29,35 @@ def test_rouge_metric_multi():
         "Boots are shoes that are used for walking. They are comfortable and durable.",
     ]
     result = rouge_metric.evaluate(summaries, reference_summary=summaries)
-    results = [result["rouge_score"][i]["rouge-1"]["r"] for i in range(len(result["rouge_score"]))]
+    results = [
+        result["rouge_score"][i]["rouge-1"]["r"]
+        for i in range(len(result["rouge_score"]))
+    ]
     assert statistics.mean(results) == 1.0
 
     result = rouge_metric.evaluate(summaries, reference_summary=reference_summaries)
-    results = [result["rouge_score"][i]["rouge-1"]["r"] for i in range(len(result["rouge_score"]))]
-    assert 0.6 <  result["rouge_score"][0]["rouge-1"]["r"] < 0.8
+    results = [
+        result["rouge_score"][i]["rouge-1"]["r"]
+        for i in range(len(result["rouge_score"]))
+    ]
+    assert 0.6 < result["rouge_score"][0]["rouge-1"]["r"] < 0.8
+
+
+def test_rouge_metric_running_total():
+    rouge_metric = RougeMetric({"avg": True})
+    summaries = ["Cars are fast.", "Boots are comfortable.", "Trains are long."]
+    reference_summaries = ["Cars are quick.", "Boots are warm.", "Trains are long."]
+    items = rouge_metric.evaluate_items(
+        summaries, reference_summary=reference_summaries
+    )
+
+    total = rouge_metric.accumulate(None, items[:2])
+    total = rouge_metric.accumulate(total, [])
+    total = rouge_metric.accumulate(total, items[2:])
+    assert rouge_metric.aggregate_total(total) == rouge_metric.aggregate(items)
+
+    total = rouge_metric.accumulate(None, items[:1])
+    assert rouge_metric.aggregate_total(total) == rouge_metric.aggregate(items[:1])
 
+    # Each score is needed when they are not averaged
+    assert RougeMetric({}).accumulate(None, items) is None
@@ -0,0 +1,47 @@
+import os
+import sys
+from pathlib import Path
+
+from pytest import mark, raises
+
+from muse.data_manager import Document
+from muse.summarizer import FalconsAI
+from muse.summarizer.abstractive.backend import load_seq2seq_model, onnx_model_dir
+
+
+def test_onnx_model_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv("MUSE_MODELS", str(tmp_path))
+    assert onnx_model_dir("csebuetnlp/mT5_multilingual_XLSum") == Path(
+        tmp_path, "onnx", "csebuetnlp--mT5_multilingual_XLSum"
+    )
+
+
+def test_invalid_backend():
+    with raises(ValueError):
+        load_seq2seq_model("Falconsai/text_summarization", "cpu", "tensorrt")
+
+
+def test_onnx_only_fp32():
+    with raises(ValueError):
+        load_seq2seq_model("Falconsai/text_summarization", "cpu", "onnx", "bf16")
+
+
+def test_onnx_without_optimum(monkeypatch):
+    # A module set to None in sys.modules can not be imported
+    monkeypatch.setitem(sys.modules, "optimum.onnxruntime", None)
+    with raises(ImportError, match="optimum"):
+        load_seq2seq_model("Falconsai/text_summarization", "cpu", "onnx")
+
+
+@mark.skipif(os.getenv("SKIP_INTENSIVE_TESTS") == "true", reason="Skipping long tests")
+def test_onnx_matches_torch(monkeypatch, tmp_path):
+    monkeypatch.setenv("MUSE_MODELS", str(tmp_path))
+    text = Document(
+        """YouTube, which is owned by Google, said 130,000 videos were removed from its platform since last year, when it implemented a ban on content spreading misinformation about Covid vaccines. The new policy covers long-approved vaccines, such as those against measles or hepatitis B."""
+    )
+    torch_summary = FalconsAI({}).summarize([text])
+    onnx_summary = FalconsAI({"backend": "onnx"}).summarize([text])
+    assert onnx_summary == torch_summary
+    assert Path(
+        tmp_path, "onnx", "Falconsai--text_summarization", "encoder_model.onnx"
+    ).is_file()
@@ -0,0 +1,73 @@
+from muse.summarizer.abstractive.batching import (
+    generate_batched,
+    length_buckets,
+    pipeline_batched,
+)
+
+
+class FakeBatch(dict):
+    def to(self, device):
+        return self
+
+
+class FakeTokenizer:
+    pad_id = 0
+
+    def __call__(self, texts, truncation, max_length):
+        return {"input_ids": [[len(w) for w in t.split()][:max_length] for t in texts]}
+
+    def pad(self, encoded, return_tensors):
+        ids = encoded["input_ids"]
+        width = max(len(i) for i in ids)
+        return FakeBatch(
+            input_ids=[i + [self.pad_id] * (width - len(i)) for i in ids],
+            attention_mask=[[1] * len(i) + [0] * (width - len(i)) for i in ids],
+        )
+
+    def batch_decode(self, output_ids, **kwargs):
+        return [" ".join(str(i) for i in ids) for ids in output_ids]
+
+
+class FakeModel:
+    def __init__(self):
+        self.widths = []
+
+    def generate(self, input_ids, attention_mask, **kwargs):
+        self.widths.append(len(input_ids[0]))
+        return [
+            [i for i, m in zip(ids, mask) if m]
+            for ids, mask in zip(input_ids, attention_mask)
+        ]
+
+
+class FakePipeline:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts, batch_size, num_workers, truncation):
+        self.calls.append((texts, batch_size, num_workers, truncation))
+        return [[{"summary_text": text.upper()}] for text in texts]
+
+
+def test_length_buckets():
+    assert length_buckets([3, 1, 4, 1, 5], 2) == [[4, 2], [0, 1], [3]]
+    assert length_buckets([], 4) == []
+    assert length_buckets([2, 2], 0) == [[0], [1]]
+
+
+def test_generate_batched_keeps_order_and_pads_per_batch():
+    texts = ["a bb", "a " * 10, "ccc", "dd dd dd"]
+    model = FakeModel()
+    summaries = generate_batched(
+        model, FakeTokenizer(), texts, "cpu", 2, max_input_length=8
+    )
+    assert summaries == ["1 2", " ".join(["1"] * 8), "3", "2 2 2"]
+    assert model.widths == [8, 2]
+
+
+def test_pipeline_batched_keeps_order_and_sorts_by_length():
+    pipeline = FakePipeline()
+    summaries = pipeline_batched(pipeline, ["bb", "a", "cccc"], 2, num_workers=3)
+    assert summaries == ["BB", "A", "CCCC"]
+    assert pipeline.calls == [(["cccc", "bb", "a"], 2, 3, True)]
+    assert pipeline_batched(pipeline, [], 2) == []
@@ -2,7 +2,8 @@ import os
 
 from pytest import mark
 
-from muse.data_manager import Document
+from muse import data_manager
+from muse.data_manager import Document, TextUnit
 from muse.summarizer import Conversation
 
 
@@ -25,4 +26,17 @@ def test_summarize():
     )
 
 
+def test_input_text_of_conversation():
+    conversation = data_manager.Conversation(
+        [
+            TextUnit("The new policy covers vaccines.", "Richard"),
+            TextUnit("Ok", "Jaime"),
+        ]
+    )
+    assert (
+        Conversation._input_text(conversation)
+        == "Richard: The new policy covers vaccines.\nJaime: Ok"
+    )
+
+
 test_summarize()
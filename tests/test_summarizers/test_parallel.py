@@ -0,0 +1,95 @@
+import pytest
+
+from muse.data_manager import Document
+from muse.muse import Muse, SummarizerSystem
+from muse.summarizer import Sumy
+from muse.summarizer.manifest import registry
+from muse.summarizer.parallel import (
+    ParallelSummarizer,
+    chunk_size_for,
+    summarize_parallel,
+)
+
+
+def test_chunk_size_for():
+    assert chunk_size_for(0, 4) == 1
+    assert chunk_size_for(64, 4) == 2
+    assert chunk_size_for(100000, 4) == 32
+    assert chunk_size_for(10, 0) == 2
+
+
+def test_summarize_parallel_keeps_order():
+    texts = [
+        Document(
+            " ".join(
+                f"Sentence {j} of document {i} is about topic {i}." for j in range(i)
+            )
+        )
+        for i in range(1, 20)
+    ]
+    expected = Sumy({"sentences": 2}).summarize(texts)
+    assert summarize_parallel("sumy", {"sentences": 2}, texts, 3) == expected
+    assert summarize_parallel("sumy", {"sentences": 2}, texts, 2, 1) == expected
+    assert summarize_parallel("sumy", {}, [], 2) == []
+
+
+def test_parallel_summarizers_are_declared():
+    assert registry.parallel("Sumy") and registry.parallel("spacy")
+    assert not registry.parallel("MT5") and not registry.parallel("FalconsAI")
+
+
+def test_workers_only_apply_to_parallel_summarizers():
+    muse = Muse({"workers": 2})
+    muse.add_summarizer(SummarizerSystem("sumy"))
+    summarizer = muse.summarizers[0]
+    assert isinstance(summarizer, ParallelSummarizer)
+    assert summarizer.summarizer_class is Sumy
+    assert "Sumy" in muse._summarizer_params
+
+    # The pool is only started for the duration of a context
+    assert summarizer._executor is None
+    with summarizer:
+        executor = summarizer._executor
+        with summarizer:
+            assert summarizer._executor is executor
+        assert summarizer._executor is executor
+    assert summarizer._executor is None
+
+
+def test_pool_is_kept_across_checkpoints(tmp_path):
+    class RecordingMuse(Muse):
+        def _summarize_data(self, summarizer, data):
+            executors.append(summarizer._executor)
+            return [""] * len(data)
+
+    executors = []
+    muse = RecordingMuse(
+        {"workers": 2, "output": str(tmp_path), "checkpoint_interval": 2}
+    )
+    muse.add_summarizer(SummarizerSystem("sumy"))
+    muse.data = [Document(f"Text {i}.") for i in range(5)]
+    summarizer = muse.summarizers[0]
+    summarizer._identity = {"model": "sumy"}
+
+    assert muse._summarize(summarizer) == [""] * 5
+    assert len(executors) == 3 and executors[0] is not None
+    assert all(executor is executors[0] for executor in executors)
+    assert summarizer._executor is None
+
+
+@pytest.mark.parametrize("mode", ["stream", "pipeline"])
+def test_pool_is_kept_across_chunks(mode):
+    class RecordingMuse(Muse):
+        def _summarize_data(self, summarizer, data):
+            executors.append(summarizer._executor)
+            return [""] * len(data)
+
+    executors = []
+    muse = RecordingMuse({"workers": 2, mode: True, "chunk_size": 2})
+    muse.add_summarizer(SummarizerSystem("sumy"))
+    muse.data = [Document(f"Text {i}.") for i in range(5)]
+    muse.run()
+
+    assert len(executors) == 3 and executors[0] is not None
+    assert all(executor is executors[0] for executor in executors)
+    assert muse.summarizers[0]._executor is None
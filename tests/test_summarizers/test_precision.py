@@ -0,0 +1,31 @@
+import torch
+from pytest import raises
+
+from muse.summarizer.abstractive.precision import apply_precision
+
+
+def _model():
+    return torch.nn.Sequential(torch.nn.Linear(8, 8), torch.nn.ReLU())
+
+
+def test_fp32_is_unchanged():
+    model = _model()
+    assert apply_precision(model, "fp32", "cpu") is model
+
+
+def test_bf16():
+    model = apply_precision(_model(), "bf16", "cpu")
+    assert model[0].weight.dtype == torch.bfloat16
+
+
+def test_int8_dynamic():
+    model = apply_precision(_model(), "int8-dynamic", "cpu")
+    assert isinstance(model[0], torch.ao.nn.quantized.dynamic.Linear)
+    assert model(torch.ones(1, 8)).shape == (1, 8)
+
+
+def test_invalid_precision():
+    with raises(ValueError):
+        apply_precision(_model(), "fp8", "cpu")
+    with raises(ValueError):
+        apply_precision(_model(), "int8-dynamic", "cuda")
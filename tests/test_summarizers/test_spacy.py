@@ -13,3 +13,17 @@ def test_summarize():
         str(summary[0])
         == "This is a long text that needs to be summarized. Maybe we can try to write something a little bit longer. It is very long and boring."
     )
+
+
+def test_summarize_corpus_matches_single():
+    texts = [
+        Document(
+            "The cat sat on the mat. The dog barked at the cat. Nobody saw it. "
+            "The cat ran away from the dog."
+        ),
+        Document(""),
+    ]
+    spacy = Spacy({"batch_size": 2})
+    summaries = spacy.summarize(texts)
+    assert summaries == [spacy._summarize_single(text) for text in texts]
+    assert summaries[1] == ""
@@ -0,0 +1,86 @@
+from muse.data_manager import Document
+from muse.muse import Muse
+from muse.summarizer.cache import SummaryCache, summarizer_identity
+from muse.summarizer.summarizer import Summarizer
+
+
+class CountingSummarizer(Summarizer):
+    def __init__(self, options):
+        self.summarized = 0
+
+    def summarize(self, texts):
+        self.summarized += len(texts)
+        return [text.text.split(".")[0] for text in texts]
+
+
+def test_get_and_put(tmp_path):
+    cache = SummaryCache(tmp_path / "summaries.sqlite")
+    keys = cache.keys({"summarizer": "a"}, ["one", "two"])
+    assert len(set(keys)) == 2
+    assert cache.keys({"summarizer": "b"}, ["one"])[0] != keys[0]
+
+    assert cache.get(keys) == {}
+    assert cache.put({keys[0]: "1"}) == 0
+    assert cache.get(keys) == {keys[0]: "1"}
+
+    # Shared by another connection, as by another process
+    assert SummaryCache(tmp_path / "summaries.sqlite").get(keys) == {keys[0]: "1"}
+
+
+def test_lru_eviction(tmp_path):
+    cache = SummaryCache(tmp_path / "summaries.sqlite", max_size=10)
+    cache.put({"a": "12345"})
+    cache.put({"b": "12345"})
+    cache.get(["a"])
+    assert cache.put({"c": "12345"}) == 1
+    assert set(cache.get(["a", "b", "c"])) == {"a", "c"}
+    assert len(cache) == 2
+
+
+def test_total_size(tmp_path):
+    cache = SummaryCache(tmp_path / "summaries.sqlite", max_size=10)
+    cache.put({"a": "12345", "b": "123"})
+    # Replaced entries only count once, with their new size
+    cache.put({"a": "1234567"})
+    total = "SELECT size FROM total"
+    assert cache._connection.execute(total).fetchone() == (10,)
+    assert cache.put({"c": "1"}) == 1
+    assert cache._connection.execute(total).fetchone() == (8,)
+
+    # The caches created without a total have it summed when opened
+    cache._connection.execute("DROP TABLE total")
+    cache = SummaryCache(tmp_path / "summaries.sqlite", max_size=10)
+    assert cache._connection.execute(total).fetchone() == (8,)
+    cache.clear()
+    assert cache._connection.execute(total).fetchone() == (0,)
+
+
+def test_summarizer_identity():
+    identity = summarizer_identity(CountingSummarizer({}), {"sentences": 2})
+    assert identity == {
+        "summarizer": f"{__name__}.CountingSummarizer",
+        "options": {"sentences": 2},
+    }
+
+
+def test_muse_only_summarizes_new_documents(monkeypatch, tmp_path):
+    monkeypatch.setenv("MUSE_CACHE", str(tmp_path))
+    data = [Document(f"Document {i}. Text.", f"Document {i}") for i in range(10)]
+
+    muse = Muse({"summary_cache": True})
+    muse.data = data
+    muse.summarizers = [CountingSummarizer({})]
+    muse.run()
+    assert muse.summarizers[0].summarized == 10
+
+    muse = Muse({"summary_cache": True})
+    muse.data = data + [Document("Document 10. Text.", "Document 10")]
+    muse.summarizers = [CountingSummarizer({})]
+    results = muse.run()
+    assert muse.summarizers[0].summarized == 1
+    assert muse.summaries["CountingSummarizer"] == [f"Document {i}" for i in range(11)]
+    assert results["CountingSummarizer"]["summary_cache"] == {
+        "hits": 10,
+        "misses": 1,
+        "evicted": 0,
+    }
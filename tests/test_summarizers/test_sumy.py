@@ -1,5 +1,11 @@
+from pytest import raises
+from sumy.nlp.tokenizers import Tokenizer
+from sumy.parsers.plaintext import PlaintextParser
+from sumy.summarizers.lsa import LsaSummarizer
+
 from muse.data_manager import Document
 from muse.summarizer import Sumy
+from muse.summarizer.extractive.sumy_connector import SparseLsaSummarizer
 
 
 def test_summarize():
@@ -10,3 +16,33 @@ def test_summarize():
     sumy = Sumy({})
     summary = sumy.summarize([text])
     assert str(summary[0]) == "Maybe we can try to write something a little bit longer."
+
+
+def test_algorithms():
+    text = Document(
+        "The cat sat on the mat. The dog barked at the cat. Nobody saw the bird. "
+        "The cat ran away from the dog."
+    )
+    for algorithm in ["lsa", "lexrank", "luhn", "textrank"]:
+        sumy = Sumy({"algorithm": algorithm, "sentences": 2, "stem": True})
+        summary = sumy.summarize([text])[0]
+        assert summary.count(".") == 2
+
+
+def test_invalid_algorithm():
+    with raises(ValueError):
+        Sumy({"algorithm": "kl"})
+
+
+def test_sparse_lsa_matches_sumy():
+    document = PlaintextParser.from_string(
+        "The cat sat on the mat. The dog barked at the cat. Nobody saw the bird. "
+        "The cat ran away from the dog. A bird sat on the dog.",
+        Tokenizer("english"),
+    ).document
+    for ratio in [1, 0.5]:
+        LsaSummarizer.REDUCTION_RATIO = ratio
+        try:
+            assert SparseLsaSummarizer()(document, 2) == LsaSummarizer()(document, 2)
+        finally:
+            LsaSummarizer.REDUCTION_RATIO = 1
@@ -0,0 +1,115 @@
+import json
+
+import pytest
+
+from muse.data_manager import Document
+from muse.evaluation.evaluation import Evaluation
+from muse.muse import Muse
+from muse.summarizer.summarizer import Summarizer
+from muse.utils.checkpoint import Checkpoint
+
+
+class FailingSummarizer(Summarizer):
+    def __init__(self, options):
+        self.summarized = 0
+        self.fail_after = None
+
+    def summarize(self, texts):
+        if self.fail_after is not None and self.summarized >= self.fail_after:
+            raise RuntimeError("Interrupted")
+        self.summarized += len(texts)
+        return [text.text.split(".")[0] for text in texts]
+
+
+class WordCount(Evaluation):
+    per_item = True
+
+    def __init__(self, options):
+        self.evaluated = 0
+
+    def evaluate(self, summary, reference_text=None, reference_summary=None):
+        return self.aggregate(self.evaluate_items(summary))
+
+    def evaluate_items(self, summary, reference_text=None, reference_summary=None):
+        self.evaluated += len(summary)
+        return [{"words": len(s.split())} for s in summary]
+
+    def aggregate(self, items):
+        return {"words": sum(item["words"] for item in items)}
+
+
+def test_resume_keeps_matching_prefix(tmp_path):
+    path = tmp_path / "checkpoint.jsonl"
+    with Checkpoint(path, ["a", "b", "c"]) as checkpoint:
+        checkpoint.append(["1", "2"])
+
+    with Checkpoint(path, ["a", "b", "c"], resume=True) as checkpoint:
+        assert checkpoint.values == ["1", "2"]
+        assert checkpoint.remaining == 1
+        with pytest.raises(ValueError):
+            checkpoint.append(["3", "4"])
+
+    with pytest.warns(UserWarning):
+        checkpoint = Checkpoint(path, ["a", "x", "c"], resume=True)
+    assert checkpoint.values == ["1"]
+    checkpoint.close()
+
+    # Not resuming starts the checkpoint over
+    Checkpoint(path, ["a", "b", "c"]).close()
+    assert path.read_text() == ""
+
+
+def test_resume_ignores_partial_line(tmp_path):
+    path = tmp_path / "checkpoint.jsonl"
+    with Checkpoint(path, ["a", "b"]) as checkpoint:
+        checkpoint.append([{"score": 1}])
+    with open(path, "a") as f:
+        f.write('{"key": "b", "val')
+
+    with Checkpoint(path, ["a", "b"], resume=True) as checkpoint:
+        assert checkpoint.values == [{"score": 1}]
+    assert len(path.read_text().splitlines()) == 1
+
+
+def test_muse_resumes_interrupted_run(tmp_path):
+    data = [Document(f"Document {i}. Text.", f"Document {i}") for i in range(10)]
+    options = {"output": str(tmp_path), "checkpoint_interval": 3}
+
+    muse = Muse(options)
+    muse.data = data
+    muse.summarizers = [FailingSummarizer({})]
+    muse.summarizers[0].fail_after = 6
+    muse.evaluations = [WordCount({})]
+    with pytest.raises(RuntimeError):
+        muse.run()
+
+    summaries = tmp_path / "checkpoint" / "summaries.FailingSummarizer.jsonl"
+    assert len(summaries.read_text().splitlines()) == 6
+
+    muse = Muse({**options, "resume": True})
+    muse.data = data
+    muse.summarizers = [FailingSummarizer({})]
+    muse.evaluations = [WordCount({})]
+    results = muse.run()
+    assert muse.summarizers[0].summarized == 4
+    assert muse.summaries["FailingSummarizer"] == [f"Document {i}" for i in range(10)]
+    assert results["FailingSummarizer"]["WordCount"] == {"words": 20}
+
+    # The scores are resumed too, and changed data is computed again
+    muse = Muse({**options, "resume": True})
+    muse.data = data[:9] + [Document("Other document. Text.", "Other document")]
+    muse.summarizers = [FailingSummarizer({})]
+    muse.evaluations = [WordCount({})]
+    with pytest.warns(UserWarning):
+        muse.run()
+    assert muse.summarizers[0].summarized == 1
+    assert muse.evaluations[0].evaluated == 1
+
+    scores = tmp_path / "checkpoint" / "scores.FailingSummarizer.WordCount.jsonl"
+    lines = [json.loads(line) for line in scores.read_text().splitlines()]
+    assert [line["value"] for line in lines] == [{"words": 2}] * 10
+
+
+def test_resume_requires_output():
+    with pytest.raises(ValueError):
+        Muse({"resume": True})
@@ -0,0 +1,138 @@
+import threading
+import time
+
+import pytest
+
+from muse.data_manager import Document
+from muse.evaluation.evaluation import Evaluation
+from muse.muse import Muse
+from muse.summarizer.summarizer import Summarizer
+from muse.utils.pipeline import DONE, Pipeline
+
+
+class FirstSentence(Summarizer):
+    def __init__(self, options):
+        pass
+
+    def summarize(self, texts):
+        time.sleep(0.01)
+        return [text.text.split(".")[0] for text in texts]
+
+
+class LastSentence(FirstSentence):
+    def summarize(self, texts):
+        return [text.text.rstrip(".").split(". ")[-1] for text in texts]
+
+
+class WordCount(Evaluation):
+    per_item = True
+
+    def __init__(self, options):
+        pass
+
+    def evaluate(self, summary, reference_text=None, reference_summary=None):
+        return self.aggregate(self.evaluate_items(summary))
+
+    def evaluate_items(self, summary, reference_text=None, reference_summary=None):
+        return [{"words": len(s.split())} for s in summary]
+
+    def aggregate(self, items):
+        return {"words": [item["words"] for item in items]}
+
+
+def test_pipeline_reports_stages():
+    pipeline = Pipeline(queue_size=1)
+    numbers = pipeline.queue()
+    squares = []
+
+    def produce(stage):
+        for i in range(5):
+            stage.put(numbers, i)
+        stage.put(numbers, DONE)
+
+    def consume(stage):
+        while (i := stage.get(numbers)) is not DONE:
+            with stage.work():
+                time.sleep(0.01)
+                squares.append(i * i)
+
+    pipeline.stage("produce", produce)
+    pipeline.stage("consume", consume)
+    pipeline.run()
+
+    assert squares == [0, 1, 4, 9, 16]
+    report = pipeline.report()
+    # The producer waits on the slow consumer, which does all the work
+    assert report["produce"]["blocked"] > 0
+    assert report["consume"]["busy"] >= 0.05
+    assert 0 < report["consume"]["utilization"] <= 1
+
+
+def test_pipeline_stops_on_error():
+    pipeline = Pipeline(queue_size=1)
+    items = pipeline.queue()
+
+    def produce(stage):
+        while True:
+            stage.put(items, 1)
+
+    def fail(stage):
+        stage.get(items)
+        raise RuntimeError("Failed")
+
+    pipeline.stage("produce", produce)
+    pipeline.stage("fail", fail)
+    with pytest.raises(RuntimeError, match="Failed"):
+        pipeline.run()
+
+
+def test_muse_pipeline_matches_run():
+    data = [
+        Document(f"Document {i}. Text number {i}.", f"Document {i}") for i in range(23)
+    ]
+
+    muse = Muse()
+    muse.data = data
+    muse.summarizers = [FirstSentence({}), LastSentence({})]
+    muse.evaluations = [WordCount({})]
+    expected = muse.run()
+    expected_summaries = muse.summaries
+
+    muse = Muse({"pipeline": True, "chunk_size": 5, "metric_workers": 3})
+    muse.data = data
+    muse.summarizers = [FirstSentence({}), LastSentence({})]
+    muse.evaluations = [WordCount({})]
+    results = muse.run()
+
+    assert muse.summaries == expected_summaries
+    for name in ("FirstSentence", "LastSentence"):
+        report = results[name].pop("pipeline")
+        assert set(report) == {"read", "summarize", "evaluate"}
+        assert results[name] == expected[name]
+
+
+def test_muse_pipeline_evaluates_each_metric_in_one_thread():
+    class Exclusive(WordCount):
+        def __init__(self, options):
+            self.running = 0
+            self.overlaps = 0
+            self.lock = threading.Lock()
+
+        def evaluate_items(self, summary, reference_text=None, reference_summary=None):
+            with self.lock:
+                self.running += 1
+                self.overlaps += self.running > 1
+            time.sleep(0.01)
+            with self.lock:
+                self.running -= 1
+            return super().evaluate_items(summary)
+
+    data = [Document(f"Document {i}. Text.", f"Document {i}") for i in range(20)]
+    muse = Muse({"pipeline": True, "chunk_size": 2, "metric_workers": 4})
+    muse.data = data
+    muse.summarizers = [FirstSentence({}), LastSentence({})]
+    muse.evaluations = [Exclusive({})]
+    results = muse.run()
+
+    assert muse.evaluations[0].overlaps == 0
+    assert results["FirstSentence"]["Exclusive"] == {"words": [2] * 20}
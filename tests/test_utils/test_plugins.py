@@ -0,0 +1,80 @@
+import sys
+
+from pytest import fixture
+
+from muse.summarizer import Summarizer
+from muse.utils.plugins import (
+    clear_plugin_cache,
+    get_plugin_discovery_report,
+    import_from_plugin,
+)
+from muse.utils.registry import Registry
+
+PLUGIN = """
+from muse.summarizer import Summarizer
+from muse.utils.decorators import with_valid_options
+
+
+class CachedSummarizer(Summarizer):
+    @with_valid_options(length={"type": int, "default": 2, "help": "The length"})
+    def __init__(self, options):
+        self.options = options
+
+    def summarize(self, texts):
+        return ["plugin" for _ in texts]
+"""
+
+MODULE = "muse.plugins.cached_summarizers.cached"
+
+
+@fixture
+def plugins_dir(tmp_path, monkeypatch):
+    plugins = tmp_path / "plugins"
+    (plugins / "cached_summarizers").mkdir(parents=True)
+    (plugins / "cached_summarizers" / "cached.py").write_text(PLUGIN)
+    monkeypatch.setenv("MUSE_PLUGINS", str(plugins))
+    monkeypatch.setenv("MUSE_CACHE", str(tmp_path / "cache"))
+    yield plugins
+    sys.modules.pop(MODULE, None)
+
+
+def _discover():
+    registry = Registry(Summarizer)
+    import_from_plugin("cached_summarizers", Summarizer, registry=registry)
+    return registry, get_plugin_discovery_report()[-1]
+
+
+def test_plugins_are_executed_once(plugins_dir):
+    registry, report = _discover()
+    assert report["status"] == "miss"
+    assert report["classes"] == ["CachedSummarizer"]
+    assert MODULE in sys.modules
+
+    sys.modules.pop(MODULE)
+    registry, report = _discover()
+    assert report["status"] == "hit"
+    assert MODULE not in sys.modules
+    assert registry.describe()[0][0] == "CachedSummarizer"
+    assert registry.describe()[0][1]["length"]["type"] is int
+
+    summarizer = registry.get("cachedsummarizer")
+    assert MODULE in sys.modules
+    assert summarizer.plugin
+    assert summarizer({}).summarize(["text"]) == ["plugin"]
+
+
+def test_changed_plugins_are_rediscovered(plugins_dir):
+    _discover()
+    sys.modules.pop(MODULE)
+
+    plugin = plugins_dir / "cached_summarizers" / "cached.py"
+    plugin.write_text(PLUGIN.replace("CachedSummarizer", "RenamedSummarizer"))
+    registry, report = _discover()
+    assert report["status"] == "miss"
+    assert report["classes"] == ["RenamedSummarizer"]
+    assert "RenamedSummarizer" in registry.names()
+
+    sys.modules.pop(MODULE)
+    clear_plugin_cache()
+    _, report = _discover()
+    assert report["status"] == "miss"
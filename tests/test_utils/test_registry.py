@@ -0,0 +1,65 @@
+import subprocess
+import sys
+
+from pytest import fixture, raises
+
+from muse.summarizer import Summarizer
+from muse.utils.registry import Registry
+
+
+@fixture
+def lazy_module(tmp_path, monkeypatch):
+    (tmp_path / "lazy_summarizer.py").write_text(
+        "from muse.summarizer import Summarizer\n"
+        "\n"
+        "class LazySummarizer(Summarizer):\n"
+        "    def __init__(self, options):\n"
+        "        self.options = options\n"
+        "\n"
+        "    def summarize(self, texts):\n"
+        "        return [str(text) for text in texts]\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "lazy_summarizer"
+    sys.modules.pop("lazy_summarizer", None)
+
+
+def test_declared_components_are_loaded_on_demand(lazy_module):
+    registry = Registry(Summarizer)
+    registry.declare(
+        "LazySummarizer",
+        lazy_module,
+        length={"type": int, "default": 1, "help": "The length"},
+    )
+
+    assert "LazySummarizer" in registry.names()
+    assert ("LazySummarizer", registry.options("LazySummarizer")) in registry.describe()
+    assert lazy_module not in sys.modules
+
+    summarizer = registry.get("lazysummarizer")
+    assert summarizer.__name__ == "LazySummarizer"
+    assert lazy_module in sys.modules
+    assert registry.names().count("LazySummarizer") == 1
+
+
+def test_unknown_component():
+    registry = Registry(Summarizer)
+    assert registry.get("unknown") is None
+    with raises(AttributeError):
+        registry.load("unknown")
+
+
+def test_import_muse_does_not_import_backends():
+    code = (
+        "import sys\n"
+        "import muse\n"
+        "from muse.muse import SummarizerSystem, EvaluationSystem\n"
+        "assert 'mt5' in [s.value for s in SummarizerSystem]\n"
+        "assert 'rougemetric' in [e.value for e in EvaluationSystem]\n"
+        "heavy = ['torch', 'transformers', 'spacy', 'sentence_transformers', 'ollama']\n"
+        "print(','.join(m for m in heavy if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
@@ -0,0 +1,127 @@
+import json
+
+import pytest
+
+from muse.data_manager import Document
+from muse.evaluation.evaluation import Evaluation
+from muse.muse import Muse, _ChunkResults
+from muse.summarizer.summarizer import Summarizer
+
+
+class FirstSentence(Summarizer):
+    def __init__(self, options):
+        self.batches = []
+
+    def summarize(self, texts):
+        self.batches.append(len(texts))
+        return [text.text.split(".")[0] for text in texts]
+
+
+class WordCount(Evaluation):
+    per_item = True
+
+    def __init__(self, options):
+        pass
+
+    def evaluate(self, summary, reference_text=None, reference_summary=None):
+        return self.aggregate(self.evaluate_items(summary))
+
+    def evaluate_items(self, summary, reference_text=None, reference_summary=None):
+        return [{"words": len(s.split())} for s in summary]
+
+    def aggregate(self, items):
+        return {"words": sum(item["words"] for item in items)}
+
+
+class WordTotal(WordCount):
+    def accumulate(self, total, items):
+        return {
+            "words": (total or {"words": 0})["words"] + self.aggregate(items)["words"]
+        }
+
+    def aggregate_total(self, total):
+        return total
+
+
+class SummaryCount(WordCount):
+    per_item = False
+
+    def evaluate(self, summary, reference_text=None, reference_summary=None):
+        return {"summaries": len(summary)}
+
+
+def documents(n, read):
+    for i in range(n):
+        read.append(i)
+        yield Document(f"Document number {i}. Text.", f"Document number {i}")
+
+
+def test_stream_matches_run(tmp_path):
+    muse = Muse()
+    muse.data = list(documents(25, []))
+    muse.summarizers = [FirstSentence({})]
+    muse.evaluations = [WordCount({}), SummaryCount({})]
+    expected = muse.run()
+
+    read = []
+    muse = Muse({"stream": True, "chunk_size": 10, "output": str(tmp_path)})
+    muse.data = documents(25, read)
+    muse.summarizers = [FirstSentence({})]
+    muse.evaluations = [WordCount({}), SummaryCount({})]
+    with pytest.warns(UserWarning):
+        results = muse.run()
+
+    assert results == expected
+    assert muse.summarizers[0].batches == [10, 10, 5]
+    assert muse.summaries == {}
+
+    lines = (tmp_path / "summaries.FirstSentence.jsonl").read_text().splitlines()
+    assert [json.loads(line) for line in lines] == [
+        f"Document number {i}" for i in range(25)
+    ]
+
+
+def test_stream_reads_data_by_chunk():
+    read = []
+
+    class Tracking(FirstSentence):
+        def summarize(self, texts):
+            # Only the documents of the chunk being summarized have been read
+            assert len(read) <= sum(self.batches) + len(texts)
+            return super().summarize(texts)
+
+    muse = Muse({"stream": True, "chunk_size": 4})
+    muse.data = documents(10, read)
+    muse.summarizers = [Tracking({})]
+    muse.evaluations = [WordCount({})]
+    assert muse.run() == {"Tracking": {"WordCount": {"words": 30}}}
+
+
+def test_stream_rejects_resume(tmp_path):
+    with pytest.raises(ValueError):
+        Muse({"stream": True, "resume": True, "output": str(tmp_path)})
+
+
+def test_stream_keeps_running_totals():
+    muse = Muse({"stream": True, "chunk_size": 10})
+    muse.data = documents(25, [])
+    muse.summarizers = [FirstSentence({})]
+    muse.evaluations = [WordTotal({})]
+    assert muse.run() == {"FirstSentence": {"WordTotal": {"words": 75}}}
+
+    # The chunks are added to the totals in order, and their items are not kept
+    results = _ChunkResults()
+    key = ("FirstSentence", "WordTotal")
+    results.add_items(key, WordTotal({}), 1, [{"words": 2}])
+    assert key not in results.totals
+    results.add_items(key, WordTotal({}), 0, [{"words": 3}, {"words": 1}])
+    results.add_items(key, WordTotal({}), 2, [])
+    assert results.totals[key] == {"words": 6} and results.counts[key] == 3
+    assert key not in results.items
+
+    # Unless the metric needs each of them
+    key = ("FirstSentence", "WordCount")
+    results.add_items(key, WordCount({}), 1, [{"words": 2}])
+    results.add_items(key, WordCount({}), 0, [{"words": 3}])
+    assert results.items[key] == {0: [{"words": 3}], 1: [{"words": 2}]}
+    assert key not in results.totals